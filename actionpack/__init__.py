@@ -1,12 +1,28 @@
-from actionpack.action import Action
-from actionpack.procedure import Procedure
-from actionpack.procedure import KeyedProcedure
-from actionpack.action import partialaction
+from importlib import import_module
 
 
+_lazy_attributes = {
+    'Action': 'actionpack.action',
+    'Procedure': 'actionpack.procedure',
+    'KeyedProcedure': 'actionpack.procedure',
+    'partialaction': 'actionpack.action',
+}
+
 __all__ = [
     'Action',
     'Procedure',
     'KeyedProcedure',
     'partialaction'
 ]
+
+
+def __getattr__(name: str):
+    if name not in _lazy_attributes:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    attribute = getattr(import_module(_lazy_attributes[name]), name)
+    globals()[name] = attribute
+    return attribute
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,21 +1,42 @@
 from __future__ import annotations
+
+import math
+
+from array import array
+from contextlib import contextmanager
+from contextlib import nullcontext
+from enum import Enum
 from functools import partialmethod
+from importlib import import_module
+from importlib.util import find_spec
 from oslash import Left
 from oslash import Right
 from oslash.either import Either
 from string import Template
-from subprocess import PIPE
-from subprocess import run
-from sys import executable as python
 from threading import RLock
+from threading import local
+from time import perf_counter_ns
+from types import ModuleType
+from typing import Awaitable
 from typing import Callable
+from typing import ContextManager
+from typing import Dict
 from typing import Generic
+from typing import Iterable
+from typing import Iterator
+from typing import List
 from typing import Optional
+from typing import TYPE_CHECKING
 from typing import TypeVar
 from typing import Union
 
+from actionpack.utils import LockStripe
+from actionpack.utils import isawaitable
 from actionpack.utils import microsecond_timestamp
-from actionpack.utils import synchronized
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    from concurrent.futures import Future
 
 
 Outcome = TypeVar('Outcome')
@@ -25,24 +46,31 @@ ResultValue = Union[Outcome, Exception]
 T = TypeVar('T')
 V = TypeVar('V')
 
+_performing = local()
+
 
 class Result(Generic[Outcome]):
 
-    _immutables = ('successful', 'produced_at', 'value',)
+    __slots__ = ('successful', 'started_at', 'produced_at', 'duration', 'value')
+
+    _immutables = ('successful', 'started_at', 'produced_at', 'duration', 'value',)
 
     def __init__(
         self,
         outcome: Either,
-        timestamp_provider: Callable[[], int] = microsecond_timestamp
+        timestamp_provider: Callable[[], int] = microsecond_timestamp,
+        started_at: Optional[int] = None,
+        duration: Optional[int] = None
     ):
-        self.value: Optional[ResultValue[Outcome]] = None
-        if type(outcome) in [Left, Right]:
-            self.value = outcome.value
-            self.successful = True if isinstance(outcome, Right) else False
-        else:
+        if type(outcome) not in (Left, Right):
             raise self.OutcomeMustBeOfTypeEither
 
-        self.produced_at = timestamp_provider()
+        initialize = object.__setattr__
+        initialize(self, 'value', outcome.value)
+        initialize(self, 'successful', type(outcome) is Right)
+        initialize(self, 'started_at', started_at)
+        initialize(self, 'produced_at', timestamp_provider())
+        initialize(self, 'duration', duration)  # nanoseconds, from a monotonic clock
 
     def __repr__(self):
         outcome = 'success' if self.successful else 'failure'
@@ -64,6 +92,80 @@ class Result(Generic[Outcome]):
         pass
 
 
+class ResultBatch(Generic[Outcome]):
+
+    unmeasured = -1
+
+    def __init__(self, results: Iterable[Result[Outcome]] = (), keep_values: bool = True):
+        self.keep_values = keep_values
+        self.successes = array('b')
+        self.started_at = array('q')
+        self.produced_at = array('q')
+        self.durations = array('q')
+        self.values: List[ResultValue[Outcome]] = []
+        self.extend(results)
+
+    def append(self, result: Result[Outcome]) -> ResultBatch[Outcome]:
+        unmeasured = self.unmeasured
+        self.successes.append(result.successful)
+        self.started_at.append(unmeasured if result.started_at is None else int(result.started_at))
+        self.produced_at.append(int(result.produced_at))
+        self.durations.append(unmeasured if result.duration is None else result.duration)
+        if self.keep_values:
+            self.values.append(result.value)
+        return self
+
+    def extend(self, results: Iterable[Result[Outcome]]) -> ResultBatch[Outcome]:
+        for result in results:
+            self.append(result)
+        return self
+
+    @property
+    def successful(self) -> int:
+        return sum(self.successes)
+
+    @property
+    def failed(self) -> int:
+        return len(self) - self.successful
+
+    @property
+    def success_rate(self) -> float:
+        return self.successful / len(self) if self else 0.0
+
+    def measured_durations(self) -> List[int]:
+        return sorted(duration for duration in self.durations if duration != self.unmeasured)
+
+    def latency_percentile(self, percentile: float) -> Optional[int]:
+        if not 0 <= percentile <= 100:
+            raise ValueError(f'Percentiles must be between 0 and 100. Given percentile={percentile}.')
+        durations = self.measured_durations()
+        if not durations:
+            return None
+        rank = max(math.ceil(percentile / 100 * len(durations)), 1)
+        return durations[rank - 1]
+
+    def __len__(self):
+        return len(self.successes)
+
+    def __getitem__(self, index: int) -> Result[Outcome]:
+        if not self.keep_values:
+            raise IndexError(f'{self.__class__.__name__} did not keep values and cannot rebuild Results.')
+        value = self.values[index]
+        started_at, duration = self.started_at[index], self.durations[index]
+        return Result(
+            Right(value) if self.successes[index] else Left(value),
+            lambda: self.produced_at[index],
+            None if started_at == self.unmeasured else started_at,
+            None if duration == self.unmeasured else duration
+        )
+
+    def __iter__(self) -> Iterator[Result[Outcome]]:
+        return (self[index] for index in range(len(self)))
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}|{self.successful}/{len(self)} successful>'
+
+
 class ActionType(type):
 
     def __call__(self, *args, reaction: Optional[Action[T, V]] = None, **kwargs):
@@ -97,18 +199,68 @@ class Action(Generic[Name, Outcome], metaclass=ActionType):
     _name: Optional[Name] = None
 
     lock = RLock()
+    locking = 'GLOBAL'
+    stripes = LockStripe()
     requirements = tuple()
+    pure = False  # whether performing it has no side effects, so its outcome may be cached
+    idempotent = False  # whether performing it more than once has the same effect as performing it once
+
+    _class_locks = dict()
 
     def instruction(self):
         pass
 
-    @synchronized(lock)
     def perform(
         self,
         should_raise: bool = False,
         timestamp_provider: Callable[[], int] = microsecond_timestamp
     ) -> Result[Outcome]:
-        return self._perform(should_raise, timestamp_provider)
+        lock = self.acquire_lock()
+        with lock:
+            held = Action.held()
+            held.append(lock)
+            try:
+                return self._perform(should_raise, timestamp_provider)
+            finally:
+                held.pop()
+
+    async def perform_async(
+        self,
+        should_raise: bool = False,
+        timestamp_provider: Callable[[], int] = microsecond_timestamp
+    ) -> Result[Outcome]:
+        # not locked: Action locks are thread locks, and waiting on one would block the event loop
+        return await self._perform_async(should_raise, timestamp_provider)
+
+    @classmethod
+    def perform_batch(cls, actions: List[Action[Name, Outcome]], should_raise: bool = False) -> List[Result[Outcome]]:
+        return [action._perform(should_raise=should_raise) for action in actions]
+
+    def submit(self, executor: Executor, should_raise: bool = False) -> Future:
+        return executor.submit(self._perform, should_raise)
+
+    def acquire_lock(self) -> ContextManager:
+        return Action.Locking(self.locking).lock_for(self)
+
+    @staticmethod
+    def held() -> List[ContextManager]:  # the locks the current thread performs Actions under, outermost first
+        locks = getattr(_performing, 'locks', None)
+        if locks is None:
+            locks = _performing.locks = []
+        return locks
+
+    @staticmethod
+    @contextmanager
+    def released() -> Iterator[None]:
+        # for awaiting work on other threads, which may need to perform Actions under the same locks
+        locks = [lock for lock in Action.held() if hasattr(lock, 'release')]
+        for lock in reversed(locks):
+            lock.release()
+        try:
+            yield
+        finally:
+            for lock in locks:
+                lock.acquire()
 
     def validate(self):
         return self
@@ -139,11 +291,15 @@ class Action(Generic[Name, Outcome], metaclass=ActionType):
         should_raise: bool = False,
         timestamp_provider: Callable[[], int] = microsecond_timestamp
     ) -> Result[Outcome]:
+        started_at, start = timestamp_provider(), perf_counter_ns()
         if not callable(self.instruction):
             outcome = Left(TypeError(f'Must be callable: {self.instruction}'))
         else:
             try:
-                outcome = Right(self.validate().instruction())
+                value = self.validate().instruction()
+                if isawaitable(value):
+                    value = self._run(value)
+                outcome = Right(value)
                 if issubclass(type(outcome.value), Exception):
                     raise outcome.value
             except Exception as e:
@@ -154,15 +310,71 @@ class Action(Generic[Name, Outcome], metaclass=ActionType):
                 if self._ActionType__reaction:
                     self._ActionType__reaction.perform(should_raise=should_raise)
 
-        return Result(outcome, timestamp_provider)
+        return Result(outcome, timestamp_provider, started_at, perf_counter_ns() - start)
+
+    def _run(self, awaitable: Awaitable[Outcome]) -> Outcome:
+        from asyncio import get_running_loop  # deferred; asyncio is costly to import
+        from asyncio import iscoroutine
+        from asyncio import run
+
+        try:
+            get_running_loop()
+        except RuntimeError:
+            return run(awaitable)
+        if iscoroutine(awaitable):
+            awaitable.close()
+        raise RuntimeError(f'Cannot perform {str(self)} synchronously within a running event loop. Await perform_async instead.')
+
+    async def _perform_async(
+        self,
+        should_raise: bool = False,
+        timestamp_provider: Callable[[], int] = microsecond_timestamp
+    ) -> Result[Outcome]:
+        started_at, start = timestamp_provider(), perf_counter_ns()
+        if not callable(self.instruction):
+            outcome = Left(TypeError(f'Must be callable: {self.instruction}'))
+        else:
+            try:
+                value = await self._instruct_async()
+                outcome = Right(value)
+                if issubclass(type(outcome.value), Exception):
+                    raise outcome.value
+            except Exception as e:
+                if should_raise:
+                    raise e
+                outcome = Left(e)
+            finally:
+                if self._ActionType__reaction:
+                    await self._ActionType__reaction.perform_async(should_raise=should_raise)
+
+        return Result(outcome, timestamp_provider, started_at, perf_counter_ns() - start)
+
+    async def _instruct_async(self) -> Outcome:
+        import asyncio
+        from inspect import iscoroutinefunction
+
+        if iscoroutinefunction(self.instruction):
+            return await self.validate().instruction()
+        loop = asyncio.get_running_loop()
+        value = await loop.run_in_executor(None, lambda: self.validate().instruction())
+        return await value if isawaitable(value) else value
 
-    def __init_subclass__(cls, requires=None):
+    def __init_subclass__(cls, requires=None, locking=None, pure=None, idempotent=None):
         if requires:
             cls.requirements += requires
+        if locking:
+            cls.locking = Action.Locking(locking).value
+        if pure is not None:
+            cls.pure = bool(pure)
+        if idempotent is not None or pure:
+            cls.idempotent = bool(idempotent if idempotent is not None else pure)
 
     def __getstate__(self):
         return vars(self)
 
+    def cache_key(self):  # what a cached outcome of performing it depends on
+        return self.__getstate__()
+
     def __setstate__(self, state):
         self.__dict__.update(state)
 
@@ -179,6 +391,25 @@ class Action(Generic[Name, Outcome], metaclass=ActionType):
     class NotComparable(Exception):
         pass
 
+    class Locking(Enum):
+        GLOBAL = 'GLOBAL'    # one lock for every Action in the process
+        CLASS = 'CLASS'      # one lock per Action subclass
+        STRIPED = 'STRIPED'  # one of Action.stripes keyed by instance identity
+        NONE = 'NONE'        # no synchronization
+
+        def lock_for(self, action: Action) -> ContextManager:
+            if self is self.GLOBAL:
+                return Action.lock
+            if self is self.CLASS:
+                cls = type(action)
+                lock = Action._class_locks.get(cls)
+                if lock is None:
+                    lock = Action._class_locks.setdefault(cls, RLock())
+                return lock
+            if self is self.STRIPED:
+                return Action.stripes[id(action)]
+            return nullcontext()
+
     class Invalid(Exception):
         pass
 
@@ -189,19 +420,43 @@ class Action(Generic[Name, Outcome], metaclass=ActionType):
         def perform(self, should_raise: bool = False) -> Result:
             return Result(Left(self.failure))
 
+        async def perform_async(self, should_raise: bool = False) -> Result:
+            return self.perform(should_raise)
+
+        def submit(self, executor: Executor, should_raise: bool = False) -> Future:
+            return executor.submit(self.perform, should_raise)
+
         def __repr__(self):
             return f'<Action.Construct[{self.failure.__class__.__name__}]>'
 
     class DependencyCheck:
+
+        lock = RLock()
+        modules: Dict[str, ModuleType] = {}
+
         def __init__(self, cls, requirement: str = None):
             if not requirement:
                 raise self.WhichPackage('do you want to check? Please specify a requirment kwarg.')
 
-            result = run([python, '-m', 'pip', 'show', requirement], stdout=PIPE, stderr=PIPE)
-            if result.returncode != 0:
-                raise self.PackageMissing(f'so please install "{requirement}" to proceed.')
-
-            setattr(cls, requirement, __import__(requirement))
+            setattr(cls, requirement, self.resolve(requirement))
+
+        @classmethod
+        def resolve(cls, requirement: str) -> ModuleType:
+            module = cls.modules.get(requirement)
+            if module is not None:
+                return module
+
+            with cls.lock:
+                module = cls.modules.get(requirement)
+                if module is None:
+                    try:
+                        spec = find_spec(requirement)
+                    except (ImportError, ValueError):
+                        spec = None
+                    if spec is None:
+                        raise cls.PackageMissing(f'so please install "{requirement}" to proceed.')
+                    module = cls.modules[requirement] = import_module(requirement)
+                return module
 
         class PackageMissing(Exception):
             pass
@@ -1,16 +1,22 @@
-from actionpack.actions.call import Call
-from actionpack.actions.pipeline import Pipeline
-from actionpack.actions.make_request import MakeRequest
-from actionpack.actions.read import Read
-from actionpack.actions.read_input import ReadInput
-from actionpack.actions.remove import Remove
-from actionpack.actions.retry_policy import RetryPolicy
-from actionpack.actions.serialization import Serialization
-from actionpack.actions.write import Write
+from importlib import import_module
 
 
+_lazy_attributes = {
+    'Call': 'actionpack.actions.call',
+    'CircuitBreaker': 'actionpack.actions.circuit_breaker',
+    'MakeRequest': 'actionpack.actions.make_request',
+    'Pipeline': 'actionpack.actions.pipeline',
+    'Read': 'actionpack.actions.read',
+    'ReadInput': 'actionpack.actions.read_input',
+    'Remove': 'actionpack.actions.remove',
+    'RetryPolicy': 'actionpack.actions.retry_policy',
+    'Serialization': 'actionpack.actions.serialization',
+    'Write': 'actionpack.actions.write',
+}
+
 __all__ = [
     'Call',
+    'CircuitBreaker',
     'MakeRequest',
     'Pipeline',
     'Read',
@@ -20,3 +26,15 @@ __all__ = [
     'Serialization',
     'Write',
 ]
+
+
+def __getattr__(name: str):
+    if name not in _lazy_attributes:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    attribute = getattr(import_module(_lazy_attributes[name]), name)
+    globals()[name] = attribute
+    return attribute
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
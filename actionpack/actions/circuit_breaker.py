@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+from enum import Enum
+from string import Template
+from threading import Lock
+from time import monotonic
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import Optional
+from typing import Tuple
+from typing import Type
+
+from actionpack import Action
+from actionpack.action import Name
+from actionpack.action import Outcome
+from actionpack.action import Result
+
+
+class CircuitBreaker(Action[Name, Outcome]):
+
+    circuits: Dict[Hashable, CircuitBreaker.Circuit] = dict()
+    circuits_lock = Lock()
+
+    def __init__(
+        self,
+        action: Action[Name, Outcome],
+        key: Optional[Hashable] = None,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30,
+        failures: Tuple[Type[Exception], ...] = (Exception,),
+        is_failure: Optional[Callable[[Outcome], bool]] = None
+    ):
+        if not isinstance(failure_threshold, int) or failure_threshold < 1:
+            raise self.Invalid(f'At least one failure must trip the circuit. Given failure_threshold={failure_threshold}.')
+        if recovery_timeout < 0:
+            raise self.Invalid(f'The recovery_timeout cannot be negative. Given recovery_timeout={recovery_timeout}.')
+        if key is None:
+            key = CircuitBreaker.target(action)
+        if key is None:
+            raise self.Invalid(f'Actions without a url must be given the key of the circuit they share. Given key={key}.')
+
+        self.action = action
+        self.key = key
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.failures = failures
+        self.is_failure = is_failure
+
+    @staticmethod
+    def target(action: Action) -> Optional[Hashable]:
+        url = getattr(action, 'url', None)
+        if isinstance(url, str):
+            from urllib.parse import urlsplit
+
+            parts = urlsplit(url)
+            return f'{parts.scheme}://{parts.netloc}'
+        return None
+
+    @staticmethod
+    def server_error(value: Outcome) -> bool:  # e.g. a requests.Response with a 5xx status
+        status = getattr(value, 'status_code', None)
+        return isinstance(status, int) and status >= 500
+
+    @classmethod
+    def circuit_for(cls, key: Hashable) -> CircuitBreaker.Circuit:
+        circuit = cls.circuits.get(key)
+        if circuit is not None:
+            return circuit
+        with cls.circuits_lock:
+            return cls.circuits.setdefault(key, CircuitBreaker.Circuit())
+
+    @classmethod
+    def reset(cls, key: Optional[Hashable] = None):
+        with cls.circuits_lock:
+            if key is None:
+                cls.circuits.clear()
+            else:
+                cls.circuits.pop(key, None)
+
+    @property
+    def circuit(self) -> CircuitBreaker.Circuit:
+        return CircuitBreaker.circuit_for(self.key)
+
+    @property
+    def state(self) -> CircuitBreaker.State:
+        return self.circuit.state
+
+    def instruction(self) -> Outcome:
+        circuit = self.admit()
+        try:
+            result = self.action.perform()
+        except BaseException:
+            circuit.abandon(self.failure_threshold)
+            raise
+        return self.settle(circuit, result)
+
+    async def _instruct_async(self) -> Outcome:
+        circuit = self.validate().admit()
+        try:
+            result = await self.action.perform_async()
+        except BaseException:  # e.g. asyncio.CancelledError
+            circuit.abandon(self.failure_threshold)
+            raise
+        return self.settle(circuit, result)
+
+    def admit(self) -> CircuitBreaker.Circuit:
+        circuit = self.circuit
+        if not circuit.admit(self.recovery_timeout):
+            raise CircuitBreaker.Open(f'Circuit for {self.key} is open. Will not perform {str(self.action)}.')
+        return circuit
+
+    def settle(self, circuit: CircuitBreaker.Circuit, result: Result[Outcome]) -> Outcome:
+        if result.successful:
+            is_failure = self.is_failure if self.is_failure else CircuitBreaker.server_error
+            if is_failure(result.value):
+                circuit.fail(self.failure_threshold)
+            else:
+                circuit.succeed()
+            return result.value
+        if isinstance(result.value, self.failures):
+            circuit.fail(self.failure_threshold)
+        else:
+            circuit.succeed()
+        raise result.value
+
+    def __repr__(self):
+        tmpl = Template('<$class_name($action_name | $key)>')
+        return tmpl.substitute(
+            class_name=self.__class__.__name__,
+            action_name=str(self.action),
+            key=self.key
+        )
+
+    class Open(Exception):
+        pass
+
+    class State(Enum):
+        CLOSED = 'CLOSED'
+        OPEN = 'OPEN'
+        HALF_OPEN = 'HALF_OPEN'
+
+    class Circuit:
+
+        def __init__(self, clock: Callable[[], float] = monotonic):
+            self.clock = clock
+            self.state = CircuitBreaker.State.CLOSED
+            self.consecutive_failures = 0
+            self.opened_at: Optional[float] = None
+            self.probing = False
+            self.successes = 0
+            self.failures = 0
+            self.rejections = 0
+            self.trips = 0
+            self._lock = Lock()
+
+        def admit(self, recovery_timeout: float) -> bool:
+            with self._lock:
+                if self.state is CircuitBreaker.State.OPEN and self.clock() - self.opened_at >= recovery_timeout:
+                    self.state = CircuitBreaker.State.HALF_OPEN
+                if self.state is CircuitBreaker.State.CLOSED:
+                    return True
+                if self.state is CircuitBreaker.State.HALF_OPEN and not self.probing:
+                    self.probing = True
+                    return True
+                self.rejections += 1
+                return False
+
+        def succeed(self):
+            with self._lock:
+                self.successes += 1
+                self.consecutive_failures = 0
+                self.probing = False
+                self.state = CircuitBreaker.State.CLOSED
+
+        def fail(self, failure_threshold: int):
+            with self._lock:
+                self._fail(failure_threshold)
+
+        def abandon(self, failure_threshold: int):
+            # only one caller is admitted while half-open, so an interrupted caller then holds the probe
+            with self._lock:
+                if self.state is CircuitBreaker.State.HALF_OPEN and self.probing:
+                    self._fail(failure_threshold)
+
+        def _fail(self, failure_threshold: int):
+            self.failures += 1
+            self.consecutive_failures += 1
+            if self.state is CircuitBreaker.State.HALF_OPEN or self.consecutive_failures >= failure_threshold:
+                if self.state is not CircuitBreaker.State.OPEN:
+                    self.trips += 1
+                self.state = CircuitBreaker.State.OPEN
+                self.opened_at = self.clock()
+            self.probing = False
+
+        @property
+        def metrics(self) -> Dict[str, int]:
+            return {
+                'successes': self.successes,
+                'failures': self.failures,
+                'rejections': self.rejections,
+                'trips': self.trips,
+            }
+
+        def __repr__(self):
+            return f'<CircuitBreaker.{self.__class__.__name__}[{self.state.value}]>'
@@ -1,10 +1,36 @@
 from __future__ import annotations
+
+import atexit
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from http.cookiejar import DefaultCookiePolicy
+from pathlib import Path
+from threading import Lock
+from time import monotonic
+from time import time
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import TYPE_CHECKING
 from typing import TypeVar
+from typing import Union
 from validators import url as is_url
 
 from actionpack import Action
 from actionpack.action import Name
 from actionpack.action import Outcome
+from actionpack.action import Result
+
+if TYPE_CHECKING:
+    from actionpack.async_http import AsyncEngine
+    from actionpack.cache import Cache
 
 
 Session = TypeVar('Session')
@@ -12,9 +38,346 @@ Request = TypeVar('Request')
 Response = TypeVar('Response')
 
 
+class SessionPool:
+
+    def __init__(self, pool_size: int = 10, keep_alive: bool = True, max_age: Optional[float] = None):
+        if not isinstance(pool_size, int) or pool_size < 1:
+            raise ValueError(f'A session must keep at least one connection. Given pool_size={pool_size}.')
+        if max_age is not None and max_age <= 0:
+            raise ValueError(f'Sessions must live for a positive number of seconds. Given max_age={max_age}.')
+
+        self.pool_size = pool_size
+        self.keep_alive = keep_alive
+        self.max_age = max_age
+        self.created = 0
+        self.reused = 0
+        self.retired = 0
+        self._sessions: Dict[str, Tuple[Session, float]] = {}
+        self._leases: Dict[Session, int] = {}
+        self._retiring: List[Session] = []
+        self._lock = Lock()
+
+    @staticmethod
+    def key_for(url: str) -> str:
+        from urllib.parse import urlsplit
+
+        parts = urlsplit(url)
+        return f'{parts.scheme.lower()}://{parts.netloc.lower()}'
+
+    def get(self, url: str) -> Session:
+        with self._lock:
+            return self._checkout(self.key_for(url))
+
+    @contextmanager
+    def lease(self, url: str) -> Iterator[Session]:
+        with self._lock:
+            session = self._checkout(self.key_for(url))
+            self._leases[session] = self._leases.get(session, 0) + 1
+        try:
+            yield session
+        finally:
+            with self._lock:
+                self._leases[session] -= 1
+                idle = not self._leases[session]
+                if idle:
+                    del self._leases[session]
+                retired = idle and session in self._retiring
+                if retired:
+                    self._retiring.remove(session)
+            if retired:
+                session.close()
+
+    def _checkout(self, key: str) -> Session:
+        entry = self._sessions.get(key)
+        if entry is not None:
+            session, created_at = entry
+            if self.max_age is None or monotonic() - created_at < self.max_age:
+                self.reused += 1
+                return session
+            self.retired += 1
+            if session in self._leases:  # closed once its last lease ends
+                self._retiring.append(session)
+            else:
+                session.close()
+        session = self.create()
+        self._sessions[key] = (session, monotonic())
+        self.created += 1
+        return session
+
+    def create(self) -> Session:
+        import requests
+
+        session = requests.Session()
+        session.cookies.set_policy(SessionPool.Cookieless())
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        if not self.keep_alive:
+            session.headers['Connection'] = 'close'
+        return session
+
+    def close(self):
+        with self._lock:
+            sessions, self._sessions = [session for session, _ in self._sessions.values()], {}
+            sessions, self._retiring = sessions + self._retiring, []
+        for session in sessions:
+            session.close()
+
+    @property
+    def metrics(self) -> Dict[str, int]:
+        return {
+            'sessions': len(self),
+            'created': self.created,
+            'reused': self.reused,
+            'retired': self.retired,
+        }
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}[{len(self)} hosts|{self.pool_size} connections each]>'
+
+    class Cookieless(DefaultCookiePolicy):
+        # sessions are shared by every caller of a host, so none may keep cookies set for another
+
+        def set_ok(self, cookie, request) -> bool:
+            return False
+
+        def return_ok(self, cookie, request) -> bool:
+            return False
+
+
+class ResponseCache:
+
+    cacheable = (200, 203, 204, 300, 301, 404, 405, 410, 414, 501)
+    safe_methods = ('GET', 'HEAD', 'OPTIONS', 'TRACE')
+    credentials = ('Authorization', 'Cookie')
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        directory: Optional[Union[str, Path]] = None,
+        default_ttl: float = 0,
+        clock: Callable[[], float] = time
+    ):
+        from actionpack.cache import Cache
+
+        self.entries: Cache = Cache(maxsize=maxsize, directory=directory)
+        self.default_ttl = default_ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.stores = 0
+        self.invalidations = 0
+        self._lock = Lock()
+
+    def fetch(self, request: Request, send: Callable[[Request], Response]) -> Response:
+        key, entry = self.consult(request)
+        if entry is not None and self.is_fresh(entry, request):
+            return self.hit(entry, request)
+        request = self.conditional(request, entry)
+        return self.settle(key, entry, request, send(request))
+
+    async def fetch_async(self, request: Request, send: Callable[[Request], Awaitable[Response]]) -> Response:
+        key, entry = self.consult(request)
+        if entry is not None and self.is_fresh(entry, request):
+            return self.hit(entry, request)
+        request = self.conditional(request, entry)
+        return self.settle(key, entry, request, await send(request))
+
+    @staticmethod
+    def key_for(url: str) -> str:
+        from actionpack.cache import fingerprint
+
+        return fingerprint(('GET', url))
+
+    def consult(self, request: Request) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        if request.method != 'GET' or 'no-store' in self.directives(request.headers):
+            return None, None
+        key = self.key_for(request.url)
+        entry = self.entries.get(key)
+        if entry is None or any(request.headers.get(name) != value for name, value in entry['vary'].items()):
+            return key, None
+        if self.credentialed(request) and not entry.get('public'):
+            return key, None
+        return key, entry
+
+    @staticmethod
+    def credentialed(request: Request) -> bool:
+        return any(name in request.headers for name in ResponseCache.credentials)
+
+    @staticmethod
+    def conditional(request: Request, entry: Optional[Dict[str, Any]]) -> Request:
+        if entry is None or not (entry['etag'] or entry['last_modified']):
+            return request
+        request = request.copy()
+        if entry['etag']:
+            request.headers['If-None-Match'] = entry['etag']
+        if entry['last_modified']:
+            request.headers['If-Modified-Since'] = entry['last_modified']
+        return request
+
+    def is_fresh(self, entry: Dict[str, Any], request: Request) -> bool:
+        if 'no-cache' in self.directives(request.headers):
+            return False
+        return self.clock() - entry['stored_at'] < entry['lifetime']
+
+    def hit(self, entry: Dict[str, Any], request: Request) -> Response:
+        with self._lock:
+            self.hits += 1
+        return self.rebuild(entry, request)
+
+    def settle(self, key: Optional[str], entry: Optional[Dict[str, Any]], request: Request, response: Response) -> Response:
+        if key is None:
+            if request.method not in self.safe_methods and 200 <= response.status_code < 400:
+                self.invalidate(request, response)
+            return response
+        if entry is not None and response.status_code == 304:
+            with self._lock:
+                self.revalidations += 1
+            entry = dict(entry, headers=dict(entry['headers'], **self.refreshed(response.headers)))
+            self.entries.set(key, self.describe(entry['headers'], entry))
+            return self.rebuild(entry, request)
+        with self._lock:
+            self.misses += 1
+        self.store(key, request, response)
+        return response
+
+    def invalidate(self, request: Request, response: Response):
+        from urllib.parse import urljoin
+        from urllib.parse import urlsplit
+
+        urls = {request.url}
+        for name in ('Location', 'Content-Location'):
+            if name in response.headers:
+                url = urljoin(request.url, response.headers[name])
+                if urlsplit(url)[:2] == urlsplit(request.url)[:2]:
+                    urls.add(url)
+        for url in urls:
+            key = self.key_for(url)
+            if key in self.entries:
+                self.entries.delete(key)
+                with self._lock:
+                    self.invalidations += 1
+
+    def store(self, key: str, request: Request, response: Response):
+        directives = self.directives(response.headers)
+        if response.status_code not in self.cacheable or 'no-store' in directives or 'private' in directives:
+            return
+        if self.credentialed(request) and 'public' not in directives:
+            return
+        if '*' in response.headers.get('Vary', ''):
+            return
+        headers = dict(response.headers)
+        entry = {
+            'status_code': response.status_code,
+            'reason': response.reason,
+            'url': response.url,
+            'encoding': response.encoding,
+            'content': response.content,
+            'vary': {
+                name.strip(): request.headers.get(name.strip())
+                for name in response.headers.get('Vary', '').split(',') if name.strip()
+            },
+        }
+        entry = self.describe(headers, entry)
+        if entry['lifetime'] > 0 or entry['etag'] or entry['last_modified']:
+            self.entries.set(key, entry)
+            with self._lock:
+                self.stores += 1
+
+    def describe(self, headers: Dict[str, str], entry: Dict[str, Any]) -> Dict[str, Any]:
+        from requests.structures import CaseInsensitiveDict
+
+        headers = CaseInsensitiveDict(headers)
+        return dict(
+            entry,
+            headers=dict(headers),
+            stored_at=self.clock() - float(headers.get('Age', 0) or 0),
+            lifetime=self.lifetime(headers),
+            public='public' in self.directives(headers),
+            etag=headers.get('ETag'),
+            last_modified=headers.get('Last-Modified'),
+        )
+
+    def lifetime(self, headers) -> float:
+        from email.utils import parsedate_to_datetime
+
+        directives = self.directives(headers)
+        if 'no-cache' in directives or 'must-understand' in directives:
+            return 0
+        for directive in ('s-maxage', 'max-age'):  # a shared cache, so s-maxage takes precedence
+            if directive in directives:
+                try:
+                    return float(directives[directive])
+                except ValueError:
+                    return 0
+        if 'Expires' in headers:
+            try:
+                expires = parsedate_to_datetime(headers['Expires'])
+                date = parsedate_to_datetime(headers['Date']) if 'Date' in headers else None
+                return (expires - date).total_seconds() if date else expires.timestamp() - self.clock()
+            except (TypeError, ValueError):
+                return 0
+        return self.default_ttl
+
+    @staticmethod
+    def directives(headers) -> Dict[str, Optional[str]]:
+        directives = {}
+        for directive in headers.get('Cache-Control', '').split(','):
+            name, _, value = directive.strip().partition('=')
+            if name:
+                directives[name.lower()] = value.strip('"') if value else None
+        return directives
+
+    @staticmethod
+    def refreshed(headers) -> Dict[str, str]:
+        unchanged = ('content-length', 'content-encoding', 'transfer-encoding', 'content-type')
+        return {name: value for name, value in headers.items() if name.lower() not in unchanged}
+
+    @staticmethod
+    def rebuild(entry: Dict[str, Any], request: Request) -> Response:
+        from requests import Response
+        from requests.structures import CaseInsensitiveDict
+
+        response = Response()
+        response.status_code = entry['status_code']
+        response.reason = entry['reason']
+        response.url = entry['url']
+        response.encoding = entry['encoding']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.request = request
+        response._content = entry['content']
+        response.from_cache = True
+        return response
+
+    def clear(self):
+        self.entries.clear()
+
+    @property
+    def metrics(self) -> Dict[str, int]:
+        return {
+            'hits': self.hits,
+            'revalidations': self.revalidations,
+            'misses': self.misses,
+            'stores': self.stores,
+            'invalidations': self.invalidations,
+            'size': len(self.entries),
+        }
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}[{len(self.entries)} responses|{self.hits} hits|{self.misses} misses]>'
+
+
 class MakeRequest(Action[Name, Outcome], requires=('requests',)):
 
     methods = ('CONNECT', 'GET', 'DELETE', 'HEAD', 'OPTIONS', 'PATCH', 'POST', 'PUT', 'TRACE')
+    idempotent_methods = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE', 'TRACE')
+    sessions = SessionPool()
+    responses: Optional[ResponseCache] = None
+    engine: ContextVar[Optional[AsyncEngine]] = ContextVar('engine', default=None)
 
     def __init__(self, method: str, url: str, data: dict = None, headers: dict = None, session: Session = None):
         self.method = method.upper()
@@ -24,13 +387,54 @@ class MakeRequest(Action[Name, Outcome], requires=('requests',)):
         self.headers = headers
         self.session = session
 
+    @property
+    def idempotent(self) -> bool:
+        return self.method.upper() in MakeRequest.idempotent_methods
+
     def prepare(self, method: str, url: str, data: dict = None, headers=None) -> Request:
         self.check_dependencies(self)
         return self.requests.Request(method, url, data=data, headers=headers).prepare()
 
     def instruction(self) -> Response:
         request = self.prepare(self.method, self.url, self.data, self.headers)
-        return (self.session if self.session else self.requests.Session()).send(request)
+        if self.session:
+            return self.send(request, self.session.send)
+        with MakeRequest.sessions.lease(self.url) as session:
+            return self.send(request, session.send)
+
+    @staticmethod
+    def send(request: Request, send: Callable[[Request], Response]) -> Response:
+        return MakeRequest.responses.fetch(request, send) if MakeRequest.responses else send(request)
+
+    async def _instruct_async(self) -> Response:
+        engine = MakeRequest.engine.get()
+        if engine is None or self.session:
+            return await super()._instruct_async()
+        request = self.validate().prepare(self.method, self.url, self.data, self.headers)
+        if MakeRequest.responses:
+            return await MakeRequest.responses.fetch_async(request, engine.send)
+        return await engine.send(request)
+
+    @classmethod
+    async def perform_batch_async(
+        cls,
+        actions: Iterable[Action[Name, Outcome]],
+        limit_per_host: int = 10,
+        should_raise: bool = False,
+        engine: Optional[AsyncEngine] = None
+    ) -> List[Result[Outcome]]:
+        import asyncio
+        from actionpack.async_http import AsyncEngine
+
+        owned = engine is None
+        engine = AsyncEngine(limit_per_host=limit_per_host) if owned else engine
+        token = MakeRequest.engine.set(engine)
+        try:
+            return await asyncio.gather(*(action.perform_async(should_raise=should_raise) for action in actions))
+        finally:
+            MakeRequest.engine.reset(token)
+            if owned:
+                await engine.close()
 
     def validate(self) -> MakeRequest[Name, Outcome]:
         if self.method not in self.methods:
@@ -39,3 +443,6 @@ class MakeRequest(Action[Name, Outcome], requires=('requests',)):
         if url_validation is not True:
             raise url_validation
         return self
+
+
+atexit.register(lambda: MakeRequest.sessions.close())
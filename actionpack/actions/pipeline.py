@@ -1,22 +1,101 @@
+from __future__ import annotations
 from collections import OrderedDict
+from collections import defaultdict
+from collections import deque
 from inspect import signature
+from itertools import islice
+from typing import Any
 from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import List
 from typing import Optional
+from typing import Tuple
+from typing import TYPE_CHECKING
+from weakref import WeakKeyDictionary
+from oslash import Right
 
 from actionpack import Action
 from actionpack.action import ActionType
+from actionpack.action import Result
 from actionpack.actions import Call
 from actionpack.utils import Closure
 from actionpack.utils import first
 from actionpack.utils import key_for
-from actionpack.utils import swap
+from actionpack.utils import prefetch
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    from actionpack.cache import Cache
+
+
+_parameters: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def parameters(action_type: ActionType) -> List[str]:
+    params = _parameters.get(action_type)
+    if params is None:
+        params_dict = OrderedDict(signature(action_type.__init__).parameters.items())
+        params_dict.pop('self', None)
+        params = _parameters[action_type] = list(params_dict.keys())
+    return params
+
+
+def perform_grouped(actions: List[Action], should_raise: bool = False) -> List[Result]:
+    results: List[Optional[Result]] = [None] * len(actions)
+    batches = defaultdict(list)
+    for index, action in enumerate(actions):
+        batches[type(action)].append(index)
+    for action_type, indices in batches.items():
+        batch = [actions[index] for index in indices]
+        if isinstance(action_type, ActionType):
+            performed = action_type.perform_batch(batch, should_raise=should_raise)
+        else:
+            performed = [action.perform(should_raise=should_raise) for action in batch]
+        for index, result in zip(indices, performed):
+            results[index] = result
+    return results
+
+
+def identity(action_type: type) -> Tuple:
+    if action_type.__name__ == Pipeline.Parallel.__name__ and hasattr(action_type, 'stages'):
+        return (
+            action_type.__name__,
+            tuple(identity(branch) for branch in action_type.action_types),
+            action_type.gather
+        )
+    if action_type.__name__ == Pipeline.Fitting.__name__ and hasattr(action_type, 'kwargs'):
+        return (
+            action_type.__name__,
+            identity(action_type.action),
+            action_type.enclose,
+            sorted(action_type.kwargs.items())
+        )
+    return action_type.__module__, action_type.__qualname__
+
+
+def fingerprint(action: Action) -> Optional[str]:
+    from actionpack.cache import fingerprint as digest
+
+    if isinstance(action, Action.Construct):
+        return None
+    return digest((identity(type(action)), action.cache_key()))
 
 
 class Pipeline(Action):
 
-    def __init__(self, action: Action, *action_types: ActionType, should_raise: bool = False):
+    def __init__(
+        self,
+        action: Action,
+        *action_types: ActionType,
+        should_raise: bool = False,
+        prefetch: int = 0,
+        cache: Optional[Cache] = None
+    ):
         self.action = action
         self.should_raise = should_raise
+        self.prefetch = prefetch
+        self.cache = cache
 
         for action_type in action_types:
             if not isinstance(action_type, ActionType):
@@ -26,40 +105,77 @@ class Pipeline(Action):
         self._action_types = iter(action_types)
 
     def instruction(self):
-        return self.flush(self.action).perform(should_raise=self.should_raise).value
+        return self.compile().perform(self.action).value
+
+    def compile(self) -> Pipeline.Plan:
+        try:
+            return self._plan
+        except AttributeError:
+            pass
+        self._plan = Pipeline.Plan(
+            self.action_types,
+            should_raise=self.should_raise,
+            prefetch=self.prefetch,
+            cache=self.cache
+        )
+        return self._plan
+
+    def __getstate__(self):
+        state = dict(vars(self))
+        state.pop('_plan', None)
+        return state
 
-    # recursive
     def flush(self, given_action: Optional[Action] = None) -> Action:
-        next_action_type = next(self)
-
-        if next_action_type:
-            params_dict = OrderedDict(signature(next_action_type.__init__).parameters.items())
-            params_dict.pop('self', None)
-            params = list(params_dict.keys())
-            keyed_result = dict(zip(params, [given_action.perform(should_raise=self.should_raise).value]))
-            if next_action_type.__name__ == Pipeline.Fitting.__name__:
-                params_dict = OrderedDict(signature(next_action_type.action.__init__).parameters.items())
-                params_dict.pop('self', None)
-                params = list(params_dict.keys())
-                conduit = first(params)
-                key = key_for(Pipeline.Receiver, dict(next_action_type.kwargs))
-                if conduit in next_action_type.kwargs and key:
-                    params = swap(params, 0, params.index(key))
-                keyed_result = dict(zip(params, [keyed_result['action']]))
-                if conduit == 'closure':
-                    keyed_result['closure'] = Closure(next_action_type.enclose, keyed_result['closure'])
-                next_action_type.kwargs.update(keyed_result)
-                next_action = next_action_type.action(**next_action_type.kwargs)
-                next_action_type.kwargs[key] = Pipeline.Receiver
-            else:
-                next_action = next_action_type(**keyed_result)
+        return self.compile().flush(given_action if given_action else self.action)
+
+    def map(
+        self,
+        inputs: Iterable[Any],
+        max_workers: int = 5,
+        ordered: bool = True,
+        batch_size: int = 1,
+        max_in_flight: Optional[int] = None,
+        executor: Optional[Executor] = None
+    ) -> Iterator[Result]:
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError(f'Batches must contain at least one input. Given batch_size={batch_size}.')
+        max_in_flight = max_in_flight if max_in_flight else 2 * max_workers
+        if not isinstance(max_in_flight, int) or max_in_flight < 1:
+            raise ValueError(f'At least one batch must be in flight. Given max_in_flight={max_in_flight}.')
+
+        from concurrent.futures import FIRST_COMPLETED
+        from concurrent.futures import wait
+        from actionpack.executors import registry
+
+        plan = self.compile()
+        executor = executor if executor else registry.get(max_workers)
+        heads = (
+            item if isinstance(item, (Action, Action.Construct)) else Pipeline.Input(item)
+            for item in inputs
+        )
+        batches = iter(lambda: list(islice(heads, batch_size)), [])
 
-            return self.flush(next_action)
+        def submit(batch: List[Action]):
+            return executor.submit(plan.perform_batch, batch)
 
-        return given_action
+        if ordered:
+            in_flight = deque(submit(batch) for batch in islice(batches, max_in_flight))
+            while in_flight:
+                results = in_flight.popleft().result()
+                for batch in islice(batches, 1):
+                    in_flight.append(submit(batch))
+                yield from results
+        else:
+            in_flight = {submit(batch) for batch in islice(batches, max_in_flight)}
+            while in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    for batch in islice(batches, 1):
+                        in_flight.add(submit(batch))
+                    yield from future.result()
 
     def __iter__(self):
-        return self._action_types
+        return iter(self.action_types)
 
     def __next__(self):
         try:
@@ -70,6 +186,125 @@ class Pipeline(Action):
     class Receiver:
         pass
 
+    class Input(Action):
+        def __init__(self, value: Any):
+            self.value = value
+
+        def instruction(self) -> Any:
+            return self.value
+
+    class Stage:
+
+        def __init__(self, action_type: ActionType):
+            self.action_type = action_type
+            self.pure = action_type.pure
+            self.enclose: Optional[Callable] = None
+            self.kwargs = dict()
+
+            if action_type.__name__ == Pipeline.Fitting.__name__:
+                self.action = action_type.action
+                params = parameters(self.action)
+                conduit = first(params)
+                key = key_for(Pipeline.Receiver, dict(action_type.kwargs))
+                self.param = key if conduit in action_type.kwargs and key else conduit
+                self.enclose = action_type.enclose if conduit == 'closure' else None
+                self.kwargs = dict(action_type.kwargs)
+            else:
+                self.action = action_type
+                params = parameters(action_type)
+                self.param = first(params) if params else None
+
+        def build(self, value: Any) -> Action:
+            kwargs = dict(self.kwargs)
+            if self.param:
+                kwargs[self.param] = Closure(self.enclose, value) if self.enclose else value
+            return self.action(**kwargs)
+
+        def __repr__(self):
+            return f'<{self.__class__.__name__}({self.action.__name__}|{self.param})>'
+
+    class Plan:
+
+        def __init__(
+            self,
+            action_types: Iterable[ActionType],
+            should_raise: bool = False,
+            prefetch: int = 0,
+            cache: Optional[Cache] = None
+        ):
+            self.stages = tuple(Pipeline.Stage(action_type) for action_type in action_types)
+            self.should_raise = should_raise
+            self.prefetch = prefetch
+            self.cache = cache
+
+        def flush(self, given_action: Action) -> Action:
+            action, _ = self.advance(given_action)
+            return action
+
+        def perform(self, given_action: Action) -> Result:
+            return self.outcome(*self.advance(given_action))
+
+        def advance(self, given_action: Action) -> Tuple[Action, bool]:
+            pure = getattr(given_action, 'pure', False)
+            for stage in self.stages:
+                given_action = stage.build(self.prefetched(self.outcome(given_action, pure).value))
+                pure = stage.pure
+            return given_action, pure
+
+        def perform_batch(self, given_actions: List[Action]) -> List[Result]:
+            actions = list(given_actions)
+            pure = [getattr(action, 'pure', False) for action in actions]
+            for stage in self.stages:
+                results = self.outcomes(actions, pure)
+                actions = [stage.build(self.prefetched(result.value)) for result in results]
+                pure = [stage.pure] * len(actions)
+            return self.outcomes(actions, pure)
+
+        def outcome(self, action: Action, pure: bool = False) -> Result:
+            key, result = self.recall(action, pure)
+            if result is None:
+                result = self.remember(key, action.perform(should_raise=self.should_raise))
+            return result
+
+        def outcomes(self, actions: List[Action], pure: List[bool]) -> List[Result]:
+            if self.cache is None or not any(pure):
+                return perform_grouped(actions, should_raise=self.should_raise)
+            recalled = [self.recall(action, cacheable) for action, cacheable in zip(actions, pure)]
+            missed = [index for index, (_, result) in enumerate(recalled) if result is None]
+            performed = perform_grouped([actions[index] for index in missed], should_raise=self.should_raise)
+            results = [result for _, result in recalled]
+            for index, result in zip(missed, performed):
+                results[index] = self.remember(recalled[index][0], result)
+            return results
+
+        def recall(self, action: Action, pure: bool) -> Tuple[Optional[str], Optional[Result]]:
+            # only stages declared pure are cached, so side effects (e.g. Write, MakeRequest) are never skipped
+            if self.cache is None or not pure:
+                return None, None
+            from actionpack.cache import Cache
+
+            key = fingerprint(action)
+            if key is None:
+                return None, None
+            value = self.cache.get(key, Cache.missing)
+            return key, None if value is Cache.missing else Result(Right(value))
+
+        def remember(self, key: Optional[str], result: Result) -> Result:
+            if key and result.successful and not isinstance(result.value, Iterator):
+                self.cache.set(key, result.value)
+            return result
+
+        def prefetched(self, value: Any) -> Any:
+            if self.prefetch and isinstance(value, Iterator):
+                return prefetch(value, self.prefetch)
+            return value
+
+        def __len__(self):
+            return len(self.stages)
+
+        def __repr__(self):
+            return f'<Pipeline.{self.__class__.__name__}[{len(self)} stages]>'
+
     class Fitting(type):
 
         @staticmethod
@@ -95,6 +330,7 @@ class Pipeline(Action):
             should_raise: bool = False,
             enclose: Callable = None,
             reaction: Call = None,
+            pure: Optional[bool] = None,
             **kwargs
         ):
             dct = dict()
@@ -105,5 +341,79 @@ class Pipeline(Action):
             dct['should_raise'] = should_raise
             dct['reaction'] = reaction
             dct['kwargs'] = kwargs
+            dct['pure'] = action.pure and not reaction if pure is None else pure
             cls = type(Pipeline.Fitting.__name__, (Action,), dct)
             return cls
+
+    class Parallel(type):
+
+        threads = 64  # shared by the branches of every Parallel stage; threads start only as they are needed
+
+        @staticmethod
+        def init(self, value=None):
+            self.value = value
+
+        @staticmethod
+        def instruction(instance):
+            from actionpack.procedure import perform_pickled
+            from actionpack.procedure import ship
+
+            branches = [stage.build(instance.value) for stage in instance.stages]
+            executor = Pipeline.Parallel.executor_for(type(instance))
+            # at most max_workers batches of branches, so each stage bounds its own concurrency on the shared pool
+            size = -(-len(branches) // min(instance.max_workers, len(branches)))
+            batches = [branches[start:start + size] for start in range(0, len(branches), size)]
+            if instance.processes:
+                futures = [
+                    executor.submit(perform_pickled, [ship(branch) for branch in batch], instance.should_raise)
+                    for batch in batches
+                ]
+            else:
+                futures = [executor.submit(Action.perform_batch, batch, instance.should_raise) for batch in batches]
+            with Action.released():
+                results = [result for future in futures for result in future.result()]
+
+            for result in results:
+                if not result.successful:
+                    raise result.value
+            values = [result.value for result in results]
+            return instance.gather(*values) if instance.gather else tuple(values)
+
+        @staticmethod
+        def executor_for(parallel: ActionType):
+            if parallel.executor:
+                return parallel.executor
+            from actionpack.executors import registry
+            if parallel.processes:
+                return registry.get(parallel.max_workers, processes=True)
+            # kept apart from the general pools so stages performed on them cannot starve their own branches
+            return registry.get(Pipeline.Parallel.threads, name=Pipeline.Parallel.__name__.lower())
+
+        def __new__(
+            mcs,
+            *action_types: ActionType,
+            gather: Callable = None,
+            max_workers: Optional[int] = None,
+            processes: bool = False,
+            executor: Optional[Executor] = None,
+            should_raise: bool = False
+        ):
+            if not action_types:
+                raise TypeError(f'{Pipeline.Parallel.__name__} stages need at least one {ActionType.__name__}.')
+            for action_type in action_types:
+                if not isinstance(action_type, ActionType):
+                    raise TypeError(f'Must be an {ActionType.__name__}: {action_type}')
+
+            dct = dict()
+            dct['__init__'] = Pipeline.Parallel.init
+            dct['instruction'] = Pipeline.Parallel.instruction
+            dct['action_types'] = action_types
+            dct['stages'] = tuple(Pipeline.Stage(action_type) for action_type in action_types)
+            dct['gather'] = staticmethod(gather) if gather else None
+            dct['max_workers'] = max_workers if max_workers else len(action_types)
+            dct['processes'] = processes
+            dct['executor'] = executor
+            dct['should_raise'] = should_raise
+            dct['pure'] = all(action_type.pure for action_type in action_types)
+            cls = type(Pipeline.Parallel.__name__, (Action,), dct)
+            return cls
@@ -1,20 +1,41 @@
 from __future__ import annotations
 from pathlib import Path
+from typing import Iterator
+from typing import Optional
+from typing import Union
 
 from actionpack import Action
 from actionpack.action import Name
 
 
-class Read(Action[Name, bytes]):
-    def __init__(self, filename: str, output_type: type = str):
+class Read(Action[Name, bytes], pure=True):
+    def __init__(self, filename: str, output_type: type = str, chunksize: Optional[int] = None):
         if output_type not in [bytes, str]:
             raise TypeError(f'Must be of type bytes or str: {output_type}')
+        if chunksize is not None and (not isinstance(chunksize, int) or chunksize < 1):
+            raise ValueError(f'Chunks must be at least one unit long. Given chunksize={chunksize}.')
         self.output_type = output_type
         self.path = Path(filename)
+        self.chunksize = chunksize
 
-    def instruction(self) -> bytes:
+    def instruction(self) -> Union[bytes, str, Iterator[Union[bytes, str]]]:
+        if self.chunksize:
+            return self.chunks()
         return self.path.read_bytes() if self.output_type is bytes else self.path.read_text()
 
+    def chunks(self) -> Iterator[Union[bytes, str]]:
+        mode, empty = ('rb', b'') if self.output_type is bytes else ('r', '')
+        with self.path.open(mode) as file:
+            yield from iter(lambda: file.read(self.chunksize), empty)
+
+    def cache_key(self):
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return super().cache_key()
+        # so a file changed since it was cached is read again
+        return dict(super().cache_key(), size=stat.st_size, modified=stat.st_mtime_ns)
+
     def validate(self) -> Read[Name, bytes]:
         if not self.path.exists():
             raise FileNotFoundError(str(self.path))
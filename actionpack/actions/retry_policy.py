@@ -3,17 +3,48 @@ from __future__ import annotations
 import math
 import random
 
+from collections import Counter
+from collections import deque
 from enum import Enum
+from functools import lru_cache
 from oslash import Left
+from oslash import Right
 from string import Template
+from threading import Lock
+from time import monotonic
+from time import perf_counter_ns
 from time import sleep
+from typing import Callable
+from typing import Dict
 from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import TYPE_CHECKING
 
 from actionpack import Action
 from actionpack.action import Result
 from actionpack.action import Name
 from actionpack.action import Outcome
-from actionpack.utils import tally
+from actionpack.actions.circuit_breaker import CircuitBreaker
+from actionpack.utils import microsecond_timestamp
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    from concurrent.futures import Future
+    from actionpack.executors import TimerScheduler
+
+
+@lru_cache(maxsize=1024)
+def schedule(
+    backoff: str,
+    base: float,
+    retries: int,
+    max_delay: float,
+    jitter: str,
+    jitter_percentage: float
+) -> RetryPolicy.Schedule:
+    return RetryPolicy.Schedule(backoff, base, retries, max_delay, jitter, jitter_percentage)
 
 
 # TODO -- devise means of passing .perform options to wrapped Action
@@ -28,8 +59,13 @@ class RetryPolicy(Action[Name, Outcome]):
         max_delay: int = 3600,
         backoff: str = 'CONSTANT',
         jitter_percentage: float = 1.0,
+        jitter: str = 'PERCENTAGE',
         should_record: bool = False,
-        should_show_effort: bool = False
+        should_show_effort: bool = False,
+        budget: Optional[RetryPolicy.Budget] = None,
+        max_recorded: Optional[int] = None,
+        deadline: Optional[float] = None,
+        hedge: Optional[RetryPolicy.Hedge] = None
     ):
         if not isinstance(max_retries, int) or max_retries < 0:
             raise self.Invalid(f'The number of max_retries must be greater than zero. Given max_retries={max_retries}.')
@@ -37,18 +73,29 @@ class RetryPolicy(Action[Name, Outcome]):
             raise self.Invalid(f'The number of max_retries must be greater than zero. Given max_retries={max_retries}.')
         if should_show_effort and not should_record:
             raise self.Invalid('Attempts must be recorded to show Effort.')
+        if max_recorded is not None and (not isinstance(max_recorded, int) or max_recorded < 1):
+            raise self.Invalid(f'At least one attempt must be kept when recording. Given max_recorded={max_recorded}.')
+        if deadline is not None and deadline <= 0:
+            raise self.Invalid(f'The deadline must be a positive number of seconds. Given deadline={deadline}.')
 
         self.action = action
         self.backoff = RetryPolicy.Backoff(backoff)
         self.delay_between_attempts = delay_between_attempts
+        self.jitter = RetryPolicy.Jitter(jitter)
         self.jitter_percentage = jitter_percentage
         self.max_delay = max_delay
         self.max_retries = max_retries
         self.should_record = should_record
         self.should_show_effort = should_show_effort
+        self.budget = budget
+        self.max_recorded = max_recorded
+        self.deadline = deadline
+        self.hedge = hedge
 
         if self.should_record:
-            self.attempts: list[Result[Outcome]] = []
+            self.attempts: Iterable[Result[Outcome]] = deque(maxlen=max_recorded) if max_recorded else []
+            self.initial_attempt: Optional[Result[Outcome]] = None  # kept even once max_recorded drops it from attempts
+            self.summary = RetryPolicy.Summary()
 
     def instruction(self) -> Outcome:
         return self.enact()
@@ -68,6 +115,24 @@ class RetryPolicy(Action[Name, Outcome]):
             pass
         return -1
 
+    @property
+    def schedule(self) -> RetryPolicy.Schedule:
+        return schedule(
+            self.backoff.value,
+            self.delay_between_attempts,
+            self.max_retries,
+            self.max_delay,
+            self.jitter.value,
+            self.jitter_percentage
+        )
+
+    @property
+    def remaining(self) -> Optional[float]:
+        try:
+            return self._deadline_at - monotonic() if self._deadline_at is not None else None
+        except AttributeError:
+            return self.deadline
+
     @property
     def enacted(self):
         return self.retries >= 0
@@ -77,30 +142,164 @@ class RetryPolicy(Action[Name, Outcome]):
         return self.retries >= self.max_retries
 
     def enact(self, counter: int = -1) -> Outcome:
+        self.begin(counter)
+        attempt = None
+        while not self.expired:
+            attempt = self.hedge.perform(self.action) if self.hedge else self.action.perform()
+            with_delay = self.advance(attempt)
+            if with_delay is None:
+                break
+            sleep(with_delay)
+        return self.conclude(attempt)
+
+    async def enact_async(self, counter: int = -1) -> Outcome:
+        import asyncio
+
+        self.begin(counter)
+        attempt = None
+        while not self.expired:
+            attempt = await self.attempt_async()
+            with_delay = self.advance(attempt)
+            if with_delay is None:
+                break
+            await asyncio.sleep(with_delay)
+        return self.conclude(attempt)
+
+    async def attempt_async(self) -> Result[Outcome]:
+        import asyncio
+
+        performance = self.hedge.perform_async(self.action) if self.hedge else self.action.perform_async()
+        if self.remaining is None:
+            return await performance
+        try:
+            return await asyncio.wait_for(performance, max(self.remaining, 0))
+        except asyncio.TimeoutError:
+            return Result(Left(RetryPolicy.DeadlineExceeded(f'{str(self.action)} did not finish by the deadline.')))
+
+    async def _instruct_async(self) -> Outcome:
+        return await self.validate().enact_async()
+
+    def submit(
+        self,
+        executor: Executor,
+        should_raise: bool = False,
+        scheduler: Optional[TimerScheduler] = None
+    ) -> Future:
+        from concurrent.futures import CancelledError
+        from concurrent.futures import Future
+
+        if scheduler is None:
+            from actionpack.executors import timers as scheduler
+
+        future = Future()
+        started_at, start = microsecond_timestamp(), perf_counter_ns()
+
+        def settle(outcome):
+            if future.done():
+                return
+            if self._ActionType__reaction:
+                self._ActionType__reaction.perform()
+            result = Result(outcome, microsecond_timestamp, started_at, perf_counter_ns() - start)
+            if should_raise and not result.successful:
+                future.set_exception(result.value)
+            else:
+                future.set_result(result)
+
+        def attempt():
+            try:
+                performance = self.hedge.perform(self.action) if self.hedge else self.action.perform()
+                with_delay = self.advance(performance)
+                if with_delay is not None:
+                    scheduler.call_later(with_delay, dispatch)
+                    return
+                outcome = Right(self.conclude(performance))
+            except Exception as e:
+                outcome = Left(e)
+            settle(outcome)
+
+        def dispatch():
+            try:
+                executor.submit(attempt).add_done_callback(observe)
+            except Exception as e:
+                settle(Left(e))
+
+        def observe(submitted: Future):
+            # an attempt that never ran (e.g. cancelled at executor shutdown) must still settle the future
+            if submitted.cancelled():
+                settle(Left(CancelledError(f'An attempt at {str(self.action)} was cancelled.')))
+            elif submitted.exception() is not None:
+                settle(Left(submitted.exception()))
+
+        try:
+            self.validate().begin()
+            if self.expired:
+                settle(Right(self.conclude(None)))
+            else:
+                dispatch()
+        except Exception as e:
+            settle(Left(e))
+        return future
+
+    def begin(self, counter: int = -1):
         if not isinstance(counter, int) or counter < -1:
             raise self.Invalid(f'Cannot proceed with given `counter` param value: {counter}.')
+        self._retries = counter
+        self._previous_delay: Optional[float] = None
+        self._deadline_at = monotonic() + self.deadline if self.deadline else None
+        self._abandoned: Optional[Exception] = None
 
-        for _tally in tally(1 + self.max_retries):
-            if self.expired:
-                break  # pragma: no cover
-            attempt = self.action.perform()
-            counter += _tally
-            with_delay = self.backoff.calculate(
-                counter, self.delay_between_attempts, self.jitter_percentage
-            )
-            self._retries = counter
-            if self.should_record:
-                self.attempts.append(attempt)
-            if attempt.successful:
-                outcome = attempt.value
-                if self.should_show_effort:
-                    outcome = self.Effort(*self.attempts, culmination=attempt)
-                return outcome
-            sleep(with_delay)
+    def advance(self, attempt: Result[Outcome]) -> Optional[float]:
+        self._retries = self.retries + 1
+        if self.should_record:
+            if self.retries == 0:
+                self.initial_attempt = attempt
+            self.attempts.append(attempt)
+            self.summary.record(attempt)
+        if self.budget and self.retries == 0:
+            self.budget.deposit()
+        if attempt.successful or self.expired or isinstance(attempt.value, CircuitBreaker.Open):
+            return None
+        with_delay = self.schedule.delay(self.retries, self._previous_delay)
+        if self.remaining is not None:
+            estimate = attempt.duration / 1E9 if attempt.duration is not None else 0
+            if with_delay + estimate >= self.remaining:
+                self._abandoned = RetryPolicy.DeadlineExceeded(
+                    f'Not enough time left to retry after {self.retries + 1} attempts: {self.deadline}s deadline.'
+                )
+                return None
+        if self.budget and not self.budget.withdraw():
+            self._abandoned = RetryPolicy.Exhausted(f'Retry budget exhausted after {self.retries + 1} attempts.')
+            return None
+        self._previous_delay = with_delay
+        if self.should_record:
+            self.summary.total_delay += with_delay
+        return with_delay
 
-        outcome = RetryPolicy.Expired(f'Max retries exceeded: {self.max_retries}.')
+    def conclude(self, attempt: Optional[Result[Outcome]]) -> Outcome:
+        if attempt is not None and attempt.successful:
+            outcome = attempt.value
+            if self.should_show_effort:
+                outcome = self.Effort(
+                    *self.attempts,
+                    culmination=attempt,
+                    summary=self.summary,
+                    initial_attempt=self.initial_attempt
+                )
+            return outcome
+
+        if attempt is not None and isinstance(attempt.value, CircuitBreaker.Open):
+            outcome = attempt.value
+        elif getattr(self, '_abandoned', None) is not None:
+            outcome = self._abandoned
+        else:
+            outcome = RetryPolicy.Expired(f'Max retries exceeded: {self.max_retries}.')
         if self.should_show_effort:
-            return self.Effort(*self.attempts, culmination=Result(Left(outcome)))
+            return self.Effort(
+                *self.attempts,
+                culmination=Result(Left(outcome)),
+                summary=self.summary,
+                initial_attempt=self.initial_attempt
+            )
 
         raise outcome
 
@@ -119,27 +318,278 @@ class RetryPolicy(Action[Name, Outcome]):
     class Enacted(Exception):
         pass
 
+    class Exhausted(Expired):
+        pass
+
+    class DeadlineExceeded(Expired):
+        pass
+
+    class Hedge:
+
+        def __init__(
+            self,
+            percentile: float = 95,
+            window: int = 1000,
+            minimum_samples: int = 20,
+            after: float = 1.0,
+            max_workers: int = 16,
+            factory: Optional[Callable[[Action], Action]] = None
+        ):
+            if not 0 < percentile <= 100:
+                raise ValueError(f'The percentile must be within (0, 100]. Given percentile={percentile}.')
+            if not isinstance(window, int) or window < 1:
+                raise ValueError(f'At least one latency must be kept. Given window={window}.')
+
+            self.percentile = percentile
+            self.window = window
+            self.minimum_samples = minimum_samples
+            self.after = after
+            self.max_workers = max_workers
+            self.factory = factory
+            self.latencies = deque(maxlen=window)
+            self.attempts = 0
+            self.hedges = 0
+            self.hedge_wins = 0
+            self._lock = Lock()
+
+        @property
+        def threshold(self) -> float:
+            with self._lock:
+                latencies = sorted(self.latencies)
+            if len(latencies) < self.minimum_samples:
+                return self.after
+            rank = max(math.ceil(self.percentile / 100 * len(latencies)), 1)
+            return latencies[rank - 1]
+
+        def observe(self, result: Result):
+            if result.duration is not None:
+                with self._lock:
+                    self.latencies.append(result.duration / 1E9)
+
+        def hedges_for(self, action: Action[Name, Outcome]) -> bool:
+            return self.factory is not None or getattr(action, 'idempotent', False)
+
+        def fresh(self, action: Action[Name, Outcome]) -> Action[Name, Outcome]:
+            from copy import copy
+
+            return self.factory(action) if self.factory else copy(action)
+
+        def perform(self, action: Action[Name, Outcome]) -> Result[Outcome]:
+            from concurrent.futures import FIRST_COMPLETED
+            from concurrent.futures import wait
+
+            with self._lock:
+                self.attempts += 1
+            if not self.hedges_for(action):
+                return self.settle(action.perform())
+            # attempts may perform locked Actions of their own, so the caller's locks are given up while they run
+            with Action.released():
+                pool = self.pool()
+                primary = pool.submit(action._perform)
+                done, _ = wait([primary], timeout=self.threshold)
+                if done:
+                    return self.settle(primary.result())
+
+                with self._lock:
+                    self.hedges += 1
+                hedged = pool.submit(self.fresh(action)._perform)
+                pending = {primary, hedged}
+                result = None
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        result = future.result()
+                        if result.successful:
+                            if future is hedged:
+                                with self._lock:
+                                    self.hedge_wins += 1
+                            for other in pending:
+                                other.cancel()
+                            return self.settle(result)
+                return self.settle(result)
+
+        async def perform_async(self, action: Action[Name, Outcome]) -> Result[Outcome]:
+            import asyncio
+
+            with self._lock:
+                self.attempts += 1
+            if not self.hedges_for(action):
+                return self.settle(await action.perform_async())
+            primary = asyncio.ensure_future(action.perform_async())
+            done, _ = await asyncio.wait([primary], timeout=self.threshold)
+            if done:
+                return self.settle(primary.result())
+
+            with self._lock:
+                self.hedges += 1
+            hedged = asyncio.ensure_future(self.fresh(action).perform_async())
+            pending = {primary, hedged}
+            result = None
+            try:
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        result = task.result()
+                        if result.successful:
+                            if task is hedged:
+                                with self._lock:
+                                    self.hedge_wins += 1
+                            return self.settle(result)
+                return self.settle(result)
+            finally:
+                for task in pending:
+                    task.cancel()
+
+        def settle(self, result: Result[Outcome]) -> Result[Outcome]:
+            self.observe(result)
+            return result
+
+        def pool(self) -> Executor:
+            from actionpack.executors import registry
+
+            # kept apart from the general pools, where the policy awaiting these attempts may itself be running
+            return registry.get(self.max_workers, name=self.__class__.__name__.lower())
+
+        @property
+        def metrics(self) -> Dict[str, float]:
+            return {
+                'attempts': self.attempts,
+                'hedges': self.hedges,
+                'hedge_wins': self.hedge_wins,
+                'threshold': self.threshold,
+            }
+
+        def __getstate__(self):
+            state = dict(vars(self))
+            state.pop('_lock')
+            return state
+
+        def __setstate__(self, state):
+            self.__dict__.update(state)
+            self._lock = Lock()
+
+        def __repr__(self):
+            return f'<RetryPolicy.{self.__class__.__name__}[p{self.percentile:g} after {self.threshold:.3f}s]>'
+
+    class Budget:
+
+        def __init__(
+            self,
+            ratio: float = 0.1,
+            window: float = 10,
+            minimum: int = 10,
+            slices: int = 10,
+            clock: Callable[[], float] = monotonic
+        ):
+            if ratio < 0:
+                raise ValueError(f'The retry ratio cannot be negative. Given ratio={ratio}.')
+            if window <= 0:
+                raise ValueError(f'The window must last a positive number of seconds. Given window={window}.')
+            if not isinstance(slices, int) or slices < 1:
+                raise ValueError(f'The window must have at least one slice. Given slices={slices}.')
+
+            self.ratio = ratio
+            self.window = window
+            self.minimum = minimum
+            self.slices = slices
+            self.clock = clock
+            self.deposits = 0
+            self.withdrawals = 0
+            self.rejections = 0
+            self._epochs = [-slices] * slices
+            self._attempts = [0] * slices
+            self._retries = [0] * slices
+            self._lock = Lock()
+
+        def deposit(self):
+            with self._lock:
+                self._attempts[self._slot()] += 1
+                self.deposits += 1
+
+        def withdraw(self) -> bool:
+            with self._lock:
+                slot = self._slot()
+                if self._balance() < 1:
+                    self.rejections += 1
+                    return False
+                self._retries[slot] += 1
+                self.withdrawals += 1
+                return True
+
+        @property
+        def balance(self) -> float:
+            with self._lock:
+                self._slot()
+                return self._balance()
+
+        def _slot(self) -> int:
+            epoch = int(self.clock() * self.slices / self.window)
+            slot = epoch % self.slices
+            if self._epochs[slot] != epoch:
+                self._epochs[slot] = epoch
+                self._attempts[slot] = self._retries[slot] = 0
+            self._current = epoch
+            return slot
+
+        def _balance(self) -> float:
+            live = [slot for slot, epoch in enumerate(self._epochs) if epoch > self._current - self.slices]
+            attempts = sum(self._attempts[slot] for slot in live)
+            retries = sum(self._retries[slot] for slot in live)
+            return self.minimum + self.ratio * attempts - retries
+
+        @property
+        def metrics(self) -> Dict[str, float]:
+            return {
+                'deposits': self.deposits,
+                'withdrawals': self.withdrawals,
+                'rejections': self.rejections,
+                'balance': self.balance,
+            }
+
+        def __getstate__(self):
+            state = dict(vars(self))
+            state.pop('_lock')
+            return state
+
+        def __setstate__(self, state):
+            self.__dict__.update(state)
+            self._lock = Lock()
+
+        def __repr__(self):
+            return f'<RetryPolicy.{self.__class__.__name__}[{self.ratio:.0%} of attempts over {self.window}s]>'
+
     class Backoff(Enum):
         CONSTANT = 'CONSTANT'
         LINEAR = 'LINEAR'
         EXPONENTIAL = 'EXPONENTIAL'
 
         def calculate(self, coefficient: float, base: int, jitter_percentage: float):
+            if base == 0:
+                return 0
+            jitter_fraction = (jitter_percentage / 100) * self.spread(base)
+            jitter = random.uniform(-jitter_fraction, jitter_fraction)
+            return self.delay(coefficient, base) + jitter
+
+        def delay(self, coefficient: float, base: float) -> float:
             if base == 0:
                 return 0
             factor, is_fraction = self._rectify(base)
             base = abs(factor * base if is_fraction else base)
             coefficient = abs(coefficient)
 
-            approaches = {
-                self.CONSTANT: (coefficient ** 0) * base,       # 2, 2, 2, 2, ...
-                self.LINEAR: ((coefficient + 1) ** 1) * base,   # 2, 4, 6, 8, ...
-                self.EXPONENTIAL: (base ** coefficient) * base  # 2, 4, 8, 16, ...
-            }
-            delay = approaches[self] / factor if is_fraction else approaches[self]
-            jitter_fraction = (jitter_percentage / 100) * base
-            jitter = random.uniform(-jitter_fraction, jitter_fraction)
-            return delay + jitter
+            if self is RetryPolicy.Backoff.CONSTANT:
+                delay = base                             # 2, 2, 2, 2, ...
+            elif self is RetryPolicy.Backoff.LINEAR:
+                delay = (coefficient + 1) * base         # 2, 4, 6, 8, ...
+            else:
+                delay = (base ** coefficient) * base     # 2, 4, 8, 16, ...
+            return delay / factor if is_fraction else delay
+
+        def spread(self, base: float) -> float:
+            if base == 0:
+                return 0
+            factor, is_fraction = self._rectify(base)
+            return abs(factor * base if is_fraction else base)
 
         def _rectify(self, base: float):
             order_of_magnitude = math.floor(math.log(abs(base), 10))
@@ -150,14 +600,130 @@ class RetryPolicy(Action[Name, Outcome]):
                 factor = 1
             return factor, is_fraction
 
+    class Jitter(Enum):
+        PERCENTAGE = 'PERCENTAGE'
+        FULL = 'FULL'
+        EQUAL = 'EQUAL'
+        DECORRELATED = 'DECORRELATED'
+
+    class Schedule:
+
+        def __init__(
+            self,
+            backoff: str = 'CONSTANT',
+            base: float = 0,
+            retries: int = 0,
+            max_delay: float = 3600,
+            jitter: str = 'PERCENTAGE',
+            jitter_percentage: float = 1.0
+        ):
+            self.backoff = RetryPolicy.Backoff(backoff)
+            self.jitter = RetryPolicy.Jitter(jitter)
+            self.base = min(abs(base), max_delay)
+            self.max_delay = max_delay
+            self.jitter_percentage = jitter_percentage
+            delays: List[float] = []
+            for coefficient in range(retries):
+                if delays and delays[-1] >= max_delay:
+                    delays.append(max_delay)  # every Backoff is non-decreasing
+                else:
+                    delays.append(min(self.backoff.delay(coefficient, base), max_delay))
+            self.delays: Tuple[float, ...] = tuple(delays)
+            self.spread = (jitter_percentage / 100) * self.backoff.spread(base)
+
+        def delay(self, retry: int, previous: Optional[float] = None) -> float:
+            return self.jittered(self.delays[retry], previous, random.random())
+
+        def sample(self, count: int) -> List[List[float]]:
+            uniform = random.random
+            if self.jitter is RetryPolicy.Jitter.DECORRELATED:
+                samples = []
+                for _ in range(count):
+                    previous, delays = None, []
+                    for delay in self.delays:
+                        previous = self.jittered(delay, previous, uniform())
+                        delays.append(previous)
+                    samples.append(delays)
+                return samples
+            cap = self.max_delay
+            columns = [(low, width, low >= 0 and low + width <= cap) for low, width in map(self.range, self.delays)]
+            return [
+                [
+                    low + width * uniform() if bounded else min(max(low + width * uniform(), 0), cap)
+                    for low, width, bounded in columns
+                ]
+                for _ in range(count)
+            ]
+
+        def range(self, delay: float, previous: Optional[float] = None) -> Tuple[float, float]:
+            if self.jitter is RetryPolicy.Jitter.PERCENTAGE:
+                return delay - self.spread, 2 * self.spread
+            if self.jitter is RetryPolicy.Jitter.FULL:
+                return 0, delay
+            if self.jitter is RetryPolicy.Jitter.EQUAL:
+                return delay / 2, delay / 2
+            ceiling = 3 * (previous if previous else self.base)
+            return self.base, ceiling - self.base
+
+        def jittered(self, delay: float, previous: Optional[float], fraction: float) -> float:
+            low, width = self.range(delay, previous)
+            return min(max(low + width * fraction, 0), self.max_delay)
+
+        def __len__(self):
+            return len(self.delays)
+
+        def __repr__(self):
+            return f'<RetryPolicy.{self.__class__.__name__}[{self.backoff.value}|{self.jitter.value} x {len(self)}]>'
+
+    class Summary:
+
+        def __init__(self):
+            self.count = 0
+            self.successes = 0
+            self.failures: Counter[str] = Counter()
+            self.total_delay = 0.0
+            self.total_latency = 0
+            self.min_latency: Optional[int] = None
+            self.max_latency: Optional[int] = None
+            self._measured = 0
+
+        def record(self, attempt: Result):
+            self.count += 1
+            if attempt.successful:
+                self.successes += 1
+            else:
+                self.failures[type(attempt.value).__name__] += 1
+            if attempt.duration is not None:
+                self._measured += 1
+                self.total_latency += attempt.duration
+                self.min_latency = attempt.duration if self.min_latency is None else min(self.min_latency, attempt.duration)
+                self.max_latency = attempt.duration if self.max_latency is None else max(self.max_latency, attempt.duration)
+
+        @property
+        def mean_latency(self) -> Optional[float]:
+            return self.total_latency / self._measured if self._measured else None
+
+        def __repr__(self) -> str:
+            return f'<RetryPolicy.{self.__class__.__name__}[{self.count} attempts|{sum(self.failures.values())} failed]>'
+
     class Effort:
 
-        def __init__(self, *attempts: Iterable[Result], culmination: Result):
+        def __init__(
+            self,
+            *attempts: Iterable[Result],
+            culmination: Result,
+            summary: Optional[RetryPolicy.Summary] = None,
+            initial_attempt: Optional[Result] = None
+        ):
             self.culmination: Result = culmination
+            self.summary = summary
             self.attempts: Iterable[Result] = list(attempts)
             self.initial_attempt: Result
             self.retries: Iterable[Result]
-            if any(attempts):
+            if initial_attempt is not None and attempts and initial_attempt is not attempts[0]:
+                # only the latest attempts were kept, all of them retries
+                self.initial_attempt, self.retries = initial_attempt, list(attempts)
+            elif any(attempts):
                 self.initial_attempt, *self.retries = attempts
             else:
                 self.initial_attempt, self.retries = culmination, []
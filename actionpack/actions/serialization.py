@@ -9,7 +9,7 @@ T = TypeVar('T')
 Outcome = Union[str, T]
 
 
-class Serialization(Action[Name, Outcome]):
+class Serialization(Action[Name, Outcome], pure=True):
     def __init__(self, schema=None, data=None, inverse=False):
         self.schema = schema
         self.data = data
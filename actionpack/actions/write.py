@@ -1,7 +1,10 @@
 from __future__ import annotations
 from os import sys
 from pathlib import Path
+from typing import Iterable
+from typing import Iterator
 from typing import Optional
+from typing import Union
 
 from actionpack import Action
 from actionpack.action import Name
@@ -11,7 +14,7 @@ class Write(Action[Name, int]):
     def __init__(
         self,
         filename: str,
-        to_write: str,
+        to_write: Union[bytes, str, Iterator[Union[bytes, str]]],
         prefix: Optional[str] = None,
         overwrite: bool = False,
         append: bool = False,
@@ -22,6 +25,7 @@ class Write(Action[Name, int]):
 
         if (
             prefix
+            and not isinstance(to_write, Iterator)
             and (
                 to_write_type not in acceptable_prefix_types
                 or prefix_type != to_write_type
@@ -48,6 +52,9 @@ class Write(Action[Name, int]):
             self.path = Path(filename)
 
     def instruction(self) -> str:
+        if isinstance(self.to_write, Iterator):
+            return self.write_chunks(self.to_write)
+
         if self.area:
             self.area.write(f"{self.prefix if self.prefix else ''}{self.to_write}")
             self.area.flush()
@@ -70,6 +77,38 @@ class Write(Action[Name, int]):
             self.path.write_bytes(msg) if isinstance(msg, bytes) else self.path.write_text(self.to_write)
         return str(self.path.absolute())
 
+    def write_chunks(self, chunks: Iterable[Union[bytes, str]]) -> str:
+        chunks = iter(chunks)
+        first_chunk = next(chunks, None)
+        empty = b'' if isinstance(first_chunk, bytes) or isinstance(self.prefix, bytes) else ''
+        if first_chunk is None:
+            first_chunk = empty
+        if not isinstance(first_chunk, (bytes, str)):
+            raise TypeError(f'Must be of str or bytes: {first_chunk}')
+        if self.prefix and type(self.prefix) is not type(first_chunk):
+            raise TypeError(f'Chunks to write and their prefix must be of the same type: {self.prefix}')
+
+        if self.area:
+            self.area.write(self.prefix if self.prefix else '')
+            self.area.write(first_chunk)
+            for chunk in chunks:
+                self.area.write(chunk)
+            self.area.flush()
+            return None
+
+        if self.mkdir and not self.path.is_dir():
+            self.path.resolve().parent.mkdir(parents=True, exist_ok=True)
+
+        mode = ('a' if self.append else 'w') + ('b' if isinstance(empty, bytes) else '')
+        with self.path.open(mode) as file:
+            file.write(self.prefix if self.prefix else empty)
+            file.write(first_chunk)
+            for chunk in chunks:
+                file.write(chunk)
+            if self.append:
+                file.write(b'\n' if isinstance(empty, bytes) else '\n')
+        return str(self.path.absolute())
+
     def validate(self) -> Write[Name, int]:
         if self.overwrite and self.append:
             raise ValueError('Cannot overwrite and append simultaneously')
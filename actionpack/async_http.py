@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import asyncio
+
+from datetime import timedelta
+from time import perf_counter
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    from ssl import SSLContext
+    from requests import PreparedRequest
+    from requests import Response
+
+
+Connection = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+class AsyncEngine:
+
+    def __init__(self, limit_per_host: int = 10, timeout: Optional[float] = 30, ssl: Optional[SSLContext] = None):
+        if not isinstance(limit_per_host, int) or limit_per_host < 1:
+            raise ValueError(f'At least one connection per host is required. Given limit_per_host={limit_per_host}.')
+
+        self.limit_per_host = limit_per_host
+        self.timeout = timeout
+        self.ssl = ssl
+        self.requests = 0
+        self.opened = 0
+        self.reused = 0
+        self._hosts: Dict[Tuple[str, str, int], AsyncEngine.Host] = {}
+
+    async def send(self, request: PreparedRequest) -> Response:
+        parts = urlsplit(request.url)
+        if parts.scheme not in ('http', 'https'):
+            raise ValueError(f'Unsupported URL scheme: {parts.scheme}')
+        port = parts.port or (443 if parts.scheme == 'https' else 80)
+        host = self.host_for(parts.scheme, parts.hostname, port)
+
+        async with host.semaphore:
+            self.requests += 1
+            return await asyncio.wait_for(self.attempt(host, request, parts, perf_counter()), self.timeout)
+
+    async def attempt(self, host: AsyncEngine.Host, request: PreparedRequest, parts, started: float) -> Response:
+        from actionpack.actions.make_request import MakeRequest
+
+        while True:
+            connection, reused = await self.acquire(host)
+            try:
+                status, reason, headers, body, reusable = await self.exchange(connection, request, parts)
+            except (ConnectionError, asyncio.IncompleteReadError) as e:
+                self.discard(connection)
+                if reused and request.method in MakeRequest.idempotent_methods:
+                    continue  # the server likely closed an idle connection; resending cannot repeat an effect
+                raise e
+            except BaseException as e:
+                self.discard(connection)
+                raise e
+            if reusable:
+                host.idle.append(connection)
+            else:
+                self.discard(connection)
+            return self.respond(request, status, reason, headers, body, perf_counter() - started)
+
+    def host_for(self, scheme: str, hostname: str, port: int) -> AsyncEngine.Host:
+        key = (scheme, hostname, port)
+        host = self._hosts.get(key)
+        if host is None:
+            host = self._hosts[key] = AsyncEngine.Host(scheme, hostname, port, self.limit_per_host)
+        return host
+
+    async def acquire(self, host: AsyncEngine.Host) -> Tuple[Connection, bool]:
+        while host.idle:
+            connection = host.idle.pop()
+            reader, writer = connection
+            if not writer.is_closing() and not reader.at_eof():
+                self.reused += 1
+                return connection, True
+            self.discard(connection)
+        if host.scheme == 'https':
+            connection = await asyncio.open_connection(
+                host.hostname, host.port, ssl=self.ssl if self.ssl else True, server_hostname=host.hostname
+            )
+        else:
+            connection = await asyncio.open_connection(host.hostname, host.port)
+        self.opened += 1
+        return connection, False
+
+    @staticmethod
+    def discard(connection: Connection):
+        _, writer = connection
+        writer.close()
+
+    async def exchange(self, connection: Connection, request: PreparedRequest, parts) -> Tuple:
+        reader, writer = connection
+        writer.write(self.serialize(request, parts))
+        await writer.drain()
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError('Connection closed before a response was received.')
+        version, status, reason = self.parse_status(status_line)
+        while 100 <= status < 200:
+            await self.read_headers(reader)
+            version, status, reason = self.parse_status(await reader.readline())
+        headers = await self.read_headers(reader)
+
+        connection_header = headers.get('Connection', '').lower()
+        reusable = version == 'HTTP/1.1' and connection_header != 'close' or connection_header == 'keep-alive'
+        if request.method == 'HEAD' or status in (204, 304):
+            body = b''
+        elif 'chunked' in headers.get('Transfer-Encoding', '').lower():
+            body = await self.read_chunks(reader)
+        elif 'Content-Length' in headers:
+            body = await reader.readexactly(int(headers['Content-Length']))
+        else:
+            body, reusable = await reader.read(), False
+        return status, reason, headers, body, reusable
+
+    @staticmethod
+    def serialize(request: PreparedRequest, parts) -> bytes:
+        from requests.utils import default_user_agent
+
+        target = parts.path if parts.path else '/'
+        if parts.query:
+            target = f'{target}?{parts.query}'
+        body = request.body.encode() if isinstance(request.body, str) else request.body or b''
+        headers = {
+            'Host': parts.netloc,
+            'User-Agent': default_user_agent(),
+            'Accept': '*/*',
+            'Accept-Encoding': 'identity',
+            'Connection': 'keep-alive',
+        }
+        headers.update(request.headers)
+        if body and 'Content-Length' not in headers:
+            headers['Content-Length'] = str(len(body))
+        lines = [f'{request.method} {target} HTTP/1.1'] + [f'{name}: {value}' for name, value in headers.items()]
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body
+
+    @staticmethod
+    def parse_status(line: bytes) -> Tuple[str, int, str]:
+        version, status, *reason = line.decode('latin-1').strip().split(' ', 2)
+        return version, int(status), reason[0] if reason else ''
+
+    @staticmethod
+    async def read_headers(reader: asyncio.StreamReader):
+        from requests.structures import CaseInsensitiveDict
+
+        headers = CaseInsensitiveDict()
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                return headers
+            name, _, value = line.decode('latin-1').partition(':')
+            name, value = name.strip(), value.strip()
+            headers[name] = f'{headers[name]}, {value}' if name in headers else value
+
+    @staticmethod
+    async def read_chunks(reader: asyncio.StreamReader) -> bytes:
+        chunks: List[bytes] = []
+        while True:
+            size = int((await reader.readline()).split(b';')[0].strip(), 16)
+            if size == 0:
+                while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                    pass  # trailers
+                return b''.join(chunks)
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+
+    @staticmethod
+    def respond(request: PreparedRequest, status: int, reason: str, headers, body: bytes, elapsed: float) -> Response:
+        from requests import Response
+        from requests.utils import get_encoding_from_headers
+
+        response = Response()
+        response.status_code = status
+        response.reason = reason
+        response.headers = headers
+        response.encoding = get_encoding_from_headers(headers)
+        response.url = request.url
+        response.request = request
+        response.elapsed = timedelta(seconds=elapsed)
+        response._content = body
+        return response
+
+    async def close(self):
+        hosts, self._hosts = list(self._hosts.values()), {}
+        for host in hosts:
+            while host.idle:
+                _, writer = host.idle.pop()
+                writer.close()
+                try:
+                    await writer.wait_closed()
+                except (ConnectionError, OSError):
+                    pass
+
+    @property
+    def metrics(self) -> Dict[str, int]:
+        return {
+            'hosts': len(self._hosts),
+            'requests': self.requests,
+            'opened': self.opened,
+            'reused': self.reused,
+        }
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}[{len(self._hosts)} hosts|{self.limit_per_host} connections each]>'
+
+    class Host:
+
+        def __init__(self, scheme: str, hostname: str, port: int, limit: int):
+            self.scheme = scheme
+            self.hostname = hostname
+            self.port = port
+            self.semaphore = asyncio.Semaphore(limit)
+            self.idle: List[Connection] = []
+
+        def __repr__(self):
+            return f'<AsyncEngine.{self.__class__.__name__}[{self.scheme}://{self.hostname}:{self.port}]>'
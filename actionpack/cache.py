@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from hashlib import sha256
+from pathlib import Path
+from threading import RLock
+from time import time
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from actionpack.utils import pickleable
+
+
+def fingerprint(obj: Any) -> Optional[str]:
+    payload = pickleable(obj)
+    return sha256(payload).hexdigest() if payload is not None else None
+
+
+class Cache:
+
+    missing = object()
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: Optional[float] = None,
+        directory: Optional[Union[str, Path]] = None,
+        clock: Callable[[], float] = time
+    ):
+        if not isinstance(maxsize, int) or maxsize < 1:
+            raise ValueError(f'A Cache must hold at least one entry. Given maxsize={maxsize}.')
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f'Entries must live for a positive number of seconds. Given ttl={ttl}.')
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.directory = Path(directory) if directory else None
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: Dict[str, Tuple[Optional[float], Any]] = OrderedDict()
+        self._stored: Dict[str, Optional[float]] = OrderedDict()  # expiry of each file on disk, oldest first
+        self._lock = RLock()
+
+        if self.directory:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._index()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None and self.directory:
+                entry = self._load(key)
+                if entry is not None:
+                    self._remember(key, entry)
+                    self._stored[key] = entry[0]
+            if key in self._stored:
+                self._stored.move_to_end(key)
+            if entry is not None and self._expired(entry):
+                self._forget(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> Any:
+        ttl = ttl if ttl is not None else self.ttl
+        entry = (self.clock() + ttl if ttl is not None else None, value)
+        with self._lock:
+            self._remember(key, entry)
+            if self.directory:
+                self._store(key, entry)
+        return value
+
+    def delete(self, key: str):
+        with self._lock:
+            self._forget(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._stored.clear()
+            if self.directory:
+                for path in self.directory.glob('*.cache'):
+                    path.unlink()
+
+    def purge(self) -> int:
+        with self._lock:
+            expired = {key for key, entry in self._entries.items() if self._expired(entry)}
+            expired |= {key for key, expires_at in self._stored.items() if self._expired((expires_at, None))}
+            for key in expired:
+                self._forget(key)
+            return len(expired)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self),
+        }
+
+    def _expired(self, entry: Tuple[Optional[float], Any]) -> bool:
+        expires_at, _ = entry
+        return expires_at is not None and expires_at <= self.clock()
+
+    def _remember(self, key: str, entry: Tuple[Optional[float], Any]):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _forget(self, key: str):
+        self._entries.pop(key, None)
+        if self.directory:
+            self._stored.pop(key, None)
+            self._unlink(key)
+
+    def _index(self):
+        def modified_at(path: Path) -> float:
+            try:
+                return path.stat().st_mtime
+            except FileNotFoundError:
+                return 0
+
+        for path in sorted(self.directory.glob('*.cache'), key=modified_at):
+            entry = self._load(path.stem)
+            if entry is None or self._expired(entry):
+                self._unlink(path.stem)
+            else:
+                self._stored[path.stem] = entry[0]
+        self._shrink()
+
+    def _shrink(self):
+        if len(self._stored) <= self.maxsize:
+            return
+        for key in [key for key, expires_at in self._stored.items() if self._expired((expires_at, None))]:
+            self._forget(key)
+        while len(self._stored) > self.maxsize:
+            key, _ = self._stored.popitem(last=False)
+            self._unlink(key)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f'{key}.cache'
+
+    def _load(self, key: str) -> Optional[Tuple[Optional[float], Any]]:
+        import pickle
+
+        try:
+            return pickle.loads(self._path(key).read_bytes())
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+    def _store(self, key: str, entry: Tuple[Optional[float], Any]):
+        payload = pickleable(entry)
+        if payload is not None:
+            self._path(key).write_bytes(payload)
+            self._stored[key] = entry[0]
+            self._stored.move_to_end(key)
+            self._shrink()
+
+    def _unlink(self, key: str):
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, Cache.missing) is not Cache.missing
+
+    def __getstate__(self):
+        state = dict(vars(self))
+        state.pop('_lock')
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = RLock()
+
+    def __repr__(self):
+        tier = f'|{self.directory}' if self.directory else ''
+        return f'<{self.__class__.__name__}[{len(self)}/{self.maxsize}{tier}]>'
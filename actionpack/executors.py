@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+import atexit
+import logging
+
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from heapq import heappop
+from heapq import heappush
+from itertools import count
+from threading import Condition
+from threading import Lock
+from threading import RLock
+from threading import Thread
+from threading import local
+from time import monotonic
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+
+logger = logging.getLogger(__name__)
+_worker = local()
+
+
+def nesting() -> int:  # how many instrumented pools the current thread runs within
+    return getattr(_worker, 'nesting', 0)
+
+
+class InstrumentedThreadPoolExecutor(ThreadPoolExecutor):
+
+    def __init__(self, max_workers: int = None, *args, nesting: int = 0, **kwargs):
+        super().__init__(max_workers, *args, **kwargs)
+        self.nesting = nesting
+        self._counter_lock = Lock()
+        self.submitted = 0
+        self.completed = 0
+        self.active = 0
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        with self._counter_lock:
+            self.submitted += 1
+        return super().submit(self._instrumented, fn, *args, **kwargs)
+
+    def _instrumented(self, fn: Callable, *args, **kwargs):
+        with self._counter_lock:
+            self.active += 1
+        outer, _worker.nesting = nesting(), self.nesting + 1
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _worker.nesting = outer
+            with self._counter_lock:
+                self.active -= 1
+                self.completed += 1
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    @property
+    def queue_depth(self) -> int:
+        return self._work_queue.qsize()
+
+    @property
+    def utilization(self) -> float:
+        return self.active / self._max_workers
+
+    @property
+    def is_shutdown(self) -> bool:
+        return self._shutdown
+
+    @property
+    def metrics(self) -> Dict[str, float]:
+        return {
+            'max_workers': self.max_workers,
+            'submitted': self.submitted,
+            'completed': self.completed,
+            'active': self.active,
+            'queue_depth': self.queue_depth,
+            'utilization': self.utilization,
+        }
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}[{self.active}/{self.max_workers} active|{self.queue_depth} queued]>'
+
+
+class InstrumentedProcessPoolExecutor(ProcessPoolExecutor):
+
+    def __init__(self, max_workers: int = None, *args, **kwargs):
+        super().__init__(max_workers, *args, **kwargs)
+        self._counter_lock = Lock()
+        self.submitted = 0
+        self.completed = 0
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        future = super().submit(fn, *args, **kwargs)
+        with self._counter_lock:
+            self.submitted += 1
+        future.add_done_callback(self._complete)
+        return future
+
+    def _complete(self, future: Future):
+        with self._counter_lock:
+            self.completed += 1
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    @property
+    def pending(self) -> int:
+        return self.submitted - self.completed
+
+    @property
+    def is_shutdown(self) -> bool:
+        return self._shutdown_thread
+
+    @property
+    def metrics(self) -> Dict[str, float]:
+        return {
+            'max_workers': self.max_workers,
+            'submitted': self.submitted,
+            'completed': self.completed,
+            'pending': self.pending,
+        }
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}[{self.pending} pending|{self.max_workers} processes]>'
+
+
+Instrumented = Union[InstrumentedThreadPoolExecutor, InstrumentedProcessPoolExecutor]
+
+
+class ExecutorRegistry:
+
+    def __init__(self, thread_name_prefix: str = 'actionpack'):
+        self.thread_name_prefix = thread_name_prefix
+        self._executors: Dict[Tuple[str, int], Instrumented] = {}
+        self._lock = RLock()
+
+    def get(self, max_workers: int = 5, processes: bool = False, name: Optional[str] = None) -> Instrumented:
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise ValueError(f'An executor must have at least one worker. Given max_workers={max_workers}.')
+
+        # work submitted from a pooled thread gets pools of its own, so it never queues behind the thread awaiting it
+        level = nesting()
+        kind = 'process' if processes else 'thread'
+        label = '-'.join(filter(None, (name, kind, f'nested{level}' if level else None)))
+        key = (label, max_workers)
+        with self._lock:
+            executor = self._executors.get(key)
+            if executor is None or executor.is_shutdown:
+                if processes:
+                    executor = InstrumentedProcessPoolExecutor(max_workers=max_workers)
+                else:
+                    nested = f'nested{level}' if level else None
+                    executor = InstrumentedThreadPoolExecutor(
+                        max_workers=max_workers,
+                        thread_name_prefix='-'.join(
+                            filter(None, (self.thread_name_prefix, name, nested, str(max_workers)))
+                        ),
+                        nesting=level
+                    )
+                self._executors[key] = executor
+            return executor
+
+    def shutdown(self, wait: bool = True):
+        with self._lock:
+            executors, self._executors = list(self._executors.values()), {}
+        for executor in executors:
+            executor.shutdown(wait=wait)
+
+    @property
+    def metrics(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {f'{kind}-{size}': executor.metrics for (kind, size), executor in self._executors.items()}
+
+    def __len__(self):
+        return len(self._executors)
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}[{", ".join(f"{kind}-{size}" for kind, size in self._executors)}]>'
+
+
+class TimerScheduler:
+
+    def __init__(self, thread_name: str = 'actionpack-timers'):
+        self.thread_name = thread_name
+        self.scheduled = 0
+        self.fired = 0
+        self.failed = 0
+        self._timers: List[TimerScheduler.Timer] = []
+        self._sequence = count()
+        self._condition = Condition()
+        self._thread: Optional[Thread] = None
+        self._shutdown = False
+
+    def call_later(self, delay: float, callback: Callable, *args) -> TimerScheduler.Timer:
+        timer = TimerScheduler.Timer(monotonic() + max(delay, 0), next(self._sequence), callback, args)
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError('Cannot schedule new timers after shutdown.')
+            heappush(self._timers, timer)
+            self.scheduled += 1
+            if self._thread is None:
+                self._thread = Thread(target=self._run, name=self.thread_name, daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return timer
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while True:
+                    if self._shutdown:
+                        return
+                    if not self._timers:
+                        self._condition.wait()
+                        continue
+                    remaining = self._timers[0].when - monotonic()
+                    if remaining <= 0:
+                        timer = heappop(self._timers)
+                        break
+                    self._condition.wait(remaining)
+            if not timer.cancelled:
+                self.fired += 1
+                try:
+                    timer.callback(*timer.args)
+                except Exception:
+                    self.failed += 1
+                    logger.exception('Timer callback %r failed.', timer.callback)
+
+    def shutdown(self, wait: bool = True):
+        with self._condition:
+            self._shutdown = True
+            self._timers.clear()
+            self._condition.notify()
+            thread = self._thread
+        if wait and thread is not None:
+            thread.join()
+
+    @property
+    def pending(self) -> int:
+        return sum(1 for timer in self._timers if not timer.cancelled)
+
+    @property
+    def metrics(self) -> Dict[str, int]:
+        return {
+            'scheduled': self.scheduled,
+            'fired': self.fired,
+            'failed': self.failed,
+            'pending': self.pending,
+        }
+
+    def __len__(self):
+        return self.pending
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}[{self.pending} pending]>'
+
+    class Timer:
+
+        __slots__ = ('when', 'sequence', 'callback', 'args', 'cancelled')
+
+        def __init__(self, when: float, sequence: int, callback: Callable, args: Tuple[Any, ...]):
+            self.when = when
+            self.sequence = sequence
+            self.callback = callback
+            self.args = args
+            self.cancelled = False
+
+        def cancel(self):
+            self.cancelled = True
+
+        def __lt__(self, other: TimerScheduler.Timer) -> bool:
+            return (self.when, self.sequence) < (other.when, other.sequence)
+
+
+registry = ExecutorRegistry()
+atexit.register(registry.shutdown)
+
+timers = TimerScheduler()
+atexit.register(timers.shutdown)
@@ -1,55 +1,182 @@
-from concurrent.futures import ThreadPoolExecutor
-from concurrent.futures import as_completed
+from __future__ import annotations
 from functools import reduce
 from itertools import islice
 from itertools import tee
+from typing import AsyncIterator
 from typing import Generic
 from typing import Iterator
 from typing import Iterable
+from typing import List
+from typing import Optional
 from typing import Tuple
+from typing import TYPE_CHECKING
 
 from actionpack.action import Name
 from actionpack.action import Outcome
 from actionpack.action import Result
 from actionpack import Action
+from actionpack.utils import first
+from actionpack.utils import pickleable
+
+if TYPE_CHECKING:
+    from asyncio import Future as Task
+    from concurrent.futures import Executor
+    from concurrent.futures import Future
+
+
+def perform_pickled(payloads: List[bytes], should_raise: bool = False) -> List[Result[Outcome]]:
+    import pickle
+
+    return Action.perform_batch([pickle.loads(payload) for payload in payloads], should_raise=should_raise)
+
+
+def ship(action: Action[Name, Outcome]) -> bytes:
+    payload = pickleable(action)
+    if payload is None:
+        raise Procedure.NotPickleable(f'Cannot send to another process: {str(action)}')
+    return payload
+
+
+def stream(
+    actions: Iterable[Action[Name, Outcome]],
+    executor: Executor,
+    max_in_flight: int,
+    should_raise: bool = False,
+    processes: bool = False,
+    chunksize: int = 1
+) -> Iterator[Tuple[Action[Name, Outcome], Result[Outcome]]]:
+    if not isinstance(max_in_flight, int) or max_in_flight < 1:
+        raise ValueError(f'At least one Action must be in flight. Given max_in_flight={max_in_flight}.')
+    if not isinstance(chunksize, int) or chunksize < 1:
+        raise ValueError(f'Chunks must contain at least one Action. Given chunksize={chunksize}.')
+
+    from concurrent.futures import FIRST_COMPLETED
+    from concurrent.futures import wait
+
+    def submit(chunk: List[Action[Name, Outcome]]) -> Future:
+        if processes:
+            return executor.submit(perform_pickled, [ship(action) for action in chunk], should_raise)
+        if chunksize == 1:
+            return first(chunk).submit(executor, should_raise)
+        return executor.submit(Action.perform_batch, chunk, should_raise)
+
+    def collect(future: Future) -> List[Result[Outcome]]:
+        results = future.result()
+        return results if processes or chunksize > 1 else [results]
+
+    actions = iter(actions)
+    chunks = iter(lambda: list(islice(actions, chunksize)), [])
+    in_flight = {submit(chunk): chunk for chunk in islice(chunks, max_in_flight)}
+    while in_flight:
+        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+        for future in done:
+            chunk = in_flight.pop(future)
+            for next_chunk in islice(chunks, 1):
+                in_flight[submit(next_chunk)] = next_chunk
+            yield from zip(chunk, collect(future))
+
+
+async def stream_async(
+    actions: Iterable[Action[Name, Outcome]],
+    max_concurrency: int,
+    should_raise: bool = False
+) -> AsyncIterator[Tuple[Action[Name, Outcome], Result[Outcome]]]:
+    if not isinstance(max_concurrency, int) or max_concurrency < 1:
+        raise ValueError(f'At least one Action must be in flight. Given max_concurrency={max_concurrency}.')
+
+    import asyncio
+
+    def schedule(action: Action[Name, Outcome]) -> Task:
+        return asyncio.ensure_future(action.perform_async(should_raise=should_raise))
+
+    actions = iter(actions)
+    in_flight = {schedule(action): action for action in islice(actions, max_concurrency)}
+    try:
+        while in_flight:
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                action = in_flight.pop(task)
+                for next_action in islice(actions, 1):
+                    in_flight[schedule(next_action)] = next_action
+                yield action, task.result()
+    finally:
+        for task in in_flight:
+            task.cancel()
 
 
 class Procedure(Generic[Name, Outcome]):
 
-    def __init__(self, actions: Iterable[Action[Name, Outcome]]):
+    def __init__(self, actions: Iterable[Action[Name, Outcome]], streaming: bool = False):
         if not (isinstance(actions, Iterator) or isinstance(actions, Iterable)):
             raise TypeError(f'Actions must be iterable. Received {type(actions).__name__}.')
 
-        self.actions, self._actions, self.__actions = tee(actions, 3)
+        self.streaming = streaming
+        self.should_validate = False
+        if streaming:
+            self.actions = self._actions = self.__actions = iter(actions)
+        else:
+            self.actions, self._actions, self.__actions = tee(actions, 3)
+
+    def check(self, action: Action[Name, Outcome]) -> Action[Name, Outcome]:
+        if not isinstance(action, Action):
+            msg = f'Procedures can only execute Actions: {str(action)}'
+            raise Procedure.NotAnAction(msg)
+        return action
 
     def validate(self):
+        if self.streaming:
+            self.should_validate = True
+            return self
+
         actions, spare = tee(self.__actions, 2)
         self.__actions = spare
         for action in actions:
-            if not isinstance(action, Action):
-                msg = f'Procedures can only execute Actions: {str(action)}'
-                raise Procedure.NotAnAction(msg)
+            self.check(action)
         return self
 
+    def pending(self) -> Iterator[Action[Name, Outcome]]:
+        if self.streaming:
+            return map(self.check, self._actions) if self.should_validate else self._actions
+
+        actions, spare = tee(self._actions, 2)
+        self._actions = spare
+        return actions
+
     def execute(
         self,
         max_workers: int = 5,
         should_raise: bool = False,
-        synchronously: bool = True
+        synchronously: bool = True,
+        executor: Optional[Executor] = None,
+        max_in_flight: Optional[int] = None,
+        processes: bool = False,
+        chunksize: int = 1
     ) -> Iterator[Result[Outcome]]:
-        actions, spare = tee(self._actions, 2)
-        self._actions = spare
+        actions = self.pending()
         if synchronously:
             for action in actions:
                 yield action.perform(should_raise=should_raise) if should_raise else action.perform()
         else:
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                futures = {executor.submit(action._perform, should_raise=should_raise): str(action) for action in actions}
-                for future in as_completed(futures):
-                    yield future.result()
+            from actionpack.executors import registry
+
+            executor = executor if executor else registry.get(max_workers, processes=processes)
+            max_in_flight = max_in_flight if max_in_flight else 2 * max_workers
+            for _, result in stream(actions, executor, max_in_flight, should_raise, processes, chunksize):
+                yield result
         return True
 
+    async def execute_async(
+        self,
+        max_concurrency: int = 100,
+        should_raise: bool = False
+    ) -> AsyncIterator[Result[Outcome]]:
+        async for _, result in stream_async(self.pending(), max_concurrency, should_raise):
+            yield result
+
     def __repr__(self):
+        if self.streaming:
+            return '\nProcedure for performing a stream of Actions\n'
+
         actions, spare = tee(self.actions, 2)
         self.actions = spare
         limit = 5
@@ -78,42 +205,49 @@ class Procedure(Generic[Name, Outcome]):
     class NotAnAction(Exception):
         pass
 
+    class NotPickleable(Exception):
+        pass
 
-class KeyedProcedure(Procedure[Name, Outcome]):
-
-    def __init__(self, actions: Iterable[Action[Name, Outcome]]):
-        if not (isinstance(actions, Iterator) or isinstance(actions, Iterable)):
-            raise TypeError(f'Actions must be iterable. Received {type(actions)}.')
 
-        self.actions, self._actions, self.__actions = tee(actions, 3)
+class KeyedProcedure(Procedure[Name, Outcome]):
 
-    def validate(self):
-        actions, spare = tee(self.__actions, 2)
-        self.__actions = spare
-        for action in actions:
-            if not isinstance(action, Action):
-                msg = f'Procedures can only execute Actions: {str(action)}'
-                raise Procedure.NotAnAction(msg)
-            if action.name is None:
-                msg = f'All {self.__class__.__name__} Actions must have a name: {str(action)}'
-                raise KeyedProcedure.UnnamedAction(msg)
-        return self
+    def check(self, action: Action[Name, Outcome]) -> Action[Name, Outcome]:
+        super().check(action)
+        if action.name is None:
+            msg = f'All {self.__class__.__name__} Actions must have a name: {str(action)}'
+            raise KeyedProcedure.UnnamedAction(msg)
+        return action
 
     def execute(
         self,
         max_workers: int = 5,
         should_raise: bool = False,
-        synchronously: bool = True
+        synchronously: bool = True,
+        executor: Optional[Executor] = None,
+        max_in_flight: Optional[int] = None,
+        processes: bool = False,
+        chunksize: int = 1
     ) -> Iterator[Tuple[Name, Result[Outcome]]]:
+        actions = self.pending()
         if synchronously:
-            for action in self:
+            for action in actions:
                 yield (action.name, action.perform(should_raise=should_raise)) \
                       if should_raise else (action.name, action.perform())
         else:
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                futures = {executor.submit(action._perform, should_raise=should_raise): action for action in self}
-                for future in as_completed(futures):
-                    yield (futures[future].name, future.result())
+            from actionpack.executors import registry
+
+            executor = executor if executor else registry.get(max_workers, processes=processes)
+            max_in_flight = max_in_flight if max_in_flight else 2 * max_workers
+            for action, result in stream(actions, executor, max_in_flight, should_raise, processes, chunksize):
+                yield (action.name, result)
+
+    async def execute_async(
+        self,
+        max_concurrency: int = 100,
+        should_raise: bool = False
+    ) -> AsyncIterator[Tuple[Name, Result[Outcome]]]:
+        async for action, result in stream_async(self.pending(), max_concurrency, should_raise):
+            yield (action.name, result)
 
     class UnnamedAction(Exception):
         pass
@@ -1,16 +1,26 @@
-import pickle
+from __future__ import annotations
 
-from calendar import timegm
-from datetime import datetime
 from functools import wraps
+from queue import Empty
+from queue import Full
+from queue import Queue
+from threading import Event
+from threading import RLock
+from threading import Thread
+from time import time_ns
 from typing import Callable
 from typing import Dict
 from typing import Generic
 from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import TYPE_CHECKING
 from typing import TypeVar
 
+if TYPE_CHECKING:
+    from datetime import datetime
+
 
 T = TypeVar('T')
 
@@ -40,6 +50,22 @@ class Closure(Generic[T]):
         pass
 
 
+class LockStripe:
+    def __init__(self, size: int = 64):
+        if not isinstance(size, int) or size < 1:
+            raise ValueError(f'A LockStripe must have at least one lock. Given size={size}.')
+        self.locks = tuple(RLock() for _ in range(size))
+
+    def __getitem__(self, key) -> RLock:
+        return self.locks[hash((key,)) % len(self.locks)]
+
+    def __len__(self):
+        return len(self.locks)
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}[{len(self)}]>'
+
+
 def tally(num=1):
     while (num if num > 0 else -1 * num) > 0:
         yield 1 if num > 0 else -1
@@ -47,12 +73,18 @@ def tally(num=1):
 
 
 def pickleable(obj) -> Optional[bytes]:
+    import pickle
+
     try:
         return pickle.dumps(obj)
     except Exception:
         pass
 
 
+def isawaitable(obj) -> bool:
+    return hasattr(obj, '__await__')
+
+
 def synchronized(lock):
     def wrap(f):
         @wraps(f)
@@ -63,6 +95,45 @@ def synchronized(lock):
     return wrap
 
 
+def prefetch(iterable: Iterable[T], buffersize: int = 1, poll_interval: float = 0.1) -> Iterator[T]:
+    if not isinstance(buffersize, int) or buffersize < 1:
+        raise ValueError(f'At least one item must be buffered. Given buffersize={buffersize}.')
+
+    buffer, stopped, exhausted = Queue(maxsize=buffersize), Event(), object()
+
+    def put(item):
+        while not stopped.is_set():
+            try:
+                return buffer.put(item, timeout=poll_interval)
+            except Full:
+                continue
+
+    def produce():
+        try:
+            for item in iterable:
+                put((item, None))
+                if stopped.is_set():
+                    return
+            put((exhausted, None))
+        except Exception as e:
+            put((exhausted, e))
+
+    Thread(target=produce, daemon=True).start()
+    try:
+        while True:
+            try:
+                item, failure = buffer.get(timeout=poll_interval)
+            except Empty:
+                continue
+            if item is exhausted:
+                if failure:
+                    raise failure
+                return
+            yield item
+    finally:
+        stopped.set()
+
+
 def first(iterable: Iterable):
     return iterable[0]
 
@@ -83,6 +154,11 @@ def swap(lst: List, idx1: int, idx2: int) -> List:
     return lst
 
 
-def microsecond_timestamp(clock: Callable[[], datetime] = datetime.utcnow) -> int:
+def microsecond_timestamp(clock: Optional[Callable[[], datetime]] = None) -> int:
+    if clock is None:
+        return time_ns() // 1000
+
+    from calendar import timegm
+
     now = clock()
     return int(timegm(now.timetuple()) * 1e6 + now.microsecond)
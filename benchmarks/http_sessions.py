@@ -0,0 +1,75 @@
+"""
+Requests/sec of MakeRequest against a local HTTP/1.1 server with a fresh session per request vs. pooled sessions.
+
+    python -m benchmarks.http_sessions
+"""
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from threading import Thread
+from time import perf_counter
+
+from actionpack import Procedure
+from actionpack.actions import MakeRequest
+from actionpack.actions.make_request import SessionPool
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    connections = 0
+
+    def setup(self):
+        super().setup()
+        Handler.connections += 1
+
+    def do_GET(self):
+        body = b'sup'
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class Unpooled(SessionPool):
+    @contextmanager
+    def lease(self, url: str):
+        session = self.create()
+        try:
+            yield session
+        finally:
+            session.close()
+
+
+def throughput(url: str, requests: int, max_workers: int) -> float:
+    actions = [MakeRequest('GET', url) for _ in range(requests)]
+    start = perf_counter()
+    results = list(Procedure(actions).execute(max_workers=max_workers, synchronously=False, should_raise=True))
+    elapsed = perf_counter() - start
+    assert all(result.value.status_code == 200 for result in results)
+    return requests / elapsed
+
+
+def main(requests: int = 2_000, max_workers: int = 8):
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    httpd.daemon_threads = True
+    Thread(target=httpd.serve_forever, daemon=True).start()
+    url = f'http://127.0.0.1:{httpd.server_port}/'
+
+    print(f'{requests} GETs on {max_workers} workers')
+    try:
+        for name, pool in (('fresh', Unpooled()), ('pooled', SessionPool(pool_size=max_workers))):
+            MakeRequest.sessions, Handler.connections = pool, 0
+            rate = throughput(url, requests, max_workers)
+            print(f'{name:<10}{rate:>10.0f} requests/sec{Handler.connections:>8} connections')
+            pool.close()
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+Cold import cost of actionpack, measured with `python -X importtime`.
+
+    python -m benchmarks.import_time
+
+Exits non-zero if an import exceeds its budget (microseconds; scaled by the
+IMPORT_BUDGET_SCALE environment variable) or eagerly loads a heavy dependency.
+"""
+import sys
+
+from os import environ as envvar
+from subprocess import PIPE
+from subprocess import run
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+
+BUDGET_SCALE = float(envvar.get('IMPORT_BUDGET_SCALE', '1.0'))
+BUDGETS = {
+    'import actionpack': 2_000,
+    'import actionpack.action': 40_000,
+    'import actionpack.procedure': 50_000,
+    'import actionpack.actions.read': 40_000,
+}
+DEFERRED = (
+    'asyncio',
+    'concurrent.futures',
+    'inspect',
+    'pickle',
+    'subprocess',
+    'validators',
+)
+RUNS = 5
+
+
+def importtime(statement: str) -> Tuple[int, List[str]]:
+    probe = f'{statement}; import sys; print(",".join(sys.modules))'
+    result = run([sys.executable, '-X', 'importtime', '-c', probe], stdout=PIPE, stderr=PIPE, check=True)
+    baseline = set(run([sys.executable, '-c', 'import sys; print(",".join(sys.modules))'], stdout=PIPE).stdout.decode().strip().split(','))
+    loaded = set(result.stdout.decode().strip().split(',')) - baseline
+
+    total, seen_site = 0, False
+    for line in result.stderr.decode().splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if name.strip() == 'site':
+            seen_site = True
+            continue
+        if seen_site and not name[1:].startswith(' '):
+            total += int(cumulative)
+    return total, sorted(module for module in DEFERRED if module in loaded)
+
+
+def measure() -> Dict[str, Tuple[int, List[str]]]:
+    measurements = {}
+    for statement in BUDGETS:
+        runs = [importtime(statement) for _ in range(RUNS)]
+        measurements[statement] = min(elapsed for elapsed, _ in runs), runs[0][1]
+    return measurements
+
+
+def main():
+    failures = []
+    print(f"{'statement':<40}{'best (us)':>12}{'budget (us)':>14}")
+    for statement, (elapsed, eager) in measure().items():
+        budget = int(BUDGETS[statement] * BUDGET_SCALE)
+        print(f'{statement:<40}{elapsed:>12}{budget:>14}')
+        if elapsed > budget:
+            failures.append(f'{statement} took {elapsed}us (budget: {budget}us)')
+        if eager:
+            failures.append(f'{statement} eagerly imported: {", ".join(eager)}')
+
+    if failures:
+        print('\n'.join(['', 'Import time regressed:'] + [f'  * {failure}' for failure in failures]))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+"""
+Throughput of concurrently performed Actions under each Action.Locking mode.
+
+    python -m benchmarks.lock_contention
+"""
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from time import sleep
+
+from actionpack import Action
+from actionpack.action import Name
+
+
+class Nap(Action[Name, float]):
+    def __init__(self, duration: float):
+        self.duration = duration
+
+    def instruction(self) -> float:
+        sleep(self.duration)
+        return self.duration
+
+
+def throughput(locking: str, threads: int, actions: int = 64, duration: float = 0.005) -> float:
+    action_type = type(f'{locking.title()}Nap', (Nap,), {'locking': locking})
+    batch = [action_type(duration) for _ in range(actions)]
+    start = perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(lambda action: action.perform(), batch))
+    return actions / (perf_counter() - start)
+
+
+def main():
+    thread_counts = (1, 2, 4, 8, 16)
+    print(f"{'locking':<10}" + ''.join(f'{n:>10}' for n in thread_counts) + '  (actions/sec by thread count)')
+    for locking in Action.Locking:
+        rates = [throughput(locking.value, n) for n in thread_counts]
+        print(f'{locking.value:<10}' + ''.join(f'{rate:>10.0f}' for rate in rates))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""
+Per-input cost of a Pipeline built and introspected per input vs. a compiled, reused Plan.
+
+    python -m benchmarks.pipeline_plan
+"""
+from timeit import timeit
+
+from actionpack.actions import Call
+from actionpack.actions import Pipeline
+from actionpack.utils import Closure
+
+
+def increment(number: int) -> int:
+    return number + 1
+
+
+STAGES = 10
+
+
+def fittings():
+    return [Pipeline.Fitting(action=Call, enclose=increment) for _ in range(STAGES)]
+
+
+def rebuilt(inputs: int):
+    for number in range(inputs):
+        action = Call(Closure(int, number))
+        Pipeline(action, *fittings()).flush(action).perform()
+
+
+def compiled(inputs: int):
+    plan = Pipeline(Call(Closure(int, 0)), *fittings()).compile()
+    for number in range(inputs):
+        plan.perform(Call(Closure(int, number)))
+
+
+def main(inputs: int = 2_000):
+    print(f'{inputs} inputs through {STAGES} stages')
+    for name, run in (('rebuilt', rebuilt), ('compiled', compiled)):
+        elapsed = timeit(lambda: run(inputs), number=1)
+        print(f'{name:<10}{elapsed:>8.3f}s{inputs / elapsed:>12.0f} inputs/sec')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""
+Memory retained while executing a long generator of Actions, buffered vs streaming.
+
+    python -m benchmarks.procedure_memory
+"""
+import tracemalloc
+
+from actionpack import Action
+from actionpack import Procedure
+from actionpack.action import Name
+
+
+class Payload(Action[Name, int]):
+    def __init__(self, size: int):
+        self.payload = bytes(size)
+
+    def instruction(self) -> int:
+        return len(self.payload)
+
+
+def actions(total: int, size: int):
+    for _ in range(total):
+        yield Payload(size)
+
+
+def peak_memory(streaming: bool, synchronously: bool, total: int = 20_000, size: int = 256) -> int:
+    tracemalloc.start()
+    procedure = Procedure(actions(total, size), streaming=streaming)
+    for _ in procedure.execute(synchronously=synchronously):
+        pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    print(f"{'mode':<12}{'sync (KiB)':>14}{'async (KiB)':>14}  (peak traced memory)")
+    for streaming in (False, True):
+        mode = 'streaming' if streaming else 'buffered'
+        sync, async_ = (peak_memory(streaming, synchronously) // 1024 for synchronously in (True, False))
+        print(f'{mode:<12}{sync:>14}{async_:>14}')
+
+
+if __name__ == '__main__':
+    main()
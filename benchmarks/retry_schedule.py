@@ -0,0 +1,42 @@
+"""
+Throughput of backoff delays calculated per attempt vs. drawn from a precomputed, shared Schedule.
+
+    python -m benchmarks.retry_schedule
+"""
+from timeit import timeit
+
+from actionpack.actions import RetryPolicy
+from actionpack.actions.retry_policy import schedule
+
+
+RETRIES = 10
+BASE = 0.2
+MAX_DELAY = 30
+
+
+def calculated(policies: int):
+    backoff = RetryPolicy.Backoff('EXPONENTIAL')
+    for _ in range(policies):
+        [min(backoff.calculate(retry, BASE, 1.0), MAX_DELAY) for retry in range(RETRIES)]
+
+
+def scheduled(policies: int):
+    for _ in range(policies):
+        plan = schedule('EXPONENTIAL', BASE, RETRIES, MAX_DELAY, 'PERCENTAGE', 1.0)
+        [plan.delay(retry) for retry in range(RETRIES)]
+
+
+def sampled(policies: int):
+    schedule('EXPONENTIAL', BASE, RETRIES, MAX_DELAY, 'PERCENTAGE', 1.0).sample(policies)
+
+
+def main(policies: int = 20_000):
+    delays = policies * RETRIES
+    print(f'{policies} policies x {RETRIES} retries')
+    for name, run in (('calculated', calculated), ('scheduled', scheduled), ('sampled', sampled)):
+        elapsed = timeit(lambda: run(policies), number=1)
+        print(f'{name:<12}{elapsed:>8.3f}s{delays / elapsed:>14.0f} delays/sec')
+
+
+if __name__ == '__main__':
+    main()
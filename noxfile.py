@@ -15,6 +15,7 @@ PROJECT_NAME = 'actionpack'
 VENV = f'{PROJECT_NAME}-venv'
 TESTDIR = 'tests.actionpack'
 TESTNAME = envvar.get('TESTNAME', '')
+BENCHMARKS = envvar.get('BENCHMARKS', '')
 USEVENV = envvar.get('USEVENV', False)
 EXAMPLE = envvar.get('EXAMPLE', 'actionpack')
 
@@ -93,7 +94,7 @@ def test(session):
         session.run(
             'python', '-m',
             'coverage', 'run', '--source', '.', '--branch',
-            '--omit', '**tests/*,**/__*__.py,noxfile.py,setup.py',
+            '--omit', '**tests/*,**benchmarks/*,**/__*__.py,noxfile.py,setup.py',
             '-m', 'unittest', TESTNAME if TESTNAME else f'discover',
             external=external
         )
@@ -107,6 +108,23 @@ def test(session):
         )
 
 
+@nox.session(name=session_name('benchmark'), python=supported_python_versions)
+def benchmark(session):
+    if USEVENV:
+        install(session)
+
+    benchmarks = BENCHMARKS.split(',') if BENCHMARKS else [
+        'http_sessions',
+        'import_time',
+        'lock_contention',
+        'pipeline_plan',
+        'procedure_memory',
+        'retry_schedule',
+    ]
+    for name in benchmarks:
+        session.run('python', '-m', f'benchmarks.{name}', external=external)
+
+
 @nox.session(name=session_name('build'), python=supported_python_versions)
 def build(session):
     session.run('python', 'setup.py', 'sdist')
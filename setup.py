@@ -12,7 +12,7 @@ setup(
         'setuptools_scm==5.0.1'
     ],
     use_scm_version={'local_scheme': 'no-local-version'} if envvars.get('LOCAL_VERSION_SCHEME') else True,
-    packages=find_packages(exclude=['tests']),
+    packages=find_packages(exclude=['tests', 'benchmarks']),
     author='Emmanuel I. Obi',
     license='MIT',
     maintainer='Emmanuel I. Obi',
@@ -1,3 +1,5 @@
+import asyncio
+
 from io import BytesIO
 from io import StringIO
 from typing import Any
@@ -31,6 +33,28 @@ class FakeAction(Action[Name, Outcome]):
         setattr(self, 'instruction', instruction_provider if instruction_provider else FakeAction.return_result)
 
 
+class FakeAsyncAction(Action[Name, Outcome]):
+
+    result = 'Performing Action asynchronously.'
+
+    def __init__(self, name: Name = None, delay: float = 0, failure: Exception = None, tracker: dict = None):
+        self.name = name
+        self.delay = delay
+        self.failure = failure
+        self.tracker = tracker
+
+    async def instruction(self) -> Outcome:
+        if self.tracker is not None:
+            self.tracker['running'] = self.tracker.get('running', 0) + 1
+            self.tracker['peak'] = max(self.tracker.get('peak', 0), self.tracker['running'])
+        await asyncio.sleep(self.delay)
+        if self.tracker is not None:
+            self.tracker['running'] -= 1
+        if self.failure:
+            raise self.failure
+        return FakeAsyncAction.result
+
+
 class FakeFile:
     def __init__(self, contents=None, mode: str = None):
         if not contents:
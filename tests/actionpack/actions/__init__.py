@@ -1,6 +1,9 @@
 from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
 from io import IOBase as Buffer
 from requests import Response
+from threading import Thread
 from time import sleep
 
 from actionpack import Action
@@ -36,3 +39,88 @@ class FakeWrite(Action[Name, int]):
         sleep(self.delay)
         result = self.file.write(self.to_write)
         return result
+
+
+class LocalServer:
+    """
+    HTTP/1.1 stand-in server on an ephemeral localhost port which counts the connections it accepts.
+    """
+
+    def __init__(
+        self,
+        body: bytes = b'sup',
+        delay: float = 0,
+        chunked: bool = False,
+        headers: dict = None,
+        etag: str = None
+    ):
+        self.body = body
+        self.delay = delay
+        self.chunked = chunked
+        self.response_headers = headers if headers else {}
+        self.etag = etag
+        self.connections = 0
+        self.requests = 0
+        self.in_flight = 0
+        self.peak = 0
+        self.headers = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                server.connections += 1
+
+            def do_GET(self):
+                self.respond(server.body)
+
+            def do_POST(self):
+                self.respond(self.rfile.read(int(self.headers['Content-Length'])))
+
+            def respond(self, body: bytes):
+                server.requests += 1
+                server.in_flight += 1
+                server.peak = max(server.peak, server.in_flight)
+                server.headers.append(dict(self.headers))
+                sleep(server.delay)
+                server.in_flight -= 1
+                if server.etag and self.headers.get('If-None-Match') == server.etag:
+                    self.send_response(304)
+                    self.send_header('ETag', server.etag)
+                    for name, value in server.response_headers.items():
+                        self.send_header(name, value)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                if server.etag:
+                    self.send_header('ETag', server.etag)
+                for name, value in server.response_headers.items():
+                    self.send_header(name, value)
+                if server.chunked:
+                    self.send_header('Transfer-Encoding', 'chunked')
+                    self.end_headers()
+                    for chunk in (body[:1], body[1:]):
+                        self.wfile.write(f'{len(chunk):x}\r\n'.encode() + chunk + b'\r\n')
+                    self.wfile.write(b'0\r\n\r\n')
+                else:
+                    self.send_header('Content-Length', str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.httpd.daemon_threads = True
+        self.url = f'http://127.0.0.1:{self.httpd.server_port}'
+
+    def __enter__(self):
+        Thread(target=self.httpd.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True).start()
+        return self
+
+    def __exit__(self, *args):
+        self.httpd.shutdown()
+        self.httpd.server_close()
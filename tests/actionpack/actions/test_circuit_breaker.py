@@ -0,0 +1,177 @@
+import asyncio
+import pickle
+
+from time import sleep
+from unittest import TestCase
+from unittest.mock import patch
+
+from actionpack import Action
+from actionpack.action import Result
+from actionpack.actions import CircuitBreaker
+from actionpack.actions import MakeRequest
+from actionpack.actions import RetryPolicy
+from actionpack.utils import pickleable
+from tests.actionpack import FakeAction
+from tests.actionpack.actions import FakeResponse
+
+
+def fail():
+    raise ConnectionError('unreachable.')
+
+
+class CircuitBreakerTest(TestCase):
+
+    def setUp(self):
+        CircuitBreaker.reset()
+
+    def tearDown(self):
+        CircuitBreaker.reset()
+
+    @patch('requests.Session.send')
+    def test_can_perform_through_closed_CircuitBreaker(self, mock_session_send):
+        mock_session_send.return_value = FakeResponse(b'sup')
+        action = CircuitBreaker(MakeRequest('GET', 'http://localhost/some/path'))
+        result = action.perform()
+
+        self.assertIsInstance(result, Result)
+        self.assertTrue(result.successful)
+        self.assertEqual(action.key, 'http://localhost')
+        self.assertEqual(action.state, CircuitBreaker.State.CLOSED)
+
+    def test_CircuitBreaker_opens_after_consecutive_failures(self):
+        attempts = []
+
+        def tracked_failure():
+            attempts.append(1)
+            fail()
+
+        breakers = [
+            CircuitBreaker(FakeAction(instruction_provider=tracked_failure), key='target', failure_threshold=3)
+            for _ in range(10)
+        ]
+        results = [breaker.perform() for breaker in breakers]
+
+        self.assertEqual(len(attempts), 3)
+        self.assertTrue(all(isinstance(result.value, ConnectionError) for result in results[:3]))
+        self.assertTrue(all(isinstance(result.value, CircuitBreaker.Open) for result in results[3:]))
+        self.assertEqual(CircuitBreaker.circuit_for('target').state, CircuitBreaker.State.OPEN)
+        self.assertEqual(CircuitBreaker.circuit_for('target').metrics['rejections'], 7)
+
+    @patch('requests.Session.send')
+    def test_CircuitBreaker_counts_server_errors_as_failures(self, mock_session_send):
+        mock_session_send.return_value = FakeResponse(b'unavailable', status=503)
+        results = [
+            CircuitBreaker(MakeRequest('GET', 'http://localhost/some/path'), failure_threshold=2).perform()
+            for _ in range(3)
+        ]
+
+        self.assertEqual([result.value.status_code for result in results[:2]], [503, 503])
+        self.assertIsInstance(results[2].value, CircuitBreaker.Open)
+        self.assertEqual(mock_session_send.call_count, 2)
+
+    def test_CircuitBreaker_counts_outcomes_matching_is_failure(self):
+        breaker = CircuitBreaker(
+            FakeAction(instruction_provider=lambda: 'degraded.'),
+            key='target',
+            failure_threshold=1,
+            is_failure=lambda value: value == 'degraded.'
+        )
+
+        self.assertEqual(breaker.perform().value, 'degraded.')
+        self.assertEqual(breaker.state, CircuitBreaker.State.OPEN)
+
+    def test_CircuitBreaker_probes_once_half_open(self):
+        failing = CircuitBreaker(FakeAction(instruction_provider=fail), key='target', failure_threshold=1, recovery_timeout=0.1)
+        healthy = CircuitBreaker(FakeAction(), key='target', failure_threshold=1, recovery_timeout=0.1)
+
+        failing.perform()
+        self.assertIsInstance(healthy.perform().value, CircuitBreaker.Open)
+        sleep(0.1)
+        self.assertIsInstance(failing.perform().value, ConnectionError)
+        self.assertEqual(healthy.state, CircuitBreaker.State.OPEN)
+        sleep(0.1)
+        self.assertTrue(healthy.perform().successful)
+        self.assertEqual(healthy.state, CircuitBreaker.State.CLOSED)
+        self.assertEqual(CircuitBreaker.circuit_for('target').metrics['trips'], 2)
+
+    def test_CircuitBreaker_ignores_unlisted_failures(self):
+        breaker = CircuitBreaker(
+            FakeAction(instruction_provider=fail),
+            key='target',
+            failure_threshold=1,
+            failures=(TimeoutError,)
+        )
+        breaker.perform()
+        self.assertEqual(breaker.state, CircuitBreaker.State.CLOSED)
+
+    def test_RetryPolicy_gives_up_on_open_CircuitBreaker(self):
+        attempts = []
+
+        def tracked_failure():
+            attempts.append(1)
+            fail()
+
+        action = RetryPolicy(
+            CircuitBreaker(FakeAction(instruction_provider=tracked_failure), key='target', failure_threshold=2),
+            max_retries=5,
+            should_record=True
+        )
+        result = action.perform()
+
+        self.assertIsInstance(result.value, CircuitBreaker.Open)
+        self.assertEqual(len(attempts), 2)
+        self.assertEqual(len(action.attempts), 3)
+
+    def test_can_perform_CircuitBreaker_asynchronously(self):
+        breaker = CircuitBreaker(FakeAction(instruction_provider=fail), key='target', failure_threshold=1)
+        asyncio.run(breaker.perform_async())
+        result = asyncio.run(breaker.perform_async())
+
+        self.assertIsInstance(result.value, CircuitBreaker.Open)
+
+    def test_cancelled_probe_reopens_CircuitBreaker(self):
+        class Stall(Action[str, str]):
+            async def instruction(self) -> str:
+                await asyncio.sleep(10)
+                return 'too late.'
+
+        breaker = CircuitBreaker(Stall(), key='target', failure_threshold=1, recovery_timeout=0.1)
+        CircuitBreaker(FakeAction(instruction_provider=fail), key='target', failure_threshold=1).perform()
+        sleep(0.1)
+
+        async def cancel_probe():
+            probe = asyncio.create_task(breaker.perform_async())
+            await asyncio.sleep(0.05)
+            probe.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await probe
+
+        asyncio.run(cancel_probe())
+        circuit = CircuitBreaker.circuit_for('target')
+
+        self.assertEqual(breaker.state, CircuitBreaker.State.OPEN)
+        self.assertFalse(circuit.probing)
+        self.assertEqual(circuit.metrics['trips'], 2)
+        sleep(0.1)
+        self.assertTrue(CircuitBreaker(FakeAction(), key='target', recovery_timeout=0.1).perform().successful)
+
+    def test_instantiation_fails_given_invalid_thresholds(self):
+        action = CircuitBreaker(FakeAction(), key='target', failure_threshold=0)
+        self.assertIsInstance(action, Action.Construct)
+        self.assertIsInstance(action.perform().value, CircuitBreaker.Invalid)
+
+    def test_instantiation_fails_without_key_for_Actions_without_url(self):
+        action = CircuitBreaker(FakeAction())
+        self.assertIsInstance(action, Action.Construct)
+        self.assertIsInstance(action.perform().value, CircuitBreaker.Invalid)
+
+    def test_can_serialize(self):
+        action = CircuitBreaker(MakeRequest('GET', 'http://localhost'))
+        self.assertEqual(repr(action), '<CircuitBreaker(<MakeRequest> | http://localhost)>')
+
+    def test_can_pickle(self):
+        action = CircuitBreaker(FakeAction(), key='target')
+        unpickled = pickle.loads(pickleable(action))
+
+        self.assertEqual(unpickled.key, action.key)
+        self.assertIs(unpickled.circuit, action.circuit)
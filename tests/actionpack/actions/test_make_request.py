@@ -1,5 +1,9 @@
+import asyncio
 import pickle
 
+from requests import Session
+from tempfile import TemporaryDirectory
+from time import sleep
 from types import ModuleType
 from unittest import TestCase
 from unittest.mock import patch
@@ -7,8 +11,11 @@ from validators import ValidationFailure
 
 from actionpack.action import Result
 from actionpack.actions import MakeRequest
+from actionpack.actions.make_request import ResponseCache
+from actionpack.actions.make_request import SessionPool
 from actionpack.utils import pickleable
 from tests.actionpack.actions import FakeResponse
+from tests.actionpack.actions import LocalServer
 
 
 class MakeRequestTest(TestCase):
@@ -48,3 +55,188 @@ class MakeRequestTest(TestCase):
 
         self.assertTrue(pickleable(self.action))
         self.assertEqual(unpickled.__dict__, self.action.__dict__)
+
+    def test_MakeRequest_reuses_pooled_session_per_host(self):
+        with LocalServer() as server:
+            results = [MakeRequest('GET', f'{server.url}/{n}').perform(should_raise=True) for n in range(5)]
+
+        self.assertTrue(all(result.value.content == b'sup' for result in results))
+        self.assertEqual(server.requests, 5)
+        self.assertEqual(server.connections, 1)
+
+    @patch('requests.Session.send')
+    def test_MakeRequest_prefers_given_session(self, mock_session_send):
+        mock_session_send.return_value = FakeResponse()
+        session = Session()
+        with patch.object(MakeRequest.sessions, 'lease') as mock_lease:
+            MakeRequest('GET', 'http://localhost', session=session).perform(should_raise=True)
+        mock_lease.assert_not_called()
+
+
+class SessionPoolTest(TestCase):
+
+    def setUp(self):
+        self.pool = SessionPool(pool_size=2)
+
+    def tearDown(self):
+        self.pool.close()
+
+    def test_keys_sessions_by_scheme_and_host(self):
+        session = self.pool.get('http://localhost/some/path')
+
+        self.assertIs(self.pool.get('HTTP://LOCALHOST/other?query'), session)
+        self.assertIsNot(self.pool.get('https://localhost'), session)
+        self.assertIsNot(self.pool.get('http://localhost:8080'), session)
+        self.assertEqual(self.pool.metrics, {'sessions': 3, 'created': 3, 'reused': 1, 'retired': 0})
+
+    def test_retires_sessions_past_max_age(self):
+        pool = SessionPool(max_age=0.05)
+        session = pool.get('http://localhost')
+        sleep(0.05)
+
+        self.assertIsNot(pool.get('http://localhost'), session)
+        self.assertEqual(pool.retired, 1)
+        pool.close()
+        self.assertEqual(len(pool), 0)
+
+    def test_closes_retired_sessions_once_released(self):
+        pool = SessionPool(max_age=0.05)
+        session = pool.get('http://localhost')
+        with patch.object(session, 'close', wraps=session.close) as mock_close:
+            with pool.lease('http://localhost'):
+                sleep(0.05)
+                self.assertIsNot(pool.get('http://localhost'), session)
+                mock_close.assert_not_called()
+            mock_close.assert_called_once()
+        self.assertEqual(pool.retired, 1)
+        pool.close()
+
+    def test_pooled_sessions_do_not_keep_cookies(self):
+        with LocalServer(headers={'Set-Cookie': 'token=secret; Path=/'}) as server:
+            session = self.pool.get(server.url)
+            session.get(server.url)
+            MakeRequest.sessions, pool = self.pool, MakeRequest.sessions
+            try:
+                MakeRequest('GET', server.url).perform(should_raise=True)
+            finally:
+                MakeRequest.sessions = pool
+            session.get(server.url)
+
+        self.assertEqual(len(session.cookies), 0)
+        self.assertTrue(all('Cookie' not in headers for headers in server.headers))
+
+    def test_can_disable_keep_alive(self):
+        with LocalServer() as server:
+            session = SessionPool(keep_alive=False).get(server.url)
+            for _ in range(3):
+                session.get(server.url)
+
+        self.assertEqual(server.connections, 3)
+        self.assertEqual(server.headers[0]['Connection'], 'close')
+
+    def test_instantiation_fails_with_invalid_bounds(self):
+        with self.assertRaises(ValueError):
+            SessionPool(pool_size=0)
+        with self.assertRaises(ValueError):
+            SessionPool(max_age=0)
+
+
+class ResponseCacheTest(TestCase):
+
+    def setUp(self):
+        MakeRequest.responses = ResponseCache()
+
+    def tearDown(self):
+        MakeRequest.responses = None
+
+    def test_serves_fresh_responses_without_network(self):
+        with LocalServer(headers={'Cache-Control': 'max-age=60'}) as server:
+            results = [MakeRequest('GET', server.url).perform(should_raise=True) for _ in range(3)]
+
+        self.assertEqual(server.requests, 1)
+        self.assertEqual([result.value.content for result in results], [b'sup'] * 3)
+        self.assertTrue(results[-1].value.from_cache)
+        self.assertEqual(MakeRequest.responses.metrics['hits'], 2)
+        self.assertEqual(MakeRequest.responses.metrics['misses'], 1)
+
+    def test_revalidates_stale_responses(self):
+        with LocalServer(headers={'Cache-Control': 'no-cache'}, etag='"v1"') as server:
+            first = MakeRequest('GET', server.url).perform(should_raise=True).value
+            second = MakeRequest('GET', server.url).perform(should_raise=True).value
+
+        self.assertEqual(server.requests, 2)
+        self.assertEqual(server.headers[1]['If-None-Match'], '"v1"')
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(MakeRequest.responses.revalidations, 1)
+
+    def test_does_not_cache_uncacheable_responses(self):
+        with LocalServer(headers={'Cache-Control': 'no-store'}) as server:
+            for _ in range(2):
+                MakeRequest('GET', server.url).perform(should_raise=True)
+            MakeRequest('POST', server.url, data={'some': 'data'}).perform(should_raise=True)
+            MakeRequest('POST', server.url, data={'some': 'data'}).perform(should_raise=True)
+
+        self.assertEqual(server.requests, 4)
+        self.assertEqual(len(MakeRequest.responses.entries), 0)
+
+    def test_does_not_share_credentialed_responses_unless_public(self):
+        credentials = {'Authorization': 'Bearer secret'}
+        with LocalServer(headers={'Cache-Control': 'max-age=60'}) as server:
+            MakeRequest('GET', server.url, headers=credentials).perform(should_raise=True)
+            MakeRequest('GET', server.url).perform(should_raise=True)
+            MakeRequest('GET', server.url, headers={'Cookie': 'session=secret'}).perform(should_raise=True)
+
+        self.assertEqual(server.requests, 3)
+        self.assertEqual(MakeRequest.responses.metrics['stores'], 1)
+        self.assertEqual(MakeRequest.responses.hits, 0)
+
+        with LocalServer(headers={'Cache-Control': 'public, max-age=60'}) as server:
+            for _ in range(2):
+                MakeRequest('GET', server.url, headers=credentials).perform(should_raise=True)
+
+        self.assertEqual(server.requests, 1)
+
+    def test_unsafe_methods_invalidate_cached_responses(self):
+        with LocalServer(headers={'Cache-Control': 'max-age=60'}) as server:
+            MakeRequest('GET', server.url).perform(should_raise=True)
+            MakeRequest('POST', server.url, data={'some': 'data'}).perform(should_raise=True)
+            MakeRequest('GET', server.url).perform(should_raise=True)
+            MakeRequest('GET', server.url).perform(should_raise=True)
+
+        self.assertEqual(server.requests, 3)
+        self.assertEqual(MakeRequest.responses.metrics['invalidations'], 1)
+        self.assertEqual(MakeRequest.responses.hits, 1)
+
+    def test_prefers_shared_max_age(self):
+        self.assertEqual(MakeRequest.responses.lifetime({'Cache-Control': 'max-age=60, s-maxage=5'}), 5)
+
+    def test_expires_responses_after_max_age(self):
+        clock = [1000.0]
+        MakeRequest.responses = ResponseCache(clock=lambda: clock[0])
+        with LocalServer(headers={'Cache-Control': 'max-age=10'}) as server:
+            MakeRequest('GET', server.url).perform(should_raise=True)
+            clock[0] += 11
+            MakeRequest('GET', server.url).perform(should_raise=True)
+
+        self.assertEqual(server.requests, 2)
+        self.assertEqual(MakeRequest.responses.hits, 0)
+
+    def test_can_persist_responses_to_disk(self):
+        with TemporaryDirectory() as directory, LocalServer(headers={'Cache-Control': 'max-age=60'}) as server:
+            MakeRequest.responses = ResponseCache(directory=directory)
+            MakeRequest('GET', server.url).perform(should_raise=True)
+            MakeRequest.responses = ResponseCache(directory=directory)
+            result = MakeRequest('GET', server.url).perform(should_raise=True)
+
+        self.assertEqual(server.requests, 1)
+        self.assertEqual(result.value.content, b'sup')
+
+    def test_caches_responses_from_AsyncEngine(self):
+        with LocalServer(headers={'Cache-Control': 'max-age=60'}) as server:
+            actions = [MakeRequest('GET', server.url) for _ in range(3)]
+            asyncio.run(MakeRequest.perform_batch_async(actions[:1]))
+            results = asyncio.run(MakeRequest.perform_batch_async(actions[1:]))
+
+        self.assertEqual(server.requests, 1)
+        self.assertTrue(all(result.value.from_cache for result in results))
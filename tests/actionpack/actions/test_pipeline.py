@@ -1,19 +1,84 @@
+import gc
+
+from concurrent.futures import ThreadPoolExecutor
 from os import getcwd as cwd
+from pathlib import Path
+from sys import getrecursionlimit
+from threading import Thread
+from tempfile import TemporaryDirectory
+from time import sleep
+from time import time
 from unittest import TestCase
 from unittest.mock import patch
 
 from actionpack import Action
 from actionpack.action import Result
+from actionpack.cache import Cache
+from actionpack.actions import MakeRequest
 from actionpack.actions import Pipeline
 from actionpack.actions import ReadInput
 from actionpack.actions import Read
 from actionpack.actions import Write
 from actionpack.actions.pipeline import Call
 from actionpack.utils import Closure
+from actionpack.utils import pickleable
 from tests.actionpack import FakeAction
 from tests.actionpack import FakeFile
 
 
+def increment(number: int) -> int:
+    return number + 1
+
+
+def double(number: int) -> int:
+    return number * 2
+
+
+def pause(number: int) -> int:
+    sleep(0.2)
+    return number
+
+
+class Tally(Action, pure=True):
+
+    batches = []
+    performed = []
+
+    def __init__(self, number: int):
+        self.number = number
+
+    def instruction(self) -> int:
+        Tally.performed.append(self.number)
+        return self.number
+
+    @classmethod
+    def perform_batch(cls, actions, should_raise=False):
+        cls.batches.append(len(actions))
+        return super().perform_batch(actions, should_raise=should_raise)
+
+
+class Enrich(Action):
+
+    def __init__(self, number: int):
+        self.number = number
+
+    def instruction(self) -> int:
+        return Call(Closure(increment, self.number)).perform(should_raise=True).value
+
+
+def within(seconds: float, fn):
+    outcome = []
+    thread = Thread(target=lambda: outcome.append(fn()), daemon=True)
+    thread.start()
+    thread.join(seconds)
+    return outcome
+
+
+def shout(chunks):
+    for chunk in chunks:
+        yield chunk.upper()
+
+
 class PipelineTest(TestCase):
 
     def test_instantiation_fails_with_invalid_action_types(self):
@@ -206,3 +271,298 @@ class PipelineTest(TestCase):
 
         self.assertIsInstance(result, Result)
         self.assertEqual(result.value, ('second', ('first', response)))
+
+    def test_can_compile_Pipeline_into_reusable_Plan(self):
+        def tag(param):
+            return 'tagged', param
+
+        fitting = Pipeline.Fitting(action=Call, enclose=tag)
+        pipeline = Pipeline(FakeAction(), fitting, should_raise=True)
+        plan = pipeline.compile()
+
+        self.assertIs(pipeline.compile(), plan)
+        self.assertEqual(len(plan), 1)
+        for response in ('first', 'second', 'third'):
+            result = plan.perform(FakeAction(instruction_provider=Closure(str, response)))
+            self.assertIsInstance(result, Result)
+            self.assertEqual(result.value, ('tagged', response))
+        self.assertEqual(fitting.kwargs, {})
+
+    def test_compiled_Plan_wires_Receiver(self):
+        fitting = Pipeline.Fitting(action=Write, **{'filename': 'this/file.txt', 'to_write': Pipeline.Receiver})
+        stage, = Pipeline(FakeAction(), fitting).compile().stages
+
+        self.assertEqual(stage.param, 'to_write')
+        action = stage.build(b'received')
+        self.assertIsInstance(action, Write)
+        self.assertEqual(action.to_write, b'received')
+        self.assertIs(fitting.kwargs['to_write'], Pipeline.Receiver)
+
+    def test_compiled_Plan_propagates_failure(self):
+        plan = Pipeline(FakeAction(), Read).compile()
+        result = plan.perform(FakeAction(instruction_provider=Closure(str, 'not/a/real/file.txt')))
+
+        self.assertFalse(result.successful)
+        self.assertIsInstance(result.value, FileNotFoundError)
+
+    def test_compiled_Pipeline_can_be_pickled(self):
+        pipeline = Pipeline(FakeAction(), Read)
+        pipeline.compile()
+        self.assertTrue(pickleable(pipeline))
+
+    def test_can_perform_deep_Pipeline(self):
+        depth = 5 * getrecursionlimit()
+        pipeline = Pipeline(Call(Closure(int, 0)), *[Pipeline.Fitting(action=Call, enclose=increment)] * depth)
+        result = pipeline.perform(should_raise=True)
+
+        self.assertTrue(result.successful)
+        self.assertEqual(result.value, depth)
+
+    def test_can_perform_same_Pipeline_concurrently(self):
+        fitting = Pipeline.Fitting(action=Call, enclose=increment)
+        pipeline = Pipeline(FakeAction(), *[fitting] * 50)
+
+        def perform(number: int) -> int:
+            return pipeline.flush(Call(Closure(int, number))).perform(should_raise=True).value
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(perform, range(200)))
+
+        self.assertEqual(results, [number + 50 for number in range(200)])
+        self.assertEqual(fitting.kwargs, {})
+        self.assertEqual(list(pipeline), list(pipeline.action_types))
+
+    def test_can_stream_chunks_through_Pipeline(self):
+        contents = "Hello, is this the Krusty Krab? No, this is Patrick.\n" * 100
+        with TemporaryDirectory() as directory:
+            source, destination = Path(directory, 'source.txt'), Path(directory, 'destination.txt')
+            source.write_text(contents)
+
+            for prefetch in (0, 2):
+                pipeline = Pipeline(
+                    Read(source, chunksize=16),
+                    Pipeline.Fitting(action=Call, enclose=shout),
+                    Pipeline.Fitting(action=Write, overwrite=True, filename=destination, to_write=Pipeline.Receiver),
+                    should_raise=True,
+                    prefetch=prefetch,
+                )
+                result = pipeline.perform(should_raise=True)
+
+                self.assertEqual(result.value, str(destination.absolute()))
+                self.assertEqual(destination.read_text(), contents.upper())
+
+    def test_can_fan_out_and_gather_Pipeline_stages(self):
+        parallel = Pipeline.Parallel(
+            Pipeline.Fitting(action=Call, enclose=increment),
+            Pipeline.Fitting(action=Call, enclose=double),
+            gather=lambda incremented, doubled: incremented + doubled,
+        )
+        pipeline = Pipeline(Call(Closure(int, 3)), parallel, Pipeline.Fitting(action=Call, enclose=increment))
+        result = pipeline.perform(should_raise=True)
+
+        self.assertEqual(result.value, (3 + 1) + (3 * 2) + 1)
+        ungathered = Pipeline.Parallel(*[Pipeline.Fitting(action=Call, enclose=double)] * 2)
+        self.assertEqual(Pipeline(Call(Closure(int, 3)), ungathered).perform().value, (6, 6))
+
+    def test_parallel_Pipeline_stages_run_concurrently(self):
+        branches = [Pipeline.Fitting(action=Call, enclose=pause)] * 4
+        pipeline = Pipeline(Call(Closure(int, 1)), Pipeline.Parallel(*branches))
+
+        start = time()
+        result = pipeline.perform(should_raise=True)
+        self.assertLess(time() - start, 0.4)
+        self.assertEqual(result.value, (1, 1, 1, 1))
+
+    def test_parallel_Pipeline_branches_can_perform_locked_Actions(self):
+        pipeline = Pipeline(Call(Closure(int, 1)), Pipeline.Parallel(Enrich, Enrich, Enrich))
+
+        self.assertEqual(within(5, lambda: pipeline.perform(should_raise=True).value), [(2, 2, 2)])
+        self.assertEqual(within(5, lambda: pipeline.compile().perform(Call(Closure(int, 1))).value), [(2, 2, 2)])
+
+    def test_nested_parallel_Pipeline_stages_of_the_same_width(self):
+        inner = Pipeline.Parallel(*[Pipeline.Fitting(action=Call, enclose=double)] * 2, gather=lambda *values: sum(values))
+        outer = Pipeline.Parallel(inner, Pipeline.Fitting(action=Call, enclose=increment))
+        pipeline = Pipeline(Call(Closure(int, 3)), outer)
+
+        self.assertEqual(within(5, lambda: pipeline.perform(should_raise=True).value), [(12, 4)])
+
+    def test_concurrent_parallel_Pipeline_stages_do_not_queue_behind_each_other(self):
+        pipeline = Pipeline(FakeAction(), Pipeline.Parallel(*[Pipeline.Fitting(action=Call, enclose=pause)] * 2))
+
+        start = time()
+        results = within(5, lambda: list(pipeline.map(range(8), max_workers=8)))
+        self.assertLess(time() - start, 0.6)
+        self.assertEqual([result.value for result in results[0]], [(number, number) for number in range(8)])
+
+    def test_parallel_Pipeline_stages_run_at_most_max_workers_branches_at_once(self):
+        branches = [Pipeline.Fitting(action=Call, enclose=pause)] * 4
+        pipeline = Pipeline(Call(Closure(int, 1)), Pipeline.Parallel(*branches, max_workers=2))
+
+        start = time()
+        result = pipeline.perform(should_raise=True)
+        self.assertGreaterEqual(time() - start, 0.4)
+        self.assertEqual(result.value, (1, 1, 1, 1))
+
+    def test_parallel_Pipeline_stages_can_run_in_processes(self):
+        parallel = Pipeline.Parallel(
+            Pipeline.Fitting(action=Call, enclose=increment),
+            Pipeline.Fitting(action=Call, enclose=double),
+            processes=True,
+        )
+        result = Pipeline(Call(Closure(int, 5)), parallel).perform(should_raise=True)
+        self.assertEqual(result.value, (6, 10))
+
+    @patch('pathlib.Path.exists')
+    def test_parallel_Pipeline_stage_failure_propagates(self, mock_exists):
+        mock_exists.return_value = False
+        parallel = Pipeline.Parallel(Read, Pipeline.Fitting(action=Call, enclose=str))
+        result = Pipeline(Call(Closure(str, 'not/a/file.txt')), parallel).perform()
+
+        self.assertFalse(result.successful)
+        self.assertIsInstance(result.value, FileNotFoundError)
+
+        failed_upstream = Pipeline(Read('not/a/file.txt'), parallel).perform()
+        self.assertIsInstance(failed_upstream.value, FileNotFoundError)
+
+    def test_parallel_Pipeline_stages_share_registered_pools(self):
+        from actionpack.actions.pipeline import _parameters
+        from actionpack.executors import registry
+
+        for _ in range(20):
+            parallel = Pipeline.Parallel(*[Pipeline.Fitting(action=Call, enclose=double)] * 2)
+            self.assertEqual(Pipeline(Call(Closure(int, 2)), parallel).perform(should_raise=True).value, (4, 4))
+        del parallel
+        gc.collect()
+
+        self.assertIn(f'parallel-thread-{Pipeline.Parallel.threads}', registry.metrics)
+        self.assertEqual(sum(1 for action_type in list(_parameters) if action_type.__name__ == 'Parallel'), 0)
+
+    def test_Pipeline_Parallel_requires_ActionTypes(self):
+        with self.assertRaises(TypeError):
+            Pipeline.Parallel()
+        with self.assertRaises(TypeError):
+            Pipeline.Parallel(Read, 'not an ActionType')
+
+    def test_can_map_Pipeline_over_inputs(self):
+        pipeline = Pipeline(FakeAction(), Pipeline.Fitting(action=Call, enclose=increment), should_raise=True)
+        results = list(pipeline.map(range(50), max_workers=4))
+
+        self.assertTrue(all(isinstance(result, Result) for result in results))
+        self.assertEqual([result.value for result in results], [n + 1 for n in range(50)])
+
+        unordered = pipeline.map([Call(Closure(int, n)) for n in range(50)], ordered=False)
+        self.assertEqual(sorted(result.value for result in unordered), [n + 1 for n in range(50)])
+
+    def test_mapped_Pipeline_runs_inputs_concurrently(self):
+        pipeline = Pipeline(FakeAction(), Pipeline.Fitting(action=Call, enclose=pause))
+
+        start = time()
+        results = list(pipeline.map(range(8), max_workers=8))
+        self.assertLess(time() - start, 0.6)
+        self.assertEqual([result.value for result in results], list(range(8)))
+
+    def test_mapped_Pipeline_batches_stages(self):
+        Tally.batches = []
+        pipeline = Pipeline(FakeAction(), Tally, Pipeline.Fitting(action=Call, enclose=increment))
+        results = list(pipeline.map(range(10), max_workers=2, batch_size=4))
+
+        self.assertEqual([result.value for result in results], [n + 1 for n in range(10)])
+        self.assertEqual(sorted(Tally.batches), [2, 4, 4])
+
+    @patch('pathlib.Path.exists')
+    def test_mapped_Pipeline_reports_failures_per_input(self, mock_exists):
+        mock_exists.side_effect = [True, False]
+        pipeline = Pipeline(FakeAction(), Pipeline.Fitting(action=Read, output_type=bytes))
+        with patch('pathlib.Path.read_bytes') as mock_read:
+            mock_read.return_value = b'contents'
+            results = list(pipeline.map(['exists.txt', 'missing.txt'], max_workers=1))
+
+        self.assertTrue(results[0].successful)
+        self.assertIsInstance(results[1].value, FileNotFoundError)
+        with self.assertRaises(ValueError):
+            list(pipeline.map([], batch_size=0))
+
+    def test_can_cache_Pipeline_stages(self):
+        Tally.performed = []
+        cache = Cache()
+        incremented = Pipeline.Fitting(action=Call, enclose=increment, pure=True)
+        pipeline = Pipeline(Call(Closure(int, 1)), Tally, incremented, cache=cache)
+
+        self.assertEqual(pipeline.perform(should_raise=True).value, 2)
+        self.assertEqual(pipeline.perform(should_raise=True).value, 2)
+        self.assertEqual(Tally.performed, [1])
+        self.assertEqual(cache.stats['hits'], 2)
+
+        changed = Pipeline(Call(Closure(int, 2)), Tally, incremented, cache=cache)
+        self.assertEqual(changed.perform(should_raise=True).value, 3)
+        self.assertEqual(Tally.performed, [1, 2])
+
+    def test_cached_Pipeline_only_caches_pure_stages(self):
+        cache = Cache()
+        with TemporaryDirectory() as directory:
+            source, destination = Path(directory, 'source.txt'), Path(directory, 'destination.txt')
+            source.write_text('line')
+            pipeline = Pipeline(
+                Read(source),
+                Pipeline.Fitting(action=Write, append=True, filename=destination, to_write=Pipeline.Receiver),
+                cache=cache
+            )
+            pipeline.perform(should_raise=True)
+            pipeline.perform(should_raise=True)
+
+            self.assertEqual(destination.read_text(), 'line\n' * 2)
+            self.assertEqual(len(cache), 1)
+        self.assertTrue(Read.pure)
+        self.assertFalse(any(action_type.pure for action_type in (Call, Write, MakeRequest)))
+        self.assertTrue(Pipeline.Parallel(Tally, Pipeline.Fitting(action=Read)).pure)
+        self.assertFalse(Pipeline.Parallel(Tally, Pipeline.Fitting(action=Call)).pure)
+
+    def test_cached_Pipeline_reads_files_again_once_they_change(self):
+        cache = Cache()
+        with TemporaryDirectory() as directory:
+            source = Path(directory, 'source.txt')
+            source.write_text('before')
+            pipeline = Pipeline(Read(source), Pipeline.Fitting(action=Call, enclose=str.upper), cache=cache)
+            self.assertEqual(pipeline.perform(should_raise=True).value, 'BEFORE')
+
+            source.write_text('and after')
+            self.assertEqual(pipeline.perform(should_raise=True).value, 'AND AFTER')
+            self.assertEqual(cache.stats['hits'], 0)
+
+    def test_cached_Pipeline_does_not_cache_failures(self):
+        cache = Cache()
+        pipeline = Pipeline(FakeAction(instruction_provider=self.raise_failure), Read, cache=cache)
+
+        self.assertFalse(pipeline.perform().successful)
+        self.assertFalse(pipeline.perform().successful)
+        self.assertEqual(len(cache), 0)
+
+    def test_can_share_cache_across_mapped_Pipelines(self):
+        Tally.batches = []
+        cache = Cache()
+        pipeline = Pipeline(FakeAction(), Tally, Pipeline.Fitting(action=Call, enclose=increment, pure=True), cache=cache)
+
+        first_run = [result.value for result in pipeline.map(range(6), batch_size=3)]
+        second_run = [result.value for result in pipeline.map(range(6), batch_size=3)]
+        self.assertEqual(first_run, second_run)
+        self.assertEqual(Tally.batches, [3, 3])
+
+    def test_cached_Pipeline_keys_Parallel_stages_by_branches(self):
+        cache = Cache()
+        doubled = Pipeline(
+            Call(Closure(int, 3)),
+            Pipeline.Parallel(Pipeline.Fitting(action=Call, enclose=double, pure=True)),
+            cache=cache
+        )
+        incremented = Pipeline(
+            Call(Closure(int, 3)),
+            Pipeline.Parallel(Pipeline.Fitting(action=Call, enclose=increment, pure=True)),
+            cache=cache
+        )
+
+        self.assertEqual(doubled.perform(should_raise=True).value, (6,))
+        self.assertEqual(incremented.perform(should_raise=True).value, (4,))
+
+    @staticmethod
+    def raise_failure():
+        raise RuntimeError('failure')
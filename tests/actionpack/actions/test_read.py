@@ -1,5 +1,6 @@
 import pickle
 
+from collections.abc import Iterator
 from pathlib import Path
 from unittest import TestCase
 from unittest.mock import patch
@@ -47,6 +48,17 @@ class ReadTest(TestCase):
         self.assertIsInstance(directory_result, Result)
         self.assertIsInstance(directory_result.value, IsADirectoryError)
 
+    def test_can_Read_in_chunks(self):
+        for output_type in (bytes, str):
+            result = Read(__file__, output_type=output_type, chunksize=64).perform(should_raise=True)
+            self.assertIsInstance(result.value, Iterator)
+            chunks = list(result.value)
+            self.assertTrue(all(len(chunk) <= 64 for chunk in chunks))
+            self.assertEqual(output_type().join(chunks), Path(__file__).read_bytes() if output_type is bytes else Path(__file__).read_text())
+
+        result = Read(__file__, chunksize=0).perform()
+        self.assertIsInstance(result.value, ValueError)
+
     def test_can_pickle(self):
         action = Read(__file__)
         pickled = pickleable(action)
@@ -1,18 +1,75 @@
+import asyncio
 import pickle
 
+from concurrent.futures import CancelledError
+from concurrent.futures import Executor
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from threading import Event
+from threading import Thread
+from time import sleep
+from time import time
 from unittest import TestCase
 from unittest.mock import ANY
 from unittest.mock import patch
+from oslash import Right
 
 from actionpack import Action
+from actionpack import Procedure
 from actionpack.action import Result
+from actionpack.actions import CircuitBreaker
 from actionpack.actions import MakeRequest
 from actionpack.actions import RetryPolicy
 from actionpack.utils import pickleable
+from actionpack.executors import TimerScheduler
+from tests.actionpack import FakeAction
+from tests.actionpack import FakeAsyncAction
 from tests.actionpack.actions import FakeResponse
 
 
+class IdempotentAction(FakeAction, idempotent=True):
+    pass
+
+
+class Cancelling(Executor):
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        future.cancel()
+        return future
+
+
+class Queueing(ThreadPoolExecutor):
+
+    def submit(self, fn, *args, **kwargs):
+        self.queued = super().submit(fn, *args, **kwargs)
+        return self.queued
+
+
+def flaky(failures: int):
+    remaining = [failures]
+
+    def instruction():
+        if remaining[0]:
+            remaining[0] -= 1
+            raise RuntimeError('flaked.')
+        return 'recovered.'
+    return instruction
+
+
+def slow_then_fast(delay: float):
+    calls = []
+
+    def instruction():
+        calls.append(1)
+        if len(calls) == 1:
+            sleep(delay)
+            return 'slow.'
+        return 'fast.'
+    return instruction
+
+
 class RetryPolicyTest(TestCase):
 
     def setUp(self):
@@ -259,3 +316,318 @@ class RetryPolicyTest(TestCase):
 
         self.assertTrue(pickleable(self.action))
         self.assertEqual(unpickled.__dict__, self.action.__dict__)
+
+    def test_can_enact_RetryPolicy_asynchronously(self):
+        action = RetryPolicy(
+            FakeAction(instruction_provider=flaky(2)),
+            max_retries=2,
+            delay_between_attempts=0.2,
+            jitter_percentage=0
+        )
+        result = asyncio.run(action.perform_async())
+
+        self.assertTrue(result.successful)
+        self.assertEqual(result.value, 'recovered.')
+        self.assertEqual(action.retries, 2)
+
+    def test_asynchronous_RetryPolicy_waits_do_not_block_event_loop(self):
+        actions = [
+            RetryPolicy(
+                FakeAction(instruction_provider=flaky(1)),
+                max_retries=1,
+                delay_between_attempts=0.3,
+                jitter_percentage=0
+            ) for _ in range(10)
+        ]
+
+        async def perform_all():
+            return await asyncio.gather(*(action.perform_async() for action in actions))
+
+        start = time()
+        results = asyncio.run(perform_all())
+        self.assertLess(time() - start, 1.5)
+        self.assertTrue(all(result.successful for result in results))
+
+    def test_submitted_RetryPolicy_releases_worker_while_waiting(self):
+        scheduler = TimerScheduler()
+        actions = [
+            RetryPolicy(
+                FakeAction(instruction_provider=flaky(1)),
+                max_retries=1,
+                delay_between_attempts=0.3,
+                jitter_percentage=0
+            ) for _ in range(4)
+        ]
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            start = time()
+            futures = [action.submit(executor, scheduler=scheduler) for action in actions]
+            results = [future.result() for future in futures]
+        scheduler.shutdown()
+
+        self.assertLess(time() - start, 0.9)
+        self.assertTrue(all(result.successful for result in results))
+        self.assertEqual([result.value for result in results], ['recovered.'] * 4)
+
+    def test_submitted_RetryPolicy_can_expire(self):
+        action = RetryPolicy(FakeAction(instruction_provider=flaky(3)), max_retries=1)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            result = action.submit(executor).result()
+            self.assertIsInstance(result.value, RetryPolicy.Expired)
+            with self.assertRaises(RetryPolicy.Expired):
+                action.submit(executor, should_raise=True).result()
+
+    def test_submitted_RetryPolicy_settles_when_attempt_is_cancelled(self):
+        executor, release = Queueing(max_workers=1), Event()
+        executor.submit(release.wait)
+        future = RetryPolicy(FakeAction(), max_retries=1).submit(executor)
+        executor.queued.cancel()
+        release.set()
+        executor.shutdown()
+
+        result = future.result(timeout=1)
+        self.assertIsInstance(result.value, CancelledError)
+        with self.assertRaises(CancelledError):
+            RetryPolicy(FakeAction(), max_retries=1).submit(Cancelling(), should_raise=True).result(timeout=1)
+
+    def test_Procedure_schedules_retries_without_holding_workers(self):
+        actions = [
+            RetryPolicy(
+                FakeAction(instruction_provider=flaky(1)),
+                max_retries=1,
+                delay_between_attempts=0.3,
+                jitter_percentage=0
+            ) for _ in range(4)
+        ]
+        start = time()
+        results = list(Procedure(actions).execute(max_workers=1, synchronously=False))
+
+        self.assertLess(time() - start, 0.9)
+        self.assertTrue(all(result.successful for result in results))
+
+    def test_RetryPolicies_share_retry_Budget(self):
+        budget = RetryPolicy.Budget(ratio=0.5, minimum=1)
+        actions = [
+            RetryPolicy(FakeAction(instruction_provider=flaky(10)), max_retries=3, budget=budget)
+            for _ in range(4)
+        ]
+        results = [action.perform() for action in actions]
+
+        self.assertTrue(all(isinstance(result.value, RetryPolicy.Exhausted) for result in results))
+        self.assertEqual(budget.deposits, 4)
+        self.assertEqual(budget.withdrawals, 3)
+        self.assertEqual(budget.metrics['rejections'], 4)
+        self.assertEqual(sum(action.retries for action in actions), 3)
+
+    def test_retry_Budget_replenishes_over_window(self):
+        clock = [0.0]
+        budget = RetryPolicy.Budget(ratio=0, window=10, minimum=1, clock=lambda: clock[0])
+
+        self.assertTrue(budget.withdraw())
+        self.assertFalse(budget.withdraw())
+        clock[0] = 9.9
+        self.assertFalse(budget.withdraw())
+        clock[0] = 10.5
+        self.assertTrue(budget.withdraw())
+
+    def test_retry_Budget_scales_with_first_attempts(self):
+        budget = RetryPolicy.Budget(ratio=0.1, minimum=0)
+        for _ in range(20):
+            budget.deposit()
+
+        self.assertEqual(budget.balance, 2)
+        self.assertTrue(budget.withdraw())
+        self.assertTrue(budget.withdraw())
+        self.assertFalse(budget.withdraw())
+
+    def test_retry_Budget_can_be_pickled(self):
+        budget = RetryPolicy.Budget()
+        action = RetryPolicy(FakeAction(), max_retries=1, budget=budget)
+        self.assertIsNotNone(pickleable(action))
+        with self.assertRaises(ValueError):
+            RetryPolicy.Budget(window=0)
+
+    def test_can_bound_recorded_attempts(self):
+        action = RetryPolicy(
+            FakeAction(instruction_provider=flaky(9)),
+            max_retries=9,
+            should_record=True,
+            should_show_effort=True,
+            max_recorded=3
+        )
+        effort = action.perform().value
+
+        self.assertEqual(len(action.attempts), 3)
+        self.assertEqual(len(effort.attempts), 3)
+        self.assertTrue(effort.culmination.successful)
+        self.assertTrue(effort.final_attempt.successful)
+        self.assertIsInstance(effort.initial_attempt.value, RuntimeError)
+        self.assertNotIn(effort.initial_attempt, effort.attempts)
+        self.assertEqual(effort.retries, effort.attempts)
+        self.assertEqual(repr(effort), '<Effort:succeeded:retries>')
+
+        summary = effort.summary
+        self.assertEqual(summary.count, 10)
+        self.assertEqual(summary.successes, 1)
+        self.assertEqual(summary.failures, {'RuntimeError': 9})
+        self.assertEqual(summary.total_delay, 0)
+        self.assertLessEqual(summary.min_latency, summary.mean_latency)
+        self.assertLessEqual(summary.mean_latency, summary.max_latency)
+
+    def test_summary_totals_delay_between_attempts(self):
+        action = RetryPolicy(
+            FakeAction(instruction_provider=flaky(2)),
+            max_retries=2,
+            delay_between_attempts=0.1,
+            jitter_percentage=0,
+            should_record=True,
+            max_recorded=1
+        )
+        action.perform()
+
+        self.assertAlmostEqual(action.summary.total_delay, 0.2)
+        self.assertEqual([attempt.value for attempt in action.attempts], ['recovered.'])
+
+    def test_instantiation_fails_given_invalid_max_recorded(self):
+        action = RetryPolicy(FakeAction(), max_retries=1, should_record=True, max_recorded=0)
+        self.assertIsInstance(action, Action.Construct)
+
+    def test_Schedule_is_capped_by_max_delay(self):
+        schedule = RetryPolicy.Schedule('EXPONENTIAL', base=2, retries=2000, max_delay=60, jitter_percentage=0)
+
+        self.assertEqual(schedule.delays[:5], (2, 4, 8, 16, 32))
+        self.assertEqual(set(schedule.delays[5:]), {60})
+        self.assertEqual(len(schedule), 2000)
+
+    def test_Schedule_jitter_stays_within_bounds(self):
+        delays = RetryPolicy.Schedule('LINEAR', base=1, retries=5, max_delay=4).delays
+        for jitter, low, high in (
+            ('FULL', lambda delay: 0, lambda delay: delay),
+            ('EQUAL', lambda delay: delay / 2, lambda delay: delay),
+            ('PERCENTAGE', lambda delay: delay - 0.1, lambda delay: min(delay + 0.1, 4)),
+        ):
+            schedule = RetryPolicy.Schedule('LINEAR', base=1, retries=5, max_delay=4, jitter=jitter, jitter_percentage=10)
+            for sample in schedule.sample(100):
+                for delay, jittered in zip(delays, sample):
+                    self.assertGreaterEqual(jittered, low(delay))
+                    self.assertLessEqual(jittered, high(delay))
+
+    def test_Schedule_can_decorrelate_jitter(self):
+        schedule = RetryPolicy.Schedule('CONSTANT', base=1, retries=10, max_delay=5, jitter='DECORRELATED')
+        samples = schedule.sample(50)
+
+        self.assertEqual(len(samples), 50)
+        for sample in samples:
+            previous = 1
+            for delay in sample:
+                self.assertGreaterEqual(delay, 1)
+                self.assertLessEqual(delay, min(3 * previous, 5))
+                previous = delay
+
+    def test_identical_RetryPolicies_share_Schedule(self):
+        policies = [RetryPolicy(FakeAction(), max_retries=3, delay_between_attempts=1, backoff='LINEAR') for _ in range(3)]
+        other = RetryPolicy(FakeAction(), max_retries=3, delay_between_attempts=2, backoff='LINEAR')
+
+        self.assertIs(policies[0].schedule, policies[1].schedule)
+        self.assertIsNot(policies[0].schedule, other.schedule)
+        with self.assertRaises(ValueError):
+            RetryPolicy.Schedule(jitter='SOMETIMES')
+
+    def test_RetryPolicy_skips_retries_past_deadline(self):
+        action = RetryPolicy(
+            FakeAction(instruction_provider=flaky(10)),
+            max_retries=10,
+            delay_between_attempts=0.3,
+            jitter_percentage=0,
+            deadline=0.5
+        )
+        start = time()
+        result = action.perform()
+
+        self.assertLess(time() - start, 0.5)
+        self.assertIsInstance(result.value, RetryPolicy.DeadlineExceeded)
+        self.assertEqual(action.retries, 1)
+
+    def test_asynchronous_RetryPolicy_abandons_attempt_at_deadline(self):
+        action = RetryPolicy(FakeAsyncAction(delay=5), max_retries=3, deadline=0.2)
+        start = time()
+        result = asyncio.run(action.perform_async())
+
+        self.assertLess(time() - start, 1)
+        self.assertIsInstance(result.value, RetryPolicy.DeadlineExceeded)
+
+    def test_RetryPolicy_can_hedge_slow_attempts(self):
+        hedge = RetryPolicy.Hedge(after=0.1)
+        action = RetryPolicy(IdempotentAction(instruction_provider=slow_then_fast(1)), max_retries=0, hedge=hedge)
+        start = time()
+        result = action.perform()
+
+        self.assertLess(time() - start, 0.5)
+        self.assertEqual(result.value, 'fast.')
+        self.assertEqual(hedge.metrics['hedges'], 1)
+        self.assertEqual(hedge.metrics['hedge_wins'], 1)
+
+    def test_asynchronous_RetryPolicy_can_hedge_slow_attempts(self):
+        hedge = RetryPolicy.Hedge(after=0.1)
+        action = RetryPolicy(IdempotentAction(instruction_provider=slow_then_fast(1)), max_retries=0, hedge=hedge)
+
+        async def timed():
+            start = time()
+            result = await action.perform_async()
+            return result, time() - start
+
+        result, elapsed = asyncio.run(timed())
+        self.assertLess(elapsed, 0.5)
+        self.assertEqual(result.value, 'fast.')
+        self.assertEqual(hedge.hedges, 1)
+
+    def test_Hedge_only_hedges_idempotent_attempts(self):
+        hedge = RetryPolicy.Hedge(after=0.1)
+        unsafe = RetryPolicy(FakeAction(instruction_provider=slow_then_fast(0.3)), max_retries=0, hedge=hedge)
+
+        self.assertEqual(unsafe.perform().value, 'slow.')
+        self.assertEqual(hedge.metrics['attempts'], 1)
+        self.assertEqual(hedge.metrics['hedges'], 0)
+        self.assertTrue(MakeRequest('GET', 'http://localhost').idempotent)
+        self.assertFalse(MakeRequest('POST', 'http://localhost').idempotent)
+
+    def test_Hedge_performs_fresh_instance_from_factory(self):
+        built = []
+
+        def factory(action):
+            built.append(FakeAction(instruction_provider=action.instruction_provider))
+            return built[-1]
+
+        hedge = RetryPolicy.Hedge(after=0.1, factory=factory)
+        action = FakeAction(instruction_provider=slow_then_fast(1))
+        result = RetryPolicy(action, max_retries=0, hedge=hedge).perform()
+
+        self.assertEqual(result.value, 'fast.')
+        self.assertEqual(len(built), 1)
+        self.assertIsNot(built[0], action)
+
+    def test_Hedge_releases_locks_while_awaiting_attempts_that_perform_locked_Actions(self):
+        def breaker(action):
+            return CircuitBreaker(FakeAction(instruction_provider=action.action.instruction_provider), key='hedged')
+
+        hedge = RetryPolicy.Hedge(after=0.01, factory=breaker)
+        primary = CircuitBreaker(FakeAction(instruction_provider=slow_then_fast(0.3)), key='hedged')
+        action = RetryPolicy(primary, max_retries=0, hedge=hedge)
+        results = []
+        performing = Thread(target=lambda: results.append(action.perform()), daemon=True)
+        performing.start()
+        performing.join(5)
+
+        self.assertFalse(performing.is_alive())
+        self.assertTrue(results[0].successful)
+        self.assertEqual(hedge.metrics['hedges'], 1)
+
+    def test_Hedge_threshold_follows_latency_percentile(self):
+        hedge = RetryPolicy.Hedge(percentile=90, minimum_samples=10, after=5)
+        self.assertEqual(hedge.threshold, 5)
+
+        for millis in range(1, 11):
+            hedge.observe(Result(Right(None), duration=millis * 1_000_000))
+        self.assertAlmostEqual(hedge.threshold, 0.009)
+        self.assertIsNotNone(pickleable(hedge))
+        with self.assertRaises(ValueError):
+            RetryPolicy.Hedge(percentile=0)
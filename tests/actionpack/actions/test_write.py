@@ -41,6 +41,40 @@ class WriteTest(TestCase):
         self.assertIsInstance(result, Result)
         self.assertEqual(result.value, self.absfilepath)
 
+    @patch('pathlib.Path.open')
+    def test_can_Write_chunks(self, mock_output):
+        file = FakeFile(self.salutation)
+        mock_output.return_value = file
+        chunks = iter([self.salutation, self.question])
+        result = Write(self.absfilepath, chunks, prefix='> ').perform(should_raise=True)
+
+        self.assertEqual(file.read(), self.salutation + '> ' + self.salutation + self.question)
+        self.assertEqual(result.value, self.absfilepath)
+        mock_output.assert_called_once_with('w')
+
+    @patch('pathlib.Path.open')
+    def test_can_append_byte_chunks(self, mock_output):
+        file = FakeFile(self.salutation.encode())
+        mock_output.return_value = file
+        chunks = (chunk.encode() for chunk in self.question)
+        Write(self.absfilepath, chunks, append=True).perform(should_raise=True)
+
+        self.assertEqual(file.read(), f'{self.salutation}{self.question}\n'.encode())
+        mock_output.assert_called_once_with('ab')
+
+    def test_cannot_Write_chunks_with_mismatched_prefix(self):
+        result = Write(self.absfilepath, iter([b'bytes']), prefix='str').perform()
+        self.assertIsInstance(result.value, TypeError)
+        result = Write(self.absfilepath, iter([1, 2, 3])).perform()
+        self.assertIsInstance(result.value, TypeError)
+
+    def test_can_Write_chunks_to_STDOUT(self):
+        buffer = StringIO()
+        with redirect_stdout(buffer):
+            Write(Write.STDOUT, iter([self.salutation, self.question])).perform(should_raise=True)
+
+        self.assertEqual(buffer.getvalue(), self.salutation + self.question)
+
     def test_can_Write_to_STDOUT(self):
         buffer = StringIO()
         with redirect_stdout(buffer):
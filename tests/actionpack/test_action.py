@@ -1,17 +1,24 @@
+import asyncio
+import json
 import pickle
 
 from functools import reduce
 from oslash import Left
 from oslash import Right
 from threading import Thread
+from time import sleep
+from time import time
 from unittest import TestCase
 from unittest.mock import patch
 
 from actionpack import Action
+from actionpack import Procedure
 from actionpack import partialaction
 from actionpack.action import Result
+from actionpack.action import ResultBatch
 from actionpack.utils import pickleable
 from tests.actionpack import FakeAction
+from tests.actionpack import FakeAsyncAction
 from tests.actionpack import FakeFile
 from tests.actionpack.actions import FakeWrite
 
@@ -150,6 +157,88 @@ class ActionTest(TestCase):
             initial_file_contents + action1.to_write + action2.to_write
         )
 
+    def test_can_perform_independent_Actions_concurrently_with_striped_locking(self):
+        class StripedWrite(FakeWrite, locking='STRIPED'):
+            pass
+
+        def perform_all(actions):
+            threads = [Thread(target=action.perform) for action in actions]
+            start = time()
+            [thread.start() for thread in threads]
+            [thread.join() for thread in threads]
+            return time() - start
+
+        delay = 0.1
+        serialized = perform_all([FakeWrite(FakeFile(), b'data', delay=delay) for _ in range(4)])
+        concurrent = perform_all([StripedWrite(FakeFile(), b'data', delay=delay) for _ in range(4)])
+
+        self.assertGreaterEqual(serialized, 4 * delay)
+        self.assertLess(concurrent, 3 * delay)
+
+    def test_can_perform_Actions_in_batch(self):
+        results = FakeAction.perform_batch([FakeAction(), FakeAction(instruction_provider=self.raise_failure)])
+        self.assertEqual([result.successful for result in results], [True, False])
+        with self.assertRaises(type(self.exception)):
+            FakeAction.perform_batch([FakeAction(instruction_provider=self.raise_failure)], should_raise=True)
+
+    def test_Action_locking_modes(self):
+        class ClassLocked(FakeAction, locking=Action.Locking.CLASS):
+            pass
+
+        class Unlocked(FakeAction, locking='NONE'):
+            pass
+
+        self.assertIs(FakeAction().acquire_lock(), Action.lock)
+        self.assertIs(ClassLocked().acquire_lock(), ClassLocked().acquire_lock())
+        self.assertIsNot(ClassLocked().acquire_lock(), Action.lock)
+        self.assertNotIsInstance(Unlocked().acquire_lock(), type(Action.lock))
+        self.assertEqual(Unlocked().perform().value, FakeAction.result)
+        with self.assertRaises(ValueError):
+            class Misconfigured(FakeAction, locking='SOMETIMES'):
+                pass
+
+    def test_can_perform_async_instruction(self):
+        result = asyncio.run(FakeAsyncAction().perform_async())
+        self.assertIsInstance(result, Result)
+        self.assertTrue(result.successful)
+        self.assertEqual(result.value, FakeAsyncAction.result)
+
+        self.assertEqual(FakeAsyncAction().perform().value, FakeAsyncAction.result)
+
+    def test_cannot_perform_async_instruction_synchronously_within_event_loop(self):
+        async def perform():
+            return FakeAsyncAction().perform()
+
+        result = asyncio.run(perform())
+        self.assertFalse(result.successful)
+        self.assertIsInstance(result.value, RuntimeError)
+        self.assertIn('perform_async', str(result.value))
+
+    def test_can_perform_sync_instruction_asynchronously(self):
+        result = asyncio.run(FakeAction().perform_async())
+        self.assertEqual(result.value, FakeAction.result)
+
+        failure = asyncio.run(FakeAction(instruction_provider=self.raise_failure).perform_async())
+        self.assertFalse(failure.successful)
+        self.assertEqual(failure.value, self.exception)
+
+    def test_async_performance_can_fail_and_raise(self):
+        result = asyncio.run(FakeAsyncAction(failure=self.exception).perform_async())
+        self.assertFalse(result.successful)
+        self.assertIs(result.value, self.exception)
+
+        with self.assertRaises(type(self.exception)):
+            asyncio.run(FakeAsyncAction(failure=self.exception).perform_async(should_raise=True))
+
+        construct = FakeAction(typecheck='Action instantiation fails.')
+        self.assertFalse(asyncio.run(construct.perform_async()).successful)
+
+    def test_can_react_during_async_performance(self):
+        vessel = []
+        reaction = FakeAction(instruction_provider=lambda: vessel.append('contents'))
+        asyncio.run(FakeAsyncAction(failure=self.exception, reaction=reaction).perform_async())
+        self.assertEqual(vessel, ['contents'])
+
     def test_Action_can_be_renamed(self):
         action = FakeAction()
         self.assertIsNone(action.name)
@@ -202,6 +291,26 @@ class ActionTest(TestCase):
         with self.assertRaises(Action.DependencyCheck.PackageMissing):
             FakeAction().check_dependencies(FakeAction)
 
+    @patch('actionpack.action.import_module')
+    def test_DependencyCheck_resolves_each_requirement_once(self, mock_import_module):
+        Action.DependencyCheck.modules.pop('json', None)
+        mock_import_module.return_value = json
+
+        class NeedsJSON(Action, requires=('json',)):
+            pass
+
+        def check():
+            NeedsJSON().check_dependencies(NeedsJSON)
+
+        threads = [Thread(target=check) for _ in range(5)]
+        [thread.start() for thread in threads]
+        [thread.join() for thread in threads]
+        Action.DependencyCheck(FakeAction, 'json')
+
+        self.assertIs(NeedsJSON.json, json)
+        self.assertIs(FakeAction.json, json)
+        self.assertEqual(mock_import_module.call_count, 1)
+
     def test_DependencyCheck_fails_if_requirement_absent(self):
         with self.assertRaises(Action.DependencyCheck.WhichPackage):
             Action.DependencyCheck(FakeAction)
@@ -230,6 +339,24 @@ class ResultTest(TestCase):
         self.assertTrue(result.successful)
         self.assertEqual(result.produced_at, 0)
 
+    def test_Result_measures_performance(self):
+        delay = 0.05
+        result = FakeAction(instruction_provider=lambda: sleep(delay)).perform()
+
+        self.assertGreaterEqual(result.duration, delay * 1e9)
+        self.assertGreaterEqual(result.produced_at - result.started_at, delay * 1e6 - 1e3)
+        with self.assertRaises(AttributeError):
+            result.duration = 0
+        with self.assertRaises(AttributeError):
+            result.started_at = 0
+
+        async_result = asyncio.run(FakeAsyncAction(delay=delay).perform_async())
+        self.assertGreaterEqual(async_result.duration, delay * 1e9)
+
+        unperformed = Result(Right('correct.'))
+        self.assertIsNone(unperformed.started_at)
+        self.assertIsNone(unperformed.duration)
+
     def test_cannot_instantiate_without_Either(self):
         with self.assertRaises(Result.OutcomeMustBeOfTypeEither):
             Result('not an Either type')
@@ -243,7 +370,14 @@ class ResultTest(TestCase):
         with self.assertRaises(AttributeError):
             result.value = 'some other value'
 
-        result.who_cares = 'right?'  # should not raise since not declared immutable
+        with self.assertRaises(AttributeError):
+            result.who_cares = 'right?'  # slotted, so undeclared attributes cannot be added
+
+    def test_Result_is_slotted(self):
+        result = Result(Right('correct.'))
+        self.assertFalse(hasattr(result, '__dict__'))
+        self.assertEqual(set(Result.__slots__), set(Result._immutables))
+        self.assertEqual(pickle.loads(pickle.dumps(result)).value, 'correct.')
 
     def test_cannot_delete_immutable_attributes(self):
         result = Result(Right('correct.'))
@@ -254,8 +388,8 @@ class ResultTest(TestCase):
         with self.assertRaises(AttributeError):
             del result.value
 
-        result.who_cares = 'right?'
-        del result.who_cares  # should not raise since not declared immutable
+        with self.assertRaises(AttributeError):
+            del result.who_cares  # slotted, so there is nothing undeclared to delete
 
     def test_can_serialize_result(self):
         successful_outcome = 'correct.'
@@ -268,3 +402,49 @@ class ResultTest(TestCase):
 
         confused_result = Result(Left(successful_outcome))
         self.assertFalse(confused_result.successful)
+
+
+class ResultBatchTest(TestCase):
+
+    def setUp(self):
+        self.results = [
+            Result(Right(n), lambda: 0, started_at=0, duration=n * 10)
+            for n in range(1, 11)
+        ] + [Result(Left(RuntimeError('nope.')))]
+        self.batch = ResultBatch(self.results)
+
+    def test_ResultBatch_aggregates_outcomes(self):
+        self.assertEqual(len(self.batch), 11)
+        self.assertEqual(self.batch.successful, 10)
+        self.assertEqual(self.batch.failed, 1)
+        self.assertAlmostEqual(self.batch.success_rate, 10 / 11)
+        self.assertEqual(ResultBatch().success_rate, 0.0)
+
+    def test_ResultBatch_computes_latency_percentiles(self):
+        self.assertEqual(self.batch.latency_percentile(50), 50)
+        self.assertEqual(self.batch.latency_percentile(99), 100)
+        self.assertEqual(self.batch.latency_percentile(0), 10)
+        self.assertIsNone(ResultBatch([Result(Right(None))]).latency_percentile(50))
+        with self.assertRaises(ValueError):
+            self.batch.latency_percentile(101)
+
+    def test_ResultBatch_can_rebuild_Results(self):
+        rebuilt = list(self.batch)
+        self.assertEqual([result.value for result in rebuilt[:10]], list(range(1, 11)))
+        self.assertTrue(rebuilt[0].successful)
+        self.assertEqual(rebuilt[0].duration, 10)
+        self.assertFalse(rebuilt[-1].successful)
+        self.assertIsNone(rebuilt[-1].duration)
+        self.assertIsInstance(rebuilt[-1].value, RuntimeError)
+
+    def test_ResultBatch_can_discard_values(self):
+        batch = ResultBatch(self.results, keep_values=False)
+        self.assertFalse(batch.values)
+        self.assertEqual(batch.successful, 10)
+        with self.assertRaises(IndexError):
+            batch[0]
+
+    def test_ResultBatch_collects_Procedure_results(self):
+        batch = ResultBatch(Procedure([FakeAction()] * 3).execute())
+        self.assertEqual(batch.success_rate, 1.0)
+        self.assertEqual(len(batch.measured_durations()), 3)
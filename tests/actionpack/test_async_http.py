@@ -0,0 +1,135 @@
+import asyncio
+
+from time import time
+from unittest import TestCase
+from unittest.mock import patch
+
+from requests import Request
+from requests import Response
+
+from actionpack import Procedure
+from actionpack.action import Result
+from actionpack.actions import MakeRequest
+from actionpack.async_http import AsyncEngine
+from tests.actionpack import FakeAction
+from tests.actionpack.actions import LocalServer
+
+
+class AsyncEngineTest(TestCase):
+
+    def test_can_send_requests_over_reused_connections(self):
+        async def send_all(url: str):
+            async with AsyncEngine(limit_per_host=1) as engine:
+                responses = [await engine.send(Request('GET', f'{url}/{n}').prepare()) for n in range(3)]
+                return responses, engine.metrics
+
+        with LocalServer() as server:
+            responses, metrics = asyncio.run(send_all(server.url))
+
+        self.assertTrue(all(isinstance(response, Response) for response in responses))
+        self.assertEqual([response.content for response in responses], [b'sup'] * 3)
+        self.assertEqual(responses[0].status_code, 200)
+        self.assertEqual(server.connections, 1)
+        self.assertEqual(metrics['reused'], 2)
+
+    def test_can_read_chunked_responses(self):
+        async def send(url: str):
+            async with AsyncEngine() as engine:
+                return await engine.send(Request('POST', url, data=b'echo').prepare())
+
+        with LocalServer(chunked=True) as server:
+            response = asyncio.run(send(server.url))
+
+        self.assertEqual(response.content, b'echo')
+
+    def test_resends_only_idempotent_requests_over_stale_connections(self):
+        received = []
+
+        async def respond_once(reader, writer):
+            await reader.readuntil(b'\r\n\r\n')
+            received.append(1)
+            writer.write(b'HTTP/1.1 200 OK\r\nContent-Length: 3\r\n\r\nsup')
+            await writer.drain()
+            try:
+                await reader.readuntil(b'\r\n\r\n')
+            except asyncio.IncompleteReadError:  # the client closed the connection instead of reusing it
+                return writer.close()
+            received.append(1)
+            writer.close()  # closes as the next request arrives, as a server timing out an idle connection would
+
+        async def send(method: str):
+            server = await asyncio.start_server(respond_once, '127.0.0.1', 0)
+            url = f'http://127.0.0.1:{server.sockets[0].getsockname()[1]}/'
+            try:
+                async with AsyncEngine(limit_per_host=1) as engine:
+                    await engine.send(Request('GET', url).prepare())
+                    return await engine.send(Request(method, url).prepare())
+            finally:
+                server.close()
+
+        self.assertEqual(asyncio.run(send('GET')).content, b'sup')
+        self.assertEqual(len(received), 3)
+        received.clear()
+        with self.assertRaises(ConnectionError):
+            asyncio.run(send('POST'))
+        self.assertEqual(len(received), 2)
+
+    def test_timeout_bounds_opening_connections(self):
+        async def never_connect(*args, **kwargs):
+            await asyncio.sleep(10)
+
+        async def send():
+            async with AsyncEngine(timeout=0.1) as engine:
+                return await engine.send(Request('GET', 'http://localhost/').prepare())
+
+        start = time()
+        with patch('asyncio.open_connection', never_connect):
+            with self.assertRaises(asyncio.TimeoutError):
+                asyncio.run(send())
+        self.assertLess(time() - start, 1)
+
+    def test_instantiation_fails_with_invalid_limit(self):
+        with self.assertRaises(ValueError):
+            AsyncEngine(limit_per_host=0)
+
+
+class MakeRequestBatchTest(TestCase):
+
+    def test_can_perform_batch_of_MakeRequests_on_one_event_loop(self):
+        with LocalServer(delay=0.2) as server:
+            actions = [MakeRequest('GET', f'{server.url}/{n}') for n in range(8)]
+            start = time()
+            results = asyncio.run(MakeRequest.perform_batch_async(actions, limit_per_host=4))
+            elapsed = time() - start
+
+        self.assertTrue(all(isinstance(result, Result) and result.successful for result in results))
+        self.assertEqual([result.value.content for result in results], [b'sup'] * 8)
+        self.assertLessEqual(server.peak, 4)
+        self.assertLessEqual(server.connections, 4)
+        self.assertGreaterEqual(elapsed, 0.4)
+        self.assertLess(elapsed, 1.2)
+
+    def test_batch_reports_failures_per_action(self):
+        with LocalServer() as closed:
+            unreachable = closed.url
+        with LocalServer() as server:
+            actions = [MakeRequest('GET', server.url), MakeRequest('GET', unreachable), FakeAction()]
+            results = asyncio.run(MakeRequest.perform_batch_async(actions))
+
+        self.assertTrue(results[0].successful)
+        self.assertIsInstance(results[1].value, OSError)
+        self.assertEqual(results[2].value, FakeAction.result)
+
+    def test_Procedure_can_use_engine(self):
+        async def execute(url: str):
+            async with AsyncEngine(limit_per_host=2) as engine:
+                MakeRequest.engine.set(engine)
+                actions = [MakeRequest('GET', url) for _ in range(6)]
+                return [result async for result in Procedure(actions).execute_async()], engine.metrics
+
+        with LocalServer() as server:
+            results, metrics = asyncio.run(execute(server.url))
+
+        self.assertTrue(all(result.successful for result in results))
+        self.assertEqual(metrics['requests'], 6)
+        self.assertLessEqual(server.connections, 2)
@@ -0,0 +1,104 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from actionpack.cache import Cache
+from actionpack.cache import fingerprint
+from actionpack.utils import pickleable
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class CacheTest(TestCase):
+
+    def test_can_get_and_set(self):
+        cache = Cache()
+        self.assertIsNone(cache.get('key'))
+        self.assertEqual(cache.set('key', 'value'), 'value')
+        self.assertEqual(cache.get('key'), 'value')
+        self.assertIn('key', cache)
+        self.assertEqual(cache.stats['hits'], 2)
+        self.assertEqual(cache.stats['misses'], 1)
+
+    def test_evicts_least_recently_used(self):
+        cache = Cache(maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+
+        self.assertEqual(len(cache), 2)
+        self.assertIs(cache.get('b', Cache.missing), Cache.missing)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.stats['evictions'], 1)
+
+    def test_entries_expire(self):
+        clock = FakeClock()
+        cache = Cache(ttl=10, clock=clock)
+        cache.set('short', 1, ttl=1)
+        cache.set('long', 2)
+
+        clock.now = 5
+        self.assertNotIn('short', cache)
+        self.assertEqual(cache.get('long'), 2)
+        clock.now = 10
+        self.assertNotIn('long', cache)
+
+    def test_can_persist_entries_to_disk(self):
+        with TemporaryDirectory() as directory:
+            Cache(directory=directory).set('key', {'value': 1})
+            cache = Cache(directory=directory)
+            self.assertEqual(cache.get('key'), {'value': 1})
+
+            cache.delete('key')
+            self.assertNotIn('key', Cache(directory=directory))
+
+    def test_bounds_entries_on_disk(self):
+        with TemporaryDirectory() as directory:
+            cache = Cache(maxsize=2, directory=directory)
+            cache.set('a', 1)
+            cache.set('b', 2)
+            cache.get('a')
+            cache.set('c', 3)
+
+            self.assertEqual(sorted(path.stem for path in Path(directory).glob('*.cache')), ['a', 'c'])
+            for key in 'defg':
+                Cache(maxsize=2, directory=directory).set(key, key)
+            self.assertEqual(len(list(Path(directory).glob('*.cache'))), 2)
+
+    def test_removes_expired_entries_from_disk(self):
+        clock = FakeClock()
+        with TemporaryDirectory() as directory:
+            cache = Cache(ttl=10, directory=directory, clock=clock)
+            cache.set('short', 1, ttl=1)
+            cache.set('long', 2)
+
+            clock.now = 5
+            self.assertEqual(cache.purge(), 1)
+            self.assertEqual([path.stem for path in Path(directory).glob('*.cache')], ['long'])
+            clock.now = 10
+            Cache(directory=directory, clock=clock)
+            self.assertEqual(list(Path(directory).glob('*.cache')), [])
+
+    def test_instantiation_fails_with_invalid_bounds(self):
+        with self.assertRaises(ValueError):
+            Cache(maxsize=0)
+        with self.assertRaises(ValueError):
+            Cache(ttl=0)
+
+    def test_Cache_can_be_pickled(self):
+        cache = Cache()
+        cache.set('key', 'value')
+        self.assertIsNotNone(pickleable(cache))
+
+    def test_fingerprint(self):
+        self.assertEqual(fingerprint(('type', {'value': 1})), fingerprint(('type', {'value': 1})))
+        self.assertNotEqual(fingerprint(('type', {'value': 1})), fingerprint(('type', {'value': 2})))
+        self.assertIsNone(fingerprint(lambda: None))
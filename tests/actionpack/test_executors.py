@@ -0,0 +1,124 @@
+from threading import Event
+from time import monotonic
+from unittest import TestCase
+
+from actionpack.executors import ExecutorRegistry
+from actionpack.executors import InstrumentedProcessPoolExecutor
+from actionpack.executors import InstrumentedThreadPoolExecutor
+from actionpack.executors import TimerScheduler
+
+
+class ExecutorRegistryTest(TestCase):
+
+    def setUp(self):
+        self.registry = ExecutorRegistry()
+
+    def tearDown(self):
+        self.registry.shutdown()
+
+    def test_reuses_executor_per_size(self):
+        executor = self.registry.get(max_workers=2)
+        self.assertIs(self.registry.get(max_workers=2), executor)
+        self.assertIsNot(self.registry.get(max_workers=3), executor)
+        self.assertEqual(len(self.registry), 2)
+
+    def test_keeps_process_pools_apart_from_thread_pools(self):
+        executor = self.registry.get(max_workers=1, processes=True)
+        self.assertIsInstance(executor, InstrumentedProcessPoolExecutor)
+        self.assertIs(self.registry.get(max_workers=1, processes=True), executor)
+        self.assertIsInstance(self.registry.get(max_workers=1), InstrumentedThreadPoolExecutor)
+        self.assertEqual(executor.submit(abs, -1).result(), 1)
+        self.assertEqual(self.registry.metrics['process-1']['submitted'], 1)
+
+    def test_replaces_executor_after_shutdown(self):
+        executor = self.registry.get(max_workers=2)
+        self.registry.shutdown()
+        self.assertTrue(executor.is_shutdown)
+        self.assertEqual(len(self.registry), 0)
+        self.assertIsNot(self.registry.get(max_workers=2), executor)
+
+    def test_rejects_invalid_size(self):
+        with self.assertRaises(ValueError):
+            self.registry.get(max_workers=0)
+
+    def test_keeps_named_pools_apart(self):
+        executor = self.registry.get(max_workers=2, name='parallel')
+        self.assertIs(self.registry.get(max_workers=2, name='parallel'), executor)
+        self.assertIsNot(self.registry.get(max_workers=2), executor)
+        self.assertIn('parallel-thread-2', self.registry.metrics)
+
+    def test_reports_metrics(self):
+        self.registry.get(max_workers=1).submit(int).result()
+        self.assertEqual(self.registry.metrics['thread-1']['completed'], 1)
+
+
+class InstrumentedThreadPoolExecutorTest(TestCase):
+
+    def test_tracks_activity(self):
+        started, release = Event(), Event()
+
+        def block():
+            started.set()
+            release.wait()
+
+        with InstrumentedThreadPoolExecutor(max_workers=1) as executor:
+            running = executor.submit(block)
+            started.wait()
+            queued = executor.submit(int)
+            self.assertEqual(executor.active, 1)
+            self.assertEqual(executor.queue_depth, 1)
+            self.assertEqual(executor.utilization, 1.0)
+            release.set()
+            running.result(), queued.result()
+
+        self.assertEqual(executor.metrics['submitted'], 2)
+        self.assertEqual(executor.metrics['completed'], 2)
+        self.assertEqual(executor.metrics['active'], 0)
+        self.assertEqual(executor.metrics['utilization'], 0.0)
+
+
+class TimerSchedulerTest(TestCase):
+
+    def setUp(self):
+        self.scheduler = TimerScheduler()
+
+    def tearDown(self):
+        self.scheduler.shutdown()
+
+    def test_fires_timers_in_order_of_expiry(self):
+        fired, done = [], Event()
+        start = monotonic()
+        self.scheduler.call_later(0.2, fired.append, 'later')
+        self.scheduler.call_later(0.1, fired.append, 'sooner')
+        self.scheduler.call_later(0.3, done.set)
+
+        self.assertTrue(done.wait(2))
+        self.assertEqual(fired, ['sooner', 'later'])
+        self.assertGreaterEqual(monotonic() - start, 0.3)
+        self.assertEqual(self.scheduler.metrics['fired'], 3)
+
+    def test_cancelled_timers_do_not_fire(self):
+        fired, done = [], Event()
+        timer = self.scheduler.call_later(0.05, fired.append, 'cancelled')
+        self.scheduler.call_later(0.1, done.set)
+        timer.cancel()
+
+        self.assertTrue(done.wait(2))
+        self.assertEqual(fired, [])
+        self.assertEqual(len(self.scheduler), 0)
+
+    def test_reports_failed_callbacks(self):
+        done = Event()
+        with self.assertLogs('actionpack.executors', level='ERROR') as logs:
+            self.scheduler.call_later(0, lambda: 1 / 0)
+            self.scheduler.call_later(0.05, done.set)
+            self.assertTrue(done.wait(2))
+
+        self.assertIn('ZeroDivisionError', logs.output[0])
+        self.assertEqual(self.scheduler.metrics['failed'], 1)
+        self.assertEqual(self.scheduler.metrics['fired'], 2)
+
+    def test_cannot_schedule_after_shutdown(self):
+        self.scheduler.shutdown()
+        with self.assertRaises(RuntimeError):
+            self.scheduler.call_later(0, int)
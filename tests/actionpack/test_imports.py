@@ -0,0 +1,50 @@
+import sys
+
+from subprocess import PIPE
+from subprocess import run
+from unittest import TestCase
+
+import actionpack
+import actionpack.actions
+
+
+def modules_loaded_by(statement: str) -> set:
+    probe = f'{statement}; import sys; print(",".join(sys.modules))'
+    result = run([sys.executable, '-c', probe], stdout=PIPE, stderr=PIPE, check=True)
+    return set(result.stdout.decode().strip().split(','))
+
+
+class LazyImportTest(TestCase):
+
+    def test_importing_actionpack_defers_submodules(self):
+        loaded = modules_loaded_by('import actionpack')
+        self.assertNotIn('actionpack.action', loaded)
+        self.assertNotIn('actionpack.procedure', loaded)
+        self.assertNotIn('oslash', loaded)
+
+    def test_importing_an_Action_defers_other_Actions_and_heavy_dependencies(self):
+        loaded = modules_loaded_by('from actionpack.actions import Read')
+        self.assertIn('actionpack.actions.read', loaded)
+        for module in (
+            'actionpack.actions.make_request',
+            'actionpack.procedure',
+            'asyncio',
+            'concurrent.futures',
+            'inspect',
+            'pickle',
+            'subprocess',
+            'validators',
+        ):
+            self.assertNotIn(module, loaded)
+
+    def test_lazy_attributes_resolve(self):
+        for package in (actionpack, actionpack.actions):
+            for name in package.__all__:
+                self.assertIs(getattr(package, name), getattr(package, name))
+                self.assertIn(name, dir(package))
+
+    def test_unknown_attributes_raise(self):
+        with self.assertRaises(AttributeError):
+            actionpack.NotAnAction
+        with self.assertRaises(ImportError):
+            from actionpack.actions import NotAnAction  # noqa: F401
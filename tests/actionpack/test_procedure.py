@@ -1,11 +1,24 @@
+import asyncio
+import gc
+
 from collections.abc import Iterable
 from textwrap import dedent
+from threading import Thread
+from time import time
 from unittest import TestCase
+from weakref import ref
 
+from actionpack import Action
 from actionpack import KeyedProcedure
 from actionpack import Procedure
 from actionpack.action import Result
+from actionpack.actions import Call
+from actionpack.executors import InstrumentedProcessPoolExecutor
+from actionpack.executors import InstrumentedThreadPoolExecutor
+from actionpack.executors import registry
+from actionpack.utils import Closure
 from tests.actionpack import FakeAction
+from tests.actionpack import FakeAsyncAction
 from tests.actionpack import FakeFile
 from tests.actionpack.actions import FakeWrite
 
@@ -21,6 +34,16 @@ failure = FakeAction(
 )
 
 
+def square(number: int) -> int:
+    return number * number
+
+
+class Nested(Action):
+
+    def instruction(self) -> int:
+        return len(list(Procedure([FakeAction()] * 3).execute(synchronously=False)))
+
+
 def assertIsIterable(possible_collection):
     return isinstance(possible_collection, Iterable)
 
@@ -113,6 +136,169 @@ class ProcedureTest(TestCase):
         # NOTE: the wellwish precedes since the question took longer
         self.assertEqual(file.read(), wellwish + question)
 
+    def test_asynchronous_execution_reuses_shared_executor(self):
+        executor = registry.get(max_workers=3)
+        list(self.procedure.execute(max_workers=3, synchronously=False))
+        list(Procedure((success, failure)).execute(max_workers=3, synchronously=False))
+
+        self.assertIs(registry.get(max_workers=3), executor)
+        self.assertGreaterEqual(executor.completed, 4)
+
+    def test_asynchronous_execution_bounds_Actions_in_flight(self):
+        pulled = []
+
+        def actions():
+            for i in range(100):
+                pulled.append(i)
+                yield FakeAction(name=i)
+
+        results = Procedure(actions()).execute(max_workers=2, synchronously=False, max_in_flight=3)
+        next(results)
+        self.assertLessEqual(len(pulled), 4)
+        self.assertEqual(len(list(results)), 99)
+        self.assertEqual(len(pulled), 100)
+
+        with self.assertRaises(ValueError):
+            list(Procedure([success]).execute(synchronously=False, max_in_flight=-1))
+
+    def test_can_execute_nested_Procedures_asynchronously(self):
+        results = []
+        outer = Thread(
+            target=lambda: results.extend(Procedure([Nested()] * 10).execute(synchronously=False)),
+            daemon=True
+        )
+        outer.start()
+        outer.join(5)
+
+        self.assertFalse(outer.is_alive())
+        self.assertEqual([result.value for result in results], [3] * 10)
+        self.assertIn('thread-nested1-5', registry.metrics)
+
+    def test_can_execute_on_given_executor(self):
+        with InstrumentedThreadPoolExecutor(max_workers=1) as executor:
+            results = list(self.procedure.execute(synchronously=False, executor=executor))
+            keyed_results = dict(KeyedProcedure((success, failure)).execute(synchronously=False, executor=executor))
+
+        self.assertEqual(len(results), 2)
+        self.assertEqual(set(keyed_results), {'success', 'failure'})
+        self.assertEqual(executor.completed, 4)
+
+
+class ProcessProcedureTest(TestCase):
+
+    def test_can_execute_Procedure_in_processes(self):
+        actions = [Call(Closure(square, n)) for n in range(7)]
+        with InstrumentedProcessPoolExecutor(max_workers=2) as executor:
+            results = list(
+                Procedure(actions).execute(synchronously=False, executor=executor, processes=True, chunksize=3)
+            )
+            self.assertEqual(executor.submitted, 3)
+
+        self.assertTrue(all(isinstance(result, Result) and result.successful for result in results))
+        self.assertEqual(sorted(result.value for result in results), [n * n for n in range(7)])
+
+    def test_can_execute_KeyedProcedure_in_processes(self):
+        actions = [Call(Closure(square, n)).set(name=n) for n in range(4)]
+        results = dict(KeyedProcedure(actions).execute(max_workers=2, synchronously=False, processes=True))
+
+        self.assertEqual({name: result.value for name, result in results.items()}, {n: n * n for n in range(4)})
+
+    def test_rejects_unpickleable_Actions_before_sending_to_processes(self):
+        def local_instruction():
+            return 'cannot be pickled'
+
+        procedure = Procedure([FakeAction(instruction_provider=local_instruction)])
+        with self.assertRaises(Procedure.NotPickleable):
+            list(procedure.execute(max_workers=1, synchronously=False, processes=True))
+
+    def test_rejects_invalid_chunksize(self):
+        with self.assertRaises(ValueError):
+            list(Procedure([success]).execute(synchronously=False, chunksize=0))
+
+
+class AsyncProcedureTest(TestCase):
+
+    @staticmethod
+    def collect(results):
+        async def gather():
+            return [result async for result in results]
+        return asyncio.run(gather())
+
+    def test_can_execute_Procedure_on_event_loop(self):
+        tracker = {}
+        actions = [FakeAsyncAction(delay=0.1, tracker=tracker) for _ in range(1000)]
+        start = time()
+        results = self.collect(Procedure(actions).execute_async(max_concurrency=250))
+
+        self.assertLess(time() - start, 2)
+        self.assertEqual(len(results), 1000)
+        self.assertTrue(all(result.successful for result in results))
+        self.assertEqual(tracker['peak'], 250)
+
+    def test_can_execute_KeyedProcedure_on_event_loop(self):
+        actions = [FakeAsyncAction(name='async'), success, failure]
+        results = dict(self.collect(KeyedProcedure(actions).execute_async()))
+
+        self.assertTrue(results['async'].successful)
+        self.assertTrue(results['success'].successful)
+        self.assertFalse(results['failure'].successful)
+
+    def test_Procedure_execution_on_event_loop_can_raise(self):
+        actions = [FakeAsyncAction(failure=RuntimeError('nope.'))]
+        with self.assertRaises(RuntimeError):
+            self.collect(Procedure(actions).execute_async(should_raise=True))
+        with self.assertRaises(ValueError):
+            self.collect(Procedure(actions).execute_async(max_concurrency=0))
+
+
+class StreamingProcedureTest(TestCase):
+
+    @staticmethod
+    def actions(references: list, total: int = 10):
+        for i in range(total):
+            action = FakeAction(name=i)
+            references.append(ref(action))
+            yield action
+
+    def test_streaming_Procedure_does_not_retain_executed_Actions(self):
+        for synchronously in (True, False):
+            references = []
+            procedure = Procedure(self.actions(references), streaming=True)
+            results = list(procedure.execute(synchronously=synchronously))
+            gc.collect()
+
+            self.assertEqual(len(results), 10)
+            self.assertFalse([reference for reference in references if reference() is not None])
+
+    def test_buffered_Procedure_retains_executed_Actions(self):
+        references = []
+        procedure = Procedure(self.actions(references))
+        list(procedure.execute())
+        gc.collect()
+
+        self.assertTrue(all(reference() is not None for reference in references))
+
+    def test_streaming_Procedure_validates_during_execution(self):
+        results = Procedure(iter([success, 'wut.']), streaming=True).validate().execute()
+        self.assertIsInstance(next(results), Result)
+        with self.assertRaises(Procedure.NotAnAction):
+            next(results)
+
+        results = KeyedProcedure([success, FakeAction()], streaming=True).validate().execute()
+        self.assertEqual(next(results)[0], success.name)
+        with self.assertRaises(KeyedProcedure.UnnamedAction):
+            next(results)
+
+    def test_streaming_Procedure_executes_once(self):
+        procedure = Procedure([success, failure], streaming=True)
+        self.assertEqual(len(list(procedure.execute())), 2)
+        self.assertFalse(list(procedure.execute()))
+
+    def test_streaming_Procedure_representation_does_not_consume_Actions(self):
+        procedure = Procedure([success], streaming=True)
+        self.assertIn('stream', repr(procedure))
+        self.assertEqual(len(list(procedure.execute())), 1)
+
 
 class KeyedProcedureTest(TestCase):
 
@@ -1,11 +1,14 @@
 from datetime import datetime
+from time import sleep
 from unittest import TestCase
 
 from actionpack.utils import Closure
+from actionpack.utils import LockStripe
 from actionpack.utils import first
 from actionpack.utils import last
 from actionpack.utils import microsecond_timestamp
 from actionpack.utils import pickleable
+from actionpack.utils import prefetch
 from actionpack.utils import tally
 
 
@@ -34,6 +37,14 @@ class UtilsTest(TestCase):
         self.assertNotEqual(hash(closure), hash(extended_closure))
         self.assertNotEqual(hash(closure), hash(different_closure))
 
+    def test_LockStripe_maps_keys_to_stable_locks(self):
+        stripe = LockStripe(size=4)
+        self.assertEqual(len(stripe), 4)
+        self.assertIs(stripe['key'], stripe['key'])
+        self.assertEqual(len({id(stripe[key]) for key in range(8)}), 4)
+        with self.assertRaises(ValueError):
+            LockStripe(size=0)
+
     def test_Closure_repr_contains_params(self):
         closure = Closure(function, arg, kwarg=kwarg)
         self.assertIn(str(arg), repr(closure))
@@ -66,6 +77,41 @@ class UtilsTest(TestCase):
         epoch = datetime(1970, 1, 1, 0, 0)  # 0 seconds since Epoch
         self.assertEqual(microsecond_timestamp(lambda: epoch), 0)
 
+    def test_default_microsecond_timestamp_agrees_with_datetime_clock(self):
+        self.assertLess(abs(microsecond_timestamp() - microsecond_timestamp(datetime.utcnow)), 1e6)
+
+    def test_prefetch_preserves_order(self):
+        self.assertEqual(list(prefetch(range(100), buffersize=3)), list(range(100)))
+        self.assertEqual(list(prefetch([])), [])
+        with self.assertRaises(ValueError):
+            next(prefetch([], buffersize=0))
+
+    def test_prefetch_raises_producer_failure(self):
+        def produce():
+            yield 1
+            raise RuntimeError('nope.')
+
+        items = prefetch(produce())
+        self.assertEqual(next(items), 1)
+        with self.assertRaises(RuntimeError):
+            next(items)
+
+    def test_prefetch_reads_ahead_boundedly(self):
+        produced = []
+
+        def produce():
+            for i in range(100):
+                produced.append(i)
+                yield i
+
+        items = prefetch(produce(), buffersize=2, poll_interval=0.01)
+        self.assertEqual(next(items), 0)
+        sleep(0.1)
+        self.assertLessEqual(len(produced), 5)
+        items.close()
+        sleep(0.1)
+        self.assertLess(len(produced), 100)
+
     def test_first(self):
         letters = list('abc')
         self.assertEqual(first(letters), 'a')